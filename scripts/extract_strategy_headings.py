@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import sys
 from pathlib import Path
 
-from pypdf import PdfReader
+from paper_strategy_lab.pdf_text import iter_pages
 
 
 def main() -> int:
@@ -23,11 +24,11 @@ def main() -> int:
     dots_re = re.compile(r"\\.{2,}|\\s\\.\\s\\.")
     trail_page_re = re.compile(r"\\s\\d{1,4}\\s*$")
 
-    reader = PdfReader(str(pdf_path))
+    # Pages come from the shared page cache, so this reuses an earlier `extract-text` run.
     rows = []
-    for page_index, page in enumerate(reader.pages):
-        text = page.extract_text() or ""
-        for line in text.splitlines():
+    for page in iter_pages(pdf_path, workers=os.cpu_count() or 1):
+        page_index = page.page_index
+        for line in page.text.splitlines():
             m = heading_re.match(line)
             if not m:
                 continue
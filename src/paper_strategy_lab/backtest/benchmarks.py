@@ -0,0 +1,141 @@
+"""
+Benchmark registry and per-window memoization of benchmark results.
+
+A benchmark is a fixed-weight, daily-rebalanced basket of tickers (buy & hold for a single ticker).
+Specs pick one by id (`benchmark:` in the strategy YAML, default `bh-spy`). Within a leaderboard
+run most specs share the same date window, so `BenchmarkCache` backtests each (benchmark, window,
+costs) combination once and hands its returns and metrics to every strategy evaluated on that
+window.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from paper_strategy_lab.backtest.metrics import compute_all_metrics
+from paper_strategy_lab.backtest.portfolio import run_portfolio_backtest
+from paper_strategy_lab.profiling import add_count, span
+from paper_strategy_lab.strategies.spec import StrategySpec
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    id: str
+    weights: tuple[tuple[str, float], ...]  # (ticker, weight), rebalanced daily
+    description: str = ""
+
+    @property
+    def tickers(self) -> list[str]:
+        return [t for t, _ in self.weights]
+
+    @property
+    def panel_key(self) -> str:
+        """
+        Key of the benchmark's price panel (date x `tickers`) in a leaderboard's panels.
+        """
+        return "bench:" + ",".join(self.tickers)
+
+
+DEFAULT_BENCHMARK = "bh-spy"
+
+_REGISTRY: dict[str, Benchmark] = {}
+
+
+def register_benchmark(benchmark: Benchmark) -> Benchmark:
+    _REGISTRY[benchmark.id] = benchmark
+    return benchmark
+
+
+def get_benchmark(benchmark_id: str) -> Benchmark:
+    try:
+        return _REGISTRY[benchmark_id]
+    except KeyError as e:
+        raise KeyError(f"Unknown benchmark {benchmark_id!r}. Known: {sorted(_REGISTRY)}") from e
+
+
+def benchmark_for(spec: StrategySpec) -> Benchmark:
+    return get_benchmark(spec.benchmark or DEFAULT_BENCHMARK)
+
+
+register_benchmark(Benchmark("bh-spy", (("SPY", 1.0),), "Buy & hold SPY (US equities)"))
+register_benchmark(Benchmark("bh-agg", (("AGG", 1.0),), "Buy & hold AGG (US aggregate bonds)"))
+register_benchmark(Benchmark("bh-efa", (("EFA", 1.0),), "Buy & hold EFA (developed ex-US)"))
+register_benchmark(
+    Benchmark("bh-60-40", (("SPY", 0.6), ("AGG", 0.4)), "60/40 SPY/AGG, rebalanced daily")
+)
+
+
+def _index_digest(index: pd.DatetimeIndex) -> str:
+    return hashlib.sha1(np.ascontiguousarray(index.asi8).tobytes()).hexdigest()
+
+
+class BenchmarkCache:
+    """
+    Benchmark daily returns and metrics memoized by (benchmark, exact date index, costs).
+    """
+
+    def __init__(self) -> None:
+        self._results: dict[tuple[object, ...], tuple[pd.Series, dict[str, float]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _result(
+        self,
+        benchmark: Benchmark,
+        prices: pd.DataFrame,
+        index: pd.DatetimeIndex,
+        fee_bps: float,
+        slippage_bps: float,
+    ) -> tuple[pd.Series, dict[str, float]]:
+        key = (benchmark, _index_digest(index), fee_bps, slippage_bps)
+        with span("benchmark.metrics", id=benchmark.id):
+            cached = self._results.get(key)
+            if cached is not None:
+                self.hits += 1
+                add_count("cache_hits")
+                return cached
+            self.misses += 1
+            add_count("cache_misses")
+
+            px = prices.reindex(index=index, columns=benchmark.tickers)
+            weights = pd.DataFrame(
+                [[w for _, w in benchmark.weights]] * len(index), index=index, columns=px.columns
+            )
+            bt = run_portfolio_backtest(
+                prices=px, weights=weights, fee_bps=fee_bps, slippage_bps=slippage_bps
+            )
+            metrics = {k: float(v[0]) for k, v in compute_all_metrics(bt.daily_returns).items()}
+        self._results[key] = (bt.daily_returns, metrics)
+        return bt.daily_returns, metrics
+
+    def metrics(
+        self,
+        benchmark: Benchmark,
+        prices: pd.DataFrame,
+        index: pd.DatetimeIndex,
+        *,
+        fee_bps: float = 0.0,
+        slippage_bps: float = 0.0,
+    ) -> dict[str, float]:
+        """
+        `compute_all_metrics` of the benchmark backtested on `index` (`prices` must cover it).
+        """
+        return self._result(benchmark, prices, index, fee_bps, slippage_bps)[1]
+
+    def daily_returns(
+        self,
+        benchmark: Benchmark,
+        prices: pd.DataFrame,
+        index: pd.DatetimeIndex,
+        *,
+        fee_bps: float = 0.0,
+        slippage_bps: float = 0.0,
+    ) -> pd.Series:
+        """
+        Daily returns of the benchmark backtested on `index` (same memo as `metrics`).
+        """
+        return self._result(benchmark, prices, index, fee_bps, slippage_bps)[0]
@@ -0,0 +1,98 @@
+"""
+Block-bootstrap confidence intervals for the leaderboard metrics.
+
+A strategy's daily returns are resampled as circular blocks of `block_days` consecutive days
+(which keeps volatility clustering and short-range autocorrelation), thousands of times. Each
+batch of resamples is one (days x samples) index matrix, gathered at once and scored with
+`compute_all_metrics`, so there is no Python loop over resamples. The benchmark's returns on the
+same dates are resampled with the same indices: `p_beat_*` is the share of resamples in which the
+strategy's metric beats the benchmark's on the identical resampled path.
+
+Every strategy uses the same seed, so strategies evaluated on the same window see the same
+resampled paths (and results do not depend on which process evaluates them).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from paper_strategy_lab.backtest.metrics import compute_all_metrics
+from paper_strategy_lab.profiling import span
+
+BOOTSTRAP_METRICS = ("sharpe", "sortino", "calmar", "maxdd")
+
+# Upper bound on resampled (day x sample) cells gathered per batch, benchmark included.
+_BATCH_CELLS = 4_000_000
+
+
+@dataclass(frozen=True)
+class BootstrapConfig:
+    samples: int = 2000
+    block_days: int = 21
+    confidence: float = 0.9  # two-sided interval, e.g. 5th..95th percentile
+    seed: int = 0
+
+
+def block_bootstrap_indices(
+    n_obs: int, n_samples: int, *, block_days: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    (n_samples x n_obs) row indices: each sample concatenates blocks of `block_days` consecutive
+    indices starting at uniform random positions, wrapping around the end (circular bootstrap).
+    """
+    if n_obs < 1 or block_days < 1:
+        raise ValueError("Expected n_obs >= 1 and block_days >= 1")
+    block_days = min(block_days, n_obs)
+    n_blocks = -(-n_obs // block_days)
+    starts = rng.integers(0, n_obs, size=(n_samples, n_blocks))
+    idx = (starts[:, :, None] + np.arange(block_days)) % n_obs
+    return idx.reshape(n_samples, n_blocks * block_days)[:, :n_obs]
+
+
+def bootstrap_metrics(
+    daily_returns: np.ndarray,
+    benchmark_returns: np.ndarray | None = None,
+    config: BootstrapConfig | None = None,
+) -> dict[str, float]:
+    """
+    Bootstrap interval bounds `<metric>_lo` / `<metric>_hi` of sharpe, sortino, calmar and maxdd,
+    plus `p_beat_<metric>` (share of resamples beating `benchmark_returns`, which must be on the
+    same dates) when a benchmark is given. Max drawdown is negative, so higher is better for all
+    four.
+    """
+    config = config or BootstrapConfig()
+    r = np.asarray(daily_returns, dtype=np.float64)
+    series = [r] if benchmark_returns is None else [r, np.asarray(benchmark_returns, np.float64)]
+    if len(series) > 1 and series[1].shape != r.shape:
+        raise ValueError("benchmark_returns must be on the same dates as daily_returns")
+    n = len(r)
+    if n < 2 or config.samples < 1:
+        return {}
+
+    rng = np.random.default_rng(config.seed)
+    per_batch = max(1, _BATCH_CELLS // (n * len(series)))
+    draws: dict[str, list[np.ndarray]] = {m: [] for m in BOOTSTRAP_METRICS}
+    beats: dict[str, int] = dict.fromkeys(BOOTSTRAP_METRICS, 0)
+    with span("bootstrap.metrics", samples=config.samples):
+        for lo in range(0, config.samples, per_batch):
+            k = min(per_batch, config.samples - lo)
+            idx = block_bootstrap_indices(n, k, block_days=config.block_days, rng=rng).T
+            # Columns [0, k) are the strategy's resamples, [k, 2k) the benchmark's.
+            m = compute_all_metrics(np.concatenate([s[idx] for s in series], axis=1))
+            for name in BOOTSTRAP_METRICS:
+                draws[name].append(m[name][:k])
+                if len(series) > 1:
+                    beats[name] += int((m[name][:k] > m[name][k:]).sum())
+
+    alpha = (1.0 - config.confidence) / 2.0
+    out: dict[str, float] = {}
+    for name in BOOTSTRAP_METRICS:
+        lo_q, hi_q = np.quantile(np.concatenate(draws[name]), [alpha, 1.0 - alpha])
+        out[f"{name}_lo"] = float(lo_q)
+        out[f"{name}_hi"] = float(hi_q)
+    if len(series) > 1:
+        for name in BOOTSTRAP_METRICS:
+            out[f"p_beat_{name}"] = beats[name] / config.samples
+    return out
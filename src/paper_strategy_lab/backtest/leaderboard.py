@@ -0,0 +1,359 @@
+"""
+Leaderboard engine: backtest every spec of a strategy file against its benchmark (buy & hold SPY
+unless the spec picks another one from `backtest.benchmarks`).
+
+Runs in two phases. `prepare_leaderboard` resolves universes and loads every distinct panel once
+(benchmark, universe prices, DAILY fields) in the calling process; `run_leaderboard` then
+evaluates the per-spec jobs either serially or in a process pool whose workers read the panels
+from shared memory. Rows come back in spec order regardless of the number of workers.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+
+import pandas as pd
+
+from paper_strategy_lab.backtest.benchmarks import (
+    DEFAULT_BENCHMARK,
+    Benchmark,
+    BenchmarkCache,
+    benchmark_for,
+    get_benchmark,
+)
+from paper_strategy_lab.backtest.bootstrap import BootstrapConfig, bootstrap_metrics
+from paper_strategy_lab.backtest.metrics import compute_all_metrics
+from paper_strategy_lab.backtest.portfolio import run_portfolio_backtest
+from paper_strategy_lab.data_sources.sharadar import (
+    load_daily_metrics,
+    load_equity_prices,
+    load_prices,
+)
+from paper_strategy_lab.feature_store import feature_store
+from paper_strategy_lab.market_data import MarketData
+from paper_strategy_lab.profiling import Profiler, SpanEvent, active_profiler, profiled
+from paper_strategy_lab.shared_panels import SharedPanelHandle, SharedPanels, attach_panels
+from paper_strategy_lab.strategies.runner import run_strategy_weights
+from paper_strategy_lab.strategies.spec import StrategySpec
+from paper_strategy_lab.universe.sharadar_universe import (
+    DynamicUniverse,
+    build_us_equities_liquid,
+    build_us_equities_liquid_pit,
+    universe_kwargs_from_config,
+)
+
+_VALUE_KINDS = {"equity_value", "equity_multifactor"}
+
+
+@dataclass(frozen=True)
+class LeaderboardConfig:
+    start: str | None
+    end: str | None
+    years: int
+    fee_bps: float = 0.0
+    slippage_bps: float = 0.0
+    feature_store: bool = False  # persist factor panels across runs (see `feature_store`)
+    bootstrap: BootstrapConfig | None = None  # add metric confidence intervals (see `bootstrap`)
+
+
+@dataclass(frozen=True)
+class LeaderboardJob:
+    """
+    One spec to evaluate. Panels are referenced by key; `features` maps a feature name to
+    (panel key, alignment) where alignment is "ffill" (DAILY fields), "mask" (universe
+    membership) or "benchmark" (benchmark prices on the strategy's dates). The strategy is
+    compared against `benchmark`, whose prices are the panel `benchmark.panel_key`.
+    """
+
+    spec: StrategySpec
+    universe_label: str
+    prices: str
+    features: dict[str, tuple[str, str]] = field(default_factory=dict)
+    benchmark: Benchmark = field(default_factory=lambda: get_benchmark(DEFAULT_BENCHMARK))
+
+
+# SPY prices: the default benchmark's panel, also fed to kinds that regress on the market.
+BENCHMARK_PANEL = get_benchmark(DEFAULT_BENCHMARK).panel_key
+
+
+@profiled("leaderboard.prepare")
+def prepare_leaderboard(
+    specs: list[StrategySpec], config: LeaderboardConfig
+) -> tuple[list[LeaderboardJob], dict[str, pd.DataFrame]]:
+    """
+    Resolve universes and load every distinct panel once; returns (jobs, panels).
+    """
+    start, end = config.start, config.end
+    benchmarks = {b.id: b for b in [get_benchmark(DEFAULT_BENCHMARK), *map(benchmark_for, specs)]}
+    panels: dict[str, pd.DataFrame] = {}
+    for b in benchmarks.values():
+        if b.panel_key not in panels:
+            panels[b.panel_key] = load_prices(b.tickers, start=start, end=end).dropna()
+
+    universe_cache: dict[tuple[object, ...], list[str]] = {}
+    dynamic_cache: dict[tuple[object, ...], tuple[str, DynamicUniverse]] = {}
+    daily_fields = sorted(
+        {str(s.params.get("value_field", "pe")) for s in specs if s.kind in _VALUE_KINDS}
+    )
+
+    def panel_key(*parts: object) -> str:
+        return repr(parts)
+
+    jobs: list[LeaderboardJob] = []
+    for s in specs:
+        tickers = s.universe
+        features: dict[str, tuple[str, str]] = {}
+        prices_key: str | None = None
+        if not tickers and s.universe_type == "sharadar_us_equities_liquid":
+            universe_kwargs = universe_kwargs_from_config(s.universe_config)
+            point_in_time = bool(s.universe_config.get("point_in_time", False))
+            universe_key = (
+                s.universe_type,
+                point_in_time,
+                *(tuple(v) if isinstance(v, list) else v for v in universe_kwargs.values()),
+            )
+            if point_in_time:
+                cached = dynamic_cache.get(universe_key)
+                if cached is None:
+                    dynamic = build_us_equities_liquid_pit(start=start, end=end, **universe_kwargs)
+                    key = panel_key("pit", *universe_key)
+                    panels[f"{key}:prices"] = dynamic.prices
+                    panels[f"{key}:mask"] = dynamic.membership
+                    cached = (key, dynamic)
+                    dynamic_cache[universe_key] = cached
+                key, dynamic = cached
+                tickers = dynamic.tickers
+                prices_key = f"{key}:prices"
+                features["universe_mask"] = (f"{key}:mask", "mask")
+            else:
+                cached_universe = universe_cache.get(universe_key)
+                if cached_universe is None:
+                    cached_universe = build_us_equities_liquid(
+                        start=start, end=end, **universe_kwargs
+                    )
+                    universe_cache[universe_key] = cached_universe
+                tickers = cached_universe
+
+        if not tickers:
+            continue
+
+        if prices_key is None:
+            equity = s.universe_type == "sharadar_us_equities_liquid"
+            prices_key = panel_key("equity_px" if equity else "px", tuple(tickers))
+            if prices_key not in panels:
+                load = load_equity_prices if equity else load_prices
+                panels[prices_key] = load(tickers, start=start, end=end)
+
+        if s.kind in _VALUE_KINDS:
+            value_field = str(s.params.get("value_field", "pe"))
+            daily_key = panel_key("daily", value_field, tuple(tickers))
+            if daily_key not in panels:
+                # One DAILY scan serves every value field used anywhere in the spec file.
+                loaded = load_daily_metrics(
+                    tickers, fields=[value_field, *daily_fields], start=start, end=end
+                )
+                for f, panel in loaded.items():
+                    panels[panel_key("daily", f, tuple(tickers))] = panel
+            features[value_field] = (daily_key, "ffill")
+        if s.kind == "equity_residual_momentum":
+            features["benchmark_spy"] = (BENCHMARK_PANEL, "benchmark")
+
+        universe_label = (
+            ",".join(s.universe) if s.universe else f"{s.universe_type}(n={len(tickers)})"
+        )
+        jobs.append(
+            LeaderboardJob(
+                spec=s,
+                universe_label=universe_label,
+                prices=prices_key,
+                features=features,
+                benchmark=benchmark_for(s),
+            )
+        )
+
+    return jobs, panels
+
+
+def job_market_data(
+    job: LeaderboardJob, panels: dict[str, pd.DataFrame], config: LeaderboardConfig
+) -> MarketData | None:
+    """
+    The job's prices and features on its evaluation window (the dates shared with its
+    benchmark); None if it has less than a year of data there.
+    """
+    px_full = panels[job.prices]
+    bench_px_full = panels[job.benchmark.panel_key]
+    if px_full.empty:
+        return None
+
+    if config.start is None:
+        n = 252 * config.years
+        if len(px_full) > n:
+            px_full = px_full.iloc[-n:]
+
+    px_full = px_full.sort_index().dropna(how="all")
+    px_full = px_full.dropna(axis=1, how="all")
+    if px_full.empty:
+        return None
+    common_index = px_full.index.intersection(bench_px_full.index)
+    if len(common_index) < 252:
+        return None
+
+    px = px_full.loc[common_index]
+
+    features: dict[str, pd.DataFrame] = {}
+    for name, (key, align) in job.features.items():
+        if align == "mask":
+            features[name] = panels[key].reindex(
+                index=px.index, columns=px.columns, fill_value=False
+            )
+        elif align == "benchmark":
+            features[name] = panels[key].reindex(px.index)
+        else:
+            features[name] = panels[key].reindex(px.index).ffill()
+    store = feature_store() if config.feature_store else None
+    return MarketData(prices=px, features=features, store=store)
+
+
+@profiled("leaderboard.job")
+def evaluate_job(
+    job: LeaderboardJob,
+    panels: dict[str, pd.DataFrame],
+    config: LeaderboardConfig,
+    *,
+    benchmarks: BenchmarkCache | None = None,
+) -> dict[str, object] | None:
+    """
+    Backtest one job against its benchmark; None if it lacks data for the window.
+
+    Pass one `benchmarks` cache across jobs to backtest each benchmark window only once.
+    """
+    s = job.spec
+    data = job_market_data(job, panels, config)
+    if data is None:
+        return None
+    px = data.prices
+
+    w = run_strategy_weights(data=data, spec=s)
+    avg_exposure = float(w.shift(1).fillna(0.0).sum(axis=1).mean())
+
+    bt = run_portfolio_backtest(
+        prices=px,
+        weights=w,
+        fee_bps=config.fee_bps,
+        slippage_bps=config.slippage_bps,
+    )
+    avg_turnover = float(bt.turnover.mean()) if len(bt.turnover) else 0.0
+
+    benchmarks = benchmarks or BenchmarkCache()
+    bench_args = (job.benchmark, panels[job.benchmark.panel_key], pd.DatetimeIndex(px.index))
+    bench_costs = {"fee_bps": config.fee_bps, "slippage_bps": config.slippage_bps}
+    bench = benchmarks.metrics(*bench_args, **bench_costs)
+    bench_sharpe, bench_sortino = bench["sharpe"], bench["sortino"]
+    bench_calmar, bench_cagr = bench["calmar"], bench["cagr"]
+    bench_vol, bench_maxdd = bench["vol"], bench["maxdd"]
+
+    m = {k: float(v[0]) for k, v in compute_all_metrics(bt.daily_returns).items()}
+    strat_sharpe, strat_sortino = m["sharpe"], m["sortino"]
+    strat_calmar, strat_cagr = m["calmar"], m["cagr"]
+    strat_vol, strat_maxdd = m["vol"], m["maxdd"]
+
+    row: dict[str, object] = {
+        "paper_section": s.paper_section or "",
+        "id": s.id,
+        "name": s.name,
+        "kind": s.kind,
+        "universe": job.universe_label,
+        "start_date": str(px.index.min())[:10],
+        "end_date": str(px.index.max())[:10],
+        "days": int(len(px)),
+        "sharpe": strat_sharpe,
+        "sortino": strat_sortino,
+        "calmar": strat_calmar,
+        "cagr": strat_cagr,
+        "vol": strat_vol,
+        "maxdd": strat_maxdd,
+        "avg_exposure": avg_exposure,
+        "avg_turnover": avg_turnover,
+        "bench_id": job.benchmark.id,
+        "bench_sharpe": bench_sharpe,
+        "bench_sortino": bench_sortino,
+        "bench_calmar": bench_calmar,
+        "bench_cagr": bench_cagr,
+        "bench_vol": bench_vol,
+        "bench_maxdd": bench_maxdd,
+        "sharpe_vs_bh": strat_sharpe - bench_sharpe,
+        "sortino_vs_bh": strat_sortino - bench_sortino,
+        "calmar_vs_bh": strat_calmar - bench_calmar,
+        "cagr_vs_bh": strat_cagr - bench_cagr,
+        "maxdd_vs_bh": strat_maxdd - bench_maxdd,
+    }
+    if config.bootstrap is not None:
+        bench_rets = benchmarks.daily_returns(*bench_args, **bench_costs)
+        row.update(
+            bootstrap_metrics(bt.daily_returns.to_numpy(), bench_rets.to_numpy(), config.bootstrap)
+        )
+    return row
+
+
+# Panels attached by each pool worker at start-up (see `_init_worker`), and the worker's
+# benchmark results, reused across the jobs it evaluates.
+_WORKER_PANELS: dict[str, pd.DataFrame] = {}
+_WORKER_BENCHMARKS = BenchmarkCache()
+
+
+def _init_worker(handles: dict[str, SharedPanelHandle]) -> None:
+    _WORKER_PANELS.update(attach_panels(handles))
+
+
+def _evaluate_in_worker(job: LeaderboardJob, config: LeaderboardConfig) -> dict[str, object] | None:
+    return evaluate_job(job, _WORKER_PANELS, config, benchmarks=_WORKER_BENCHMARKS)
+
+
+def _profile_in_worker(
+    job: LeaderboardJob, config: LeaderboardConfig
+) -> tuple[dict[str, object] | None, list[SpanEvent]]:
+    """
+    `_evaluate_in_worker` under a worker-local profiler; the spans go back to the parent.
+    """
+    with Profiler() as prof:
+        row = _evaluate_in_worker(job, config)
+    return row, prof.events
+
+
+@profiled("leaderboard.run")
+def run_leaderboard(
+    jobs: list[LeaderboardJob],
+    panels: dict[str, pd.DataFrame],
+    config: LeaderboardConfig,
+    *,
+    workers: int = 1,
+) -> list[dict[str, object]]:
+    """
+    Evaluate `jobs` and return their rows in job order (jobs without enough data are dropped).
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        benchmarks = BenchmarkCache()
+        results = [evaluate_job(job, panels, config, benchmarks=benchmarks) for job in jobs]
+    else:
+        used = {job.prices for job in jobs} | {job.benchmark.panel_key for job in jobs}
+        used |= {key for job in jobs for key, _ in job.features.values()}
+        with (
+            SharedPanels({k: v for k, v in panels.items() if k in used}) as shared,
+            ProcessPoolExecutor(
+                max_workers=min(workers, len(jobs)),
+                initializer=_init_worker,
+                initargs=(shared.handles,),
+            ) as pool,
+        ):
+            prof = active_profiler()
+            if prof is None:
+                results = list(pool.map(partial(_evaluate_in_worker, config=config), jobs))
+            else:
+                results = []
+                for row, events in pool.map(partial(_profile_in_worker, config=config), jobs):
+                    prof.merge(events)
+                    results.append(row)
+    return [r for r in results if r is not None]
@@ -0,0 +1,354 @@
+"""
+Incremental (one bar at a time) strategy state for daily paper trading.
+
+`LiveStrategy` keeps everything needed to advance a price-only strategy by one new bar in
+O(tickers): a ring buffer of recent prices with running rolling-window sums (SMAs, lookback
+returns), the backtest execution state (pending lagged weights, last prices, equity) and
+`OnlineMetrics` (Welford mean/variance, downside sum of squares, running peak equity). The state
+round-trips through a single `.npz` file, so a daily job loads it, feeds the new bars and saves it
+instead of replaying the whole history.
+
+Bar-by-bar results match `run_strategy_weights` + `run_portfolio_backtest` + `metrics` on the full
+history (up to floating-point rounding of the running sums).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import uuid
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from paper_strategy_lab.backtest.portfolio import _BacktestStream
+
+LIVE_STATE_FORMAT = 1
+
+
+@dataclass
+class OnlineMetrics:
+    """
+    Running versions of the `metrics` functions over a stream of daily returns.
+    """
+
+    periods_per_year: int = 252
+    risk_free_rate_annual: float = 0.0
+    minimum_acceptable_return_annual: float = 0.0
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0  # Welford sum of squared deviations from the mean
+    downside_sq: float = 0.0  # sum of min(0, r - MAR)^2
+    equity: float = 1.0
+    peak: float = 0.0
+    worst_drawdown: float = 0.0
+
+    def update(self, r: float) -> None:
+        if not math.isfinite(r):
+            return
+        self.n += 1
+        delta = r - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (r - self.mean)
+        mar = (1.0 + self.minimum_acceptable_return_annual) ** (1.0 / self.periods_per_year) - 1.0
+        self.downside_sq += min(0.0, r - mar) ** 2
+        self.equity *= 1.0 + r
+        self.peak = max(self.peak, self.equity)
+        if self.peak > 0:
+            self.worst_drawdown = min(self.worst_drawdown, self.equity / self.peak - 1.0)
+
+    def annualized_return(self) -> float:
+        if self.n == 0:
+            return 0.0
+        return self.equity ** (self.periods_per_year / self.n) - 1.0
+
+    def annualized_volatility(self) -> float:
+        if self.n < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.n - 1)) * self.periods_per_year**0.5
+
+    def sharpe_ratio(self) -> float:
+        if self.n < 2 or self.m2 <= 0:
+            return 0.0
+        rf = (1.0 + self.risk_free_rate_annual) ** (1.0 / self.periods_per_year) - 1.0
+        return (self.mean - rf) / math.sqrt(self.m2 / (self.n - 1)) * self.periods_per_year**0.5
+
+    def sortino_ratio(self) -> float:
+        if self.n == 0 or self.downside_sq == 0:
+            return 0.0
+        mar = (1.0 + self.minimum_acceptable_return_annual) ** (1.0 / self.periods_per_year) - 1.0
+        downside_dev = math.sqrt(self.downside_sq / self.n)
+        return (self.mean - mar) / downside_dev * self.periods_per_year**0.5
+
+    def max_drawdown(self) -> float:
+        return self.worst_drawdown
+
+    def calmar_ratio(self) -> float:
+        if self.worst_drawdown == 0:
+            return 0.0
+        return self.annualized_return() / abs(self.worst_drawdown)
+
+
+class _RollingPrices:
+    """
+    Ring buffer of the last `size` price rows with running sums for fixed SMA windows.
+
+    The running sums are re-summed from the buffer each time the ring wraps around, so rounding
+    error does not accumulate over years of updates (amortized O(tickers) per bar).
+    """
+
+    def __init__(self, n_cols: int, *, sma_windows: tuple[int, ...], lookback: int) -> None:
+        self.sma_windows = sma_windows
+        self.size = max([*sma_windows, lookback + 1, 1])
+        self.buf = np.full((self.size, n_cols), np.nan)
+        self.pos = 0  # slot of the next row
+        self.count = 0  # rows pushed so far
+        self.sums = np.zeros((len(sma_windows), n_cols))
+        self.nans = np.zeros((len(sma_windows), n_cols), dtype=np.int64)
+
+    def push(self, row: np.ndarray) -> None:
+        finite = np.where(np.isnan(row), 0.0, row)
+        for k, w in enumerate(self.sma_windows):
+            self.sums[k] += finite
+            self.nans[k] += np.isnan(row)
+            if self.count >= w:
+                old = self.buf[(self.pos - w) % self.size]
+                self.sums[k] -= np.where(np.isnan(old), 0.0, old)
+                self.nans[k] -= np.isnan(old)
+        self.buf[self.pos] = row
+        self.pos = (self.pos + 1) % self.size
+        self.count += 1
+        if self.pos == 0:
+            for k, w in enumerate(self.sma_windows):
+                last = self.buf[-min(w, self.count) :]
+                self.sums[k] = np.where(np.isnan(last), 0.0, last).sum(axis=0)
+
+    def ago(self, periods: int) -> np.ndarray:
+        """
+        Price row `periods` bars before the latest one (NaN before the history starts).
+        """
+        if periods >= self.count:
+            return np.full(self.buf.shape[1], np.nan)
+        return self.buf[(self.pos - 1 - periods) % self.size]
+
+    def sma(self, window: int) -> np.ndarray:
+        # Same semantics as `rolling(window).mean()`: NaN until a full window without NaNs.
+        k = self.sma_windows.index(window)
+        out = self.sums[k] / window
+        out[(self.nans[k] > 0) | (self.count < window)] = np.nan
+        return out
+
+    def returns(self, periods: int) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.ago(0) / self.ago(periods) - 1.0
+
+
+@dataclass(frozen=True)
+class _LiveKind:
+    # (params) -> (sma windows, return lookback); raises ValueError on invalid params.
+    requires: Callable[[Mapping[str, object]], tuple[tuple[int, ...], int]]
+    # (state, params) -> raw long/flat signal row
+    signal: Callable[[_RollingPrices, Mapping[str, object]], np.ndarray]
+
+
+def _int(params: Mapping[str, object], name: str, default: int) -> int:
+    return int(params.get(name, default))  # type: ignore[arg-type]
+
+
+def _crossover_requires(params: Mapping[str, object]) -> tuple[tuple[int, ...], int]:
+    fast, slow = _int(params, "fast", 20), _int(params, "slow", 100)
+    if fast <= 0 or slow <= 0 or fast >= slow:
+        raise ValueError("Expected 0 < fast < slow")
+    return (fast, slow), 0
+
+
+def _single_requires(params: Mapping[str, object]) -> tuple[tuple[int, ...], int]:
+    window = _int(params, "window", 200)
+    if window <= 0:
+        raise ValueError("Expected window > 0")
+    return (window,), 0
+
+
+def _three_requires(params: Mapping[str, object]) -> tuple[tuple[int, ...], int]:
+    fast, mid, slow = _int(params, "fast", 20), _int(params, "mid", 50), _int(params, "slow", 200)
+    if not (0 < fast < mid < slow):
+        raise ValueError("Expected 0 < fast < mid < slow")
+    return (fast, mid, slow), 0
+
+
+def _momentum_requires(params: Mapping[str, object]) -> tuple[tuple[int, ...], int]:
+    lookback = _int(params, "lookback_days", 252)
+    if lookback <= 0:
+        raise ValueError("Expected lookback_days > 0")
+    return (), lookback
+
+
+def _three_signal(s: _RollingPrices, p: Mapping[str, object]) -> np.ndarray:
+    f, m, sl = (s.sma(w) for w in s.sma_windows)
+    return (f > m) & (m > sl)
+
+
+_LIVE_KINDS: dict[str, _LiveKind] = {
+    "buy_and_hold": _LiveKind(lambda p: ((), 0), lambda s, p: ~np.isnan(s.ago(0))),
+    "sma_crossover": _LiveKind(
+        _crossover_requires, lambda s, p: s.sma(s.sma_windows[0]) > s.sma(s.sma_windows[1])
+    ),
+    "single_moving_average": _LiveKind(
+        _single_requires, lambda s, p: s.ago(0) > s.sma(s.sma_windows[0])
+    ),
+    "three_moving_averages": _LiveKind(_three_requires, _three_signal),
+    "time_series_momentum": _LiveKind(
+        _momentum_requires, lambda s, p: s.returns(_int(p, "lookback_days", 252)) > 0
+    ),
+}
+_LIVE_KINDS["two_moving_averages"] = _LiveKind(
+    lambda p: _crossover_requires({"fast": 50, "slow": 200, **p}),
+    lambda s, p: s.sma(s.sma_windows[0]) > s.sma(s.sma_windows[1]),
+)
+
+
+def live_kinds() -> list[str]:
+    return sorted(_LIVE_KINDS)
+
+
+@dataclass(frozen=True)
+class LiveBar:
+    date: pd.Timestamp
+    weights: pd.Series  # target weights after this bar (executed `lag_days` bars later)
+    daily_return: float
+    turnover: float
+    equity: float
+
+
+class LiveStrategy:
+    """
+    Incremental runner for the daily-rebalanced, price-only builtin kinds (see `live_kinds`).
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        params: Mapping[str, object],
+        columns: list[str],
+        *,
+        fee_bps: float = 0.0,
+        slippage_bps: float = 0.0,
+        lag_days: int = 1,
+    ) -> None:
+        try:
+            self._kind = _LIVE_KINDS[kind]
+        except KeyError as e:
+            raise KeyError(
+                f"Strategy kind={kind!r} has no incremental runner. Supported: {live_kinds()}"
+            ) from e
+        self.kind = kind
+        self.params = dict(params)
+        self.columns = list(columns)
+        self.fee_bps = fee_bps
+        self.slippage_bps = slippage_bps
+        self.lag_days = lag_days
+        windows, lookback = self._kind.requires(self.params)
+        self.prices = _RollingPrices(len(self.columns), sma_windows=windows, lookback=lookback)
+        self.stream = _BacktestStream(
+            len(self.columns), lag_days=lag_days, cost_rate=(fee_bps + slippage_bps) / 10_000.0
+        )
+        self.metrics = OnlineMetrics()
+        self.last_date: pd.Timestamp | None = None
+
+    def update(self, date: object, prices: pd.Series) -> LiveBar:
+        """
+        Advance by one bar: `prices` is that day's close per ticker (missing tickers are NaN).
+        """
+        ts = pd.Timestamp(date)  # type: ignore[arg-type]
+        if self.last_date is not None and ts <= self.last_date:
+            raise ValueError(f"Bar {ts.date()} is not after the last bar {self.last_date.date()}")
+        row = pd.Series(prices).reindex(self.columns).to_numpy(dtype=np.float64)
+        self.prices.push(row)
+
+        signal = np.asarray(self._kind.signal(self.prices, self.params), dtype=np.float64)
+        total = signal.sum()
+        target = signal / total if total != 0 else np.zeros_like(signal)
+
+        port, turnover, equity = self.stream.step(row[None, :], target[None, :])
+        self.metrics.update(float(port[0]))
+        self.last_date = ts
+        return LiveBar(
+            date=ts,
+            weights=pd.Series(target, index=self.columns),
+            daily_return=float(port[0]),
+            turnover=float(turnover[0]),
+            equity=float(equity[0]),
+        )
+
+    def run(self, prices: pd.DataFrame) -> list[LiveBar]:
+        return [self.update(date, row) for date, row in prices.iterrows()]
+
+    # -- persistence ---------------------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        """
+        Write the full state to `path` (`.npz`), atomically.
+        """
+        rp, st = self.prices, self.stream
+        n = len(self.columns)
+        meta = {
+            "format": LIVE_STATE_FORMAT,
+            "kind": self.kind,
+            "params": self.params,
+            "columns": self.columns,
+            "fee_bps": self.fee_bps,
+            "slippage_bps": self.slippage_bps,
+            "lag_days": self.lag_days,
+            "last_date": None if self.last_date is None else str(self.last_date.date()),
+            "pos": rp.pos,
+            "count": rp.count,
+            "equity": st.equity,
+            "metrics": self.metrics.__dict__,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        with tmp.open("wb") as f:
+            np.savez(
+                f,
+                meta=np.array(json.dumps(meta)),
+                buf=rp.buf,
+                sums=rp.sums,
+                nans=rp.nans,
+                pending=st.pending,
+                prev_price=np.full(n, np.nan) if st.prev_price is None else st.prev_price,
+                prev_exec=np.empty(0) if st.prev_exec is None else st.prev_exec,
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> LiveStrategy:
+        with np.load(path) as z:
+            meta = json.loads(str(z["meta"]))
+            if meta.get("format") != LIVE_STATE_FORMAT:
+                raise ValueError(f"Unsupported live state format in {path}: {meta.get('format')!r}")
+            live = cls(
+                meta["kind"],
+                meta["params"],
+                meta["columns"],
+                fee_bps=meta["fee_bps"],
+                slippage_bps=meta["slippage_bps"],
+                lag_days=meta["lag_days"],
+            )
+            live.prices.buf = z["buf"]
+            live.prices.sums = z["sums"]
+            live.prices.nans = z["nans"]
+            live.stream.pending = z["pending"]
+            if meta["count"]:
+                live.stream.prev_price = z["prev_price"]
+                live.stream.prev_exec = z["prev_exec"]
+        live.prices.pos = int(meta["pos"])
+        live.prices.count = int(meta["count"])
+        live.stream.equity = float(meta["equity"])
+        live.metrics = OnlineMetrics(**meta["metrics"])
+        if meta["last_date"] is not None:
+            live.last_date = pd.Timestamp(str(meta["last_date"]))  # type: ignore[assignment]
+        return live
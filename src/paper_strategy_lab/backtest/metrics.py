@@ -3,6 +3,8 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from paper_strategy_lab.profiling import profiled
+
 
 def max_drawdown(equity_curve: pd.Series) -> float:
     s = pd.Series(equity_curve).astype(float)
@@ -88,3 +90,79 @@ def calmar_ratio(daily_returns: pd.Series, periods_per_year: int = 252) -> float
     if not np.isfinite(denom) or denom == 0:
         return 0.0
     return float(cagr / denom)
+
+
+@profiled("metrics.compute_all")
+def compute_all_metrics(
+    daily_returns: pd.DataFrame | pd.Series | np.ndarray,
+    *,
+    turnover: pd.DataFrame | np.ndarray | None = None,
+    exposure: pd.DataFrame | np.ndarray | None = None,
+    risk_free_rate_annual: float = 0.0,
+    minimum_acceptable_return_annual: float = 0.0,
+    periods_per_year: int = 252,
+) -> dict[str, np.ndarray]:
+    """
+    All leaderboard metrics for many return series at once (one column per series; a 1-D input
+    is a single series).
+
+    Equivalent to calling the functions above per column (NaN returns are skipped, max drawdown is
+    taken over the compounded equity curve), but computed in a few vectorized passes over the
+    (date x series) matrix. Returns arrays of length n_series keyed sharpe, sortino, calmar, cagr,
+    vol and maxdd, plus avg_exposure/avg_turnover (per-date means) when those matrices are given.
+    """
+    r = np.asarray(daily_returns, dtype=np.float64)
+    if r.ndim == 1:
+        r = r[:, None]
+    valid = ~np.isnan(r)
+    n = valid.sum(axis=0)
+    has = n > 0
+    safe_n = np.maximum(n, 1)
+    r0 = np.where(valid, r, 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Compounded equity (NaN days leave it unchanged), CAGR and drawdown in one cumprod.
+        equity = np.cumprod(1.0 + r0, axis=0)
+        growth = equity[-1] if len(r) else np.ones(r.shape[1])
+        cagr = np.where(has, np.power(growth, periods_per_year / safe_n) - 1.0, 0.0)
+        if len(r):
+            drawdown = equity / np.maximum.accumulate(equity, axis=0) - 1.0
+            maxdd = np.where(has, np.nanmin(np.where(valid, drawdown, np.nan), axis=0), 0.0)
+        else:
+            maxdd = np.zeros(r.shape[1])
+        maxdd = np.nan_to_num(maxdd, nan=0.0)
+
+        mean = r0.sum(axis=0) / safe_n
+        dev = np.where(valid, r - mean, 0.0)
+        std = np.sqrt((dev**2).sum(axis=0) / (n - 1))
+        std_ok = (n >= 2) & np.isfinite(std) & (std != 0)
+        vol = np.where(std_ok, std * periods_per_year**0.5, 0.0)
+
+        rf_daily = (1.0 + risk_free_rate_annual) ** (1.0 / periods_per_year) - 1.0
+        sharpe = np.where(std_ok, (mean - rf_daily) / std * periods_per_year**0.5, 0.0)
+
+        mar_daily = (1.0 + minimum_acceptable_return_annual) ** (1.0 / periods_per_year) - 1.0
+        downside = np.where(valid, np.minimum(0.0, r - mar_daily), 0.0)
+        downside_dev = np.sqrt((downside**2).sum(axis=0) / safe_n)
+        sortino_ok = has & np.isfinite(downside_dev) & (downside_dev != 0)
+        sortino = np.where(
+            sortino_ok, (mean - mar_daily) / downside_dev * periods_per_year**0.5, 0.0
+        )
+
+        denom = np.abs(maxdd)
+        calmar = np.where(np.isfinite(denom) & (denom != 0), cagr / denom, 0.0)
+
+    out = {
+        "sharpe": sharpe,
+        "sortino": sortino,
+        "calmar": calmar,
+        "cagr": cagr,
+        "vol": vol,
+        "maxdd": maxdd,
+    }
+    for name, values in (("avg_exposure", exposure), ("avg_turnover", turnover)):
+        if values is not None:
+            v = np.asarray(values, dtype=np.float64)
+            v = v[:, None] if v.ndim == 1 else v
+            out[name] = np.nanmean(v, axis=0) if len(v) else np.zeros(v.shape[1])
+    return out
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
 
+from paper_strategy_lab.profiling import profiled
+
+# Rows x tickers processed per block by `run_portfolio_backtest` (bounds its temporaries).
+_BLOCK_CELLS = 2_000_000
+
 
 @dataclass(frozen=True)
 class PortfolioBacktestResult:
@@ -13,6 +19,7 @@ class PortfolioBacktestResult:
     turnover: pd.Series
 
 
+@profiled("backtest.portfolio")
 def run_portfolio_backtest(
     prices: pd.DataFrame,
     weights: pd.DataFrame,
@@ -29,31 +36,134 @@ def run_portfolio_backtest(
     - execution: apply weights with `lag_days` delay (default 1)
     - costs: proportional to daily turnover (sum abs(delta weights))
     """
-    px = prices.copy()
-    w = weights.copy()
-
-    if px.empty:
+    if prices.empty:
         return PortfolioBacktestResult(
             equity_curve=pd.Series(dtype=float),
             daily_returns=pd.Series(dtype=float),
             turnover=pd.Series(dtype=float),
         )
 
-    px = px.sort_index()
-    w = w.sort_index().reindex(px.index).fillna(0.0)
-    w = w.reindex(columns=px.columns).fillna(0.0)
+    # Feed the underlying arrays through the streaming engine in row blocks: no full-size copies
+    # of the prices/weights, and returns/turnover are accumulated in float64 even for float32
+    # (compact) panels.
+    px = prices if prices.index.is_monotonic_increasing else prices.sort_index()
+    w = weights
+    if not (w.index.equals(px.index) and w.columns.equals(px.columns)):
+        w = w.sort_index().reindex(index=px.index, columns=px.columns)
+    p = px.to_numpy()
+    wv = w.to_numpy()
 
-    rets = (
-        px.pct_change(fill_method=None).replace([np.inf, -np.inf], np.nan).fillna(0.0)
+    stream = _BacktestStream(
+        p.shape[1], lag_days=lag_days, cost_rate=(fee_bps + slippage_bps) / 10_000.0
     )
+    block = max(1, _BLOCK_CELLS // max(1, p.shape[1]))
+    parts = [stream.step(p[a : a + block], wv[a : a + block]) for a in range(0, len(p), block)]
+    return _result(px.index, parts)
+
+
+class _BacktestStream:
+    """
+    Backtest state carried across consecutive row blocks: the last price row (for the first
+    return of the next block), the target weights still waiting out the execution lag, the last
+    executed weights (for turnover) and the equity level.
+    """
+
+    def __init__(self, n_cols: int, *, lag_days: int, cost_rate: float) -> None:
+        if lag_days < 0:
+            raise ValueError(f"Expected lag_days >= 0, got {lag_days}")
+        self.cost_rate = cost_rate
+        self.prev_price: np.ndarray | None = None
+        self.pending = np.zeros((lag_days, n_cols))
+        self.prev_exec: np.ndarray | None = None
+        self.equity = 1.0
 
-    w_exec = w.shift(lag_days).fillna(0.0)
+    def step(
+        self, prices: np.ndarray, weights: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Advance over one block of rows; returns its (daily returns, turnover, equity).
+        """
+        m = len(prices)
+        p = np.asarray(prices, dtype=np.float64)
+        prev = p[:1] * np.nan if self.prev_price is None else self.prev_price[None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rets = p / np.concatenate([prev, p[:-1]]) - 1.0
+        rets[~np.isfinite(rets)] = 0.0
 
-    delta = w_exec.diff().abs().sum(axis=1).fillna(0.0)
-    cost_rate = (fee_bps + slippage_bps) / 10_000.0
-    costs = delta * cost_rate
+        # Executed weights: the target weights `lag_days` rows earlier (0 before the first).
+        targets = np.asarray(weights, dtype=np.float64)
+        queued = np.concatenate([self.pending, np.where(np.isnan(targets), 0.0, targets)])
+        w_exec, self.pending = queued[:m], queued[m:]
+
+        first = w_exec[:1] if self.prev_exec is None else self.prev_exec[None, :]
+        turnover = np.abs(np.diff(np.concatenate([first, w_exec]), axis=0)).sum(axis=1)
+        port = np.einsum("ij,ij->i", w_exec, rets) - turnover * self.cost_rate
+        equity = np.cumprod(np.concatenate([[self.equity], 1.0 + port]))[1:]
+
+        if m:
+            self.prev_price = p[-1]
+            self.prev_exec = w_exec[-1]
+            self.equity = float(equity[-1])
+        return port, turnover, equity
+
+
+def _result(
+    index: pd.Index, parts: list[tuple[np.ndarray, np.ndarray, np.ndarray]]
+) -> PortfolioBacktestResult:
+    def series(i: int) -> pd.Series:
+        values = np.concatenate([part[i] for part in parts]) if parts else np.empty(0)
+        return pd.Series(values, index=index)
+
+    return PortfolioBacktestResult(
+        equity_curve=series(2), daily_returns=series(0), turnover=series(1)
+    )
 
-    port_rets = (w_exec * rets).sum(axis=1) - costs
-    equity = (1.0 + port_rets).cumprod()
 
-    return PortfolioBacktestResult(equity_curve=equity, daily_returns=port_rets, turnover=delta)
+def run_portfolio_backtest_streaming(
+    blocks: Iterable[tuple[pd.DataFrame, pd.DataFrame]],
+    *,
+    fee_bps: float = 0.0,
+    slippage_bps: float = 0.0,
+    lag_days: int = 1,
+) -> PortfolioBacktestResult:
+    """
+    `run_portfolio_backtest` over (prices, weights) blocks that walk the date axis in order.
+
+    Each block covers the next, strictly later, run of dates; the first block's price columns fix
+    the universe (later blocks are aligned to them). Only one block is held at a time, so memory is
+    bounded by the block size rather than the history length; the results are identical to the
+    in-memory engine on the concatenated panels.
+    """
+    stream: _BacktestStream | None = None
+    columns: pd.Index | None = None
+    last_date = None
+    dates: list[pd.Index] = []
+    parts: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+    for prices, weights in blocks:
+        if prices.empty:
+            continue
+        px = prices if prices.index.is_monotonic_increasing else prices.sort_index()
+        if columns is None:
+            columns = px.columns
+            stream = _BacktestStream(
+                len(columns), lag_days=lag_days, cost_rate=(fee_bps + slippage_bps) / 10_000.0
+            )
+        elif not px.columns.equals(columns):
+            px = px.reindex(columns=columns)
+        if last_date is not None and px.index[0] <= last_date:
+            raise ValueError("Blocks must cover strictly increasing, non-overlapping dates")
+        w = weights
+        if not (w.index.equals(px.index) and w.columns.equals(columns)):
+            w = w.sort_index().reindex(index=px.index, columns=columns)
+        assert stream is not None
+        parts.append(stream.step(px.to_numpy(), w.to_numpy()))
+        dates.append(px.index)
+        last_date = px.index[-1]
+
+    if not parts:
+        return PortfolioBacktestResult(
+            equity_curve=pd.Series(dtype=float),
+            daily_returns=pd.Series(dtype=float),
+            turnover=pd.Series(dtype=float),
+        )
+    return _result(dates[0].append(dates[1:]), parts)
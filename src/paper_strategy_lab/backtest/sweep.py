@@ -0,0 +1,323 @@
+"""
+Parameter sweeps over a strategy spec's `params`.
+
+All grid points are evaluated against one shared `MarketData`, so each distinct rolling indicator
+is computed once. Kinds whose signal is a simple comparison of cached indicators (moving-average
+and time-series-momentum families) are evaluated as one batched (param x date x ticker) array
+computation; other kinds fall back to running the builtin per grid point. With `workers > 1` the
+grid is split into chunks evaluated in a process pool whose workers read the price/feature panels
+from shared memory (each worker keeps one `MarketData`, so its indicators are shared across the
+chunks it evaluates).
+"""
+
+from __future__ import annotations
+
+import inspect
+import itertools
+import math
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from paper_strategy_lab.backtest.metrics import compute_all_metrics
+from paper_strategy_lab.backtest.portfolio import run_portfolio_backtest
+from paper_strategy_lab.feature_store import feature_store
+from paper_strategy_lab.market_data import MarketData
+from paper_strategy_lab.shared_panels import SharedPanelHandle, SharedPanels, attach_panels
+from paper_strategy_lab.strategies.runner import resolve_strategy_callable, run_strategy_weights
+from paper_strategy_lab.strategies.spec import StrategySpec
+
+# Upper bound on param x date x ticker cells materialized at once by the batched path.
+_BATCH_CELLS = 20_000_000
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    params: list[dict[str, object]]
+    daily_returns: pd.DataFrame  # date x grid point (column i <-> params[i])
+    turnover: pd.DataFrame
+    exposure: pd.DataFrame
+
+
+def parse_grid_values(text: str) -> list[object]:
+    """
+    Parse `a,b,c` or an inclusive range `start:stop:step` into typed values.
+    """
+    text = text.strip()
+    if ":" in text:
+        parts = [_parse_scalar(p) for p in text.split(":")]
+        if len(parts) != 3 or not all(isinstance(p, int | float) for p in parts):
+            raise ValueError(f"Expected start:stop:step, got {text!r}")
+        start, stop, step = (float(p) for p in parts)  # type: ignore[arg-type]
+        if step <= 0:
+            raise ValueError(f"Expected step > 0, got {text!r}")
+        values = np.arange(start, stop + step / 2, step)
+        if all(isinstance(p, int) for p in parts):
+            return [int(round(v)) for v in values]
+        return [float(v) for v in values]
+    return [_parse_scalar(p) for p in text.split(",") if p.strip()]
+
+
+def _parse_scalar(text: str) -> object:
+    text = text.strip()
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def expand_grid(grid: dict[str, list[object]]) -> list[dict[str, object]]:
+    names = list(grid)
+    return [dict(zip(names, combo, strict=True)) for combo in itertools.product(*grid.values())]
+
+
+def _with_defaults(fn: Callable[..., pd.DataFrame], params: dict[str, object]) -> dict[str, object]:
+    defaults = {
+        name: p.default
+        for name, p in inspect.signature(fn).parameters.items()
+        if p.default is not inspect.Parameter.empty
+    }
+    return {**defaults, **params}
+
+
+def _batched_signal(data: MarketData, kind: str, params: dict[str, object]) -> pd.DataFrame | None:
+    """
+    Raw 0/1 signal for one grid point from cached indicators, or None if the point is invalid.
+    """
+    p = _with_defaults(resolve_strategy_callable(kind), params)
+    if kind in {"sma_crossover", "two_moving_averages"}:
+        fast, slow = int(p["fast"]), int(p["slow"])  # type: ignore[arg-type]
+        if not 0 < fast < slow:
+            return None
+        return data.sma(fast) > data.sma(slow)
+    if kind == "single_moving_average":
+        window = int(p["window"])  # type: ignore[arg-type]
+        if window <= 0:
+            return None
+        return data.prices > data.sma(window)
+    if kind == "three_moving_averages":
+        fast, mid, slow = (int(p[k]) for k in ("fast", "mid", "slow"))  # type: ignore[arg-type]
+        if not 0 < fast < mid < slow:
+            return None
+        return (data.sma(fast) > data.sma(mid)) & (data.sma(mid) > data.sma(slow))
+    if kind == "time_series_momentum":
+        lookback = int(p["lookback_days"])  # type: ignore[arg-type]
+        if lookback <= 0:
+            return None
+        return data.returns(lookback) > 0
+    raise KeyError(kind)
+
+
+_BATCHED_KINDS = {
+    "sma_crossover",
+    "two_moving_averages",
+    "single_moving_average",
+    "three_moving_averages",
+    "time_series_momentum",
+}
+
+
+def _batched_backtest(
+    prices: pd.DataFrame,
+    signals: np.ndarray,
+    *,
+    cost_rate: float,
+    lag_days: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    `run_portfolio_backtest` over a (param x date x ticker) stack of 0/1 signals at once.
+
+    Signals are equal-weighted across active tickers per date (as `_normalize_weights` does).
+    Returns (daily_returns, turnover, exposure), each (param x date).
+    """
+    rets = (
+        prices.pct_change(fill_method=None)
+        .replace([np.inf, -np.inf], np.nan)
+        .fillna(0.0)
+        .to_numpy(dtype=float)
+    )
+    count = signals.sum(axis=2, keepdims=True)
+    w = np.divide(signals, count, out=np.zeros(signals.shape), where=count > 0)
+
+    w_exec = np.zeros_like(w)
+    if lag_days > 0:
+        w_exec[:, lag_days:] = w[:, :-lag_days]
+    else:
+        w_exec[:] = w
+
+    turnover = np.zeros(w_exec.shape[:2])
+    turnover[:, 1:] = np.abs(np.diff(w_exec, axis=1)).sum(axis=2)
+    port = np.einsum("ptn,tn->pt", w_exec, rets) - turnover * cost_rate
+    return port, turnover, w_exec.sum(axis=2)
+
+
+def _sweep_points(
+    data: MarketData,
+    spec: StrategySpec,
+    combos: list[dict[str, object]],
+    *,
+    fee_bps: float,
+    slippage_bps: float,
+    lag_days: int,
+) -> SweepResult:
+    prices = data.prices
+    cost_rate = (fee_bps + slippage_bps) / 10_000.0
+
+    kept: list[dict[str, object]] = []
+    rets_cols: list[np.ndarray] = []
+    turn_cols: list[np.ndarray] = []
+    expo_cols: list[np.ndarray] = []
+
+    if spec.kind in _BATCHED_KINDS:
+        per_batch = max(1, _BATCH_CELLS // max(1, prices.size))
+        for i in range(0, len(combos), per_batch):
+            batch: list[np.ndarray] = []
+            for params in combos[i : i + per_batch]:
+                sig = _batched_signal(data, spec.kind, params)
+                if sig is None:
+                    continue
+                kept.append(params)
+                batch.append(sig.to_numpy(dtype=float))
+            if not batch:
+                continue
+            port, turnover, exposure = _batched_backtest(
+                prices, np.stack(batch), cost_rate=cost_rate, lag_days=lag_days
+            )
+            rets_cols.extend(port)
+            turn_cols.extend(turnover)
+            expo_cols.extend(exposure)
+    else:
+        for params in combos:
+            try:
+                w = run_strategy_weights(data=data, spec=replace(spec, params=params))
+            except ValueError:
+                continue
+            bt = run_portfolio_backtest(
+                prices=prices,
+                weights=w,
+                fee_bps=fee_bps,
+                slippage_bps=slippage_bps,
+                lag_days=lag_days,
+            )
+            kept.append(params)
+            rets_cols.append(bt.daily_returns.to_numpy())
+            turn_cols.append(bt.turnover.to_numpy())
+            expo_cols.append(w.shift(lag_days).fillna(0.0).sum(axis=1).to_numpy())
+
+    def frame(cols: list[np.ndarray]) -> pd.DataFrame:
+        values = np.column_stack(cols) if cols else np.empty((len(prices), 0))
+        return pd.DataFrame(values, index=prices.index)
+
+    return SweepResult(
+        params=kept,
+        daily_returns=frame(rets_cols),
+        turnover=frame(turn_cols),
+        exposure=frame(expo_cols),
+    )
+
+
+# Key of the price panel among the shared panels (the others are `MarketData.features`).
+_PRICES = "__prices__"
+
+# The MarketData each pool worker builds over the shared panels at start-up (see `_init_worker`).
+_WORKER_DATA: list[MarketData] = []
+
+
+def _init_worker(handles: dict[str, SharedPanelHandle], use_store: bool) -> None:
+    panels = attach_panels(handles)
+    prices = panels.pop(_PRICES)
+    store = feature_store() if use_store else None
+    _WORKER_DATA[:] = [MarketData(prices=prices, features=panels, store=store)]
+
+
+def _sweep_in_worker(
+    combos: list[dict[str, object]],
+    spec: StrategySpec,
+    fee_bps: float,
+    slippage_bps: float,
+    lag_days: int,
+) -> SweepResult:
+    return _sweep_points(
+        _WORKER_DATA[0],
+        spec,
+        combos,
+        fee_bps=fee_bps,
+        slippage_bps=slippage_bps,
+        lag_days=lag_days,
+    )
+
+
+def run_param_sweep(
+    data: MarketData,
+    spec: StrategySpec,
+    grid: dict[str, list[object]],
+    *,
+    fee_bps: float = 0.0,
+    slippage_bps: float = 0.0,
+    lag_days: int = 1,
+    workers: int = 1,
+) -> SweepResult:
+    """
+    Backtest `spec` for every point of `grid` (merged over `spec.params`).
+
+    Grid points the strategy rejects as invalid (e.g. `fast >= slow`) are skipped. With
+    `workers > 1` the points are evaluated in that many processes; the result is the same.
+    """
+    prices = data.prices.sort_index()
+    if not prices.index.equals(data.prices.index):
+        data = replace(data, prices=prices, indicators={})
+    combos = [{**spec.params, **c} for c in expand_grid(grid)]
+    sweep = partial(_sweep_points, fee_bps=fee_bps, slippage_bps=slippage_bps, lag_days=lag_days)
+    if workers <= 1 or len(combos) <= 1:
+        return sweep(data, spec, combos)
+
+    # A few chunks per worker balances the load; chunks keep grid order.
+    size = math.ceil(len(combos) / min(len(combos), 4 * workers))
+    chunks = [combos[i : i + size] for i in range(0, len(combos), size)]
+    with (
+        SharedPanels({_PRICES: data.prices, **data.features}) as shared,
+        ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(shared.handles, data.store is not None),
+        ) as pool,
+    ):
+        parts = list(
+            pool.map(
+                partial(
+                    _sweep_in_worker,
+                    spec=spec,
+                    fee_bps=fee_bps,
+                    slippage_bps=slippage_bps,
+                    lag_days=lag_days,
+                ),
+                chunks,
+            )
+        )
+
+    def concat(frames: list[pd.DataFrame]) -> pd.DataFrame:
+        values = np.column_stack([f.to_numpy() for f in frames])
+        return pd.DataFrame(values, index=prices.index)
+
+    return SweepResult(
+        params=[p for part in parts for p in part.params],
+        daily_returns=concat([part.daily_returns for part in parts]),
+        turnover=concat([part.turnover for part in parts]),
+        exposure=concat([part.exposure for part in parts]),
+    )
+
+
+def summarize_sweep(result: SweepResult) -> pd.DataFrame:
+    """
+    One row per grid point: the swept parameter values plus the leaderboard metrics.
+    """
+    metrics = compute_all_metrics(
+        result.daily_returns, turnover=result.turnover, exposure=result.exposure
+    )
+    return pd.concat([pd.DataFrame(result.params), pd.DataFrame(metrics)], axis=1)
@@ -0,0 +1,140 @@
+"""
+Walk-forward optimization: choose a spec's parameters on rolling train windows and stitch the
+out-of-sample returns of the test windows that follow them.
+
+Every grid point is backtested once over the whole window (`run_param_sweep`, optionally across
+worker processes over shared-memory panels). The strategies are causal (weights on date t only
+use data up to t and trade with a lag), so a grid point's returns on any fold are a slice of that
+one run: each fold only ranks the grid points by a metric over its train rows and keeps the
+winner's test rows. A walk-forward over hundreds of folds therefore costs one sweep plus a
+vectorized metrics pass per fold. Rebalancing from one fold's parameters to the next is not
+charged costs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from paper_strategy_lab.backtest.metrics import compute_all_metrics
+from paper_strategy_lab.backtest.sweep import SweepResult, run_param_sweep
+from paper_strategy_lab.market_data import MarketData
+from paper_strategy_lab.profiling import span
+from paper_strategy_lab.strategies.spec import StrategySpec
+
+SELECTION_METRICS = ("sharpe", "sortino", "calmar", "cagr")
+
+
+@dataclass(frozen=True)
+class WalkForwardFold:
+    """
+    Row positions of one fold: train rows [train_start, test_start), test rows
+    [test_start, test_end).
+    """
+
+    train_start: int
+    test_start: int
+    test_end: int
+
+
+@dataclass(frozen=True)
+class WalkForwardResult:
+    sweep: SweepResult  # every grid point over the whole window
+    folds: pd.DataFrame  # one row per fold: dates, chosen params, train/test metrics
+    daily_returns: pd.Series  # stitched out-of-sample returns (test rows of every fold)
+    turnover: pd.Series
+    exposure: pd.Series
+
+
+def walk_forward_folds(n_rows: int, *, train_days: int, test_days: int) -> list[WalkForwardFold]:
+    """
+    Rolling folds over `n_rows` dates: `train_days` rows of training followed by up to
+    `test_days` test rows, stepping by `test_days` (the last test window may be shorter).
+    """
+    if train_days < 1 or test_days < 1:
+        raise ValueError("train_days and test_days must be >= 1")
+    return [
+        WalkForwardFold(
+            train_start=test_start - train_days,
+            test_start=test_start,
+            test_end=min(test_start + test_days, n_rows),
+        )
+        for test_start in range(train_days, n_rows, test_days)
+    ]
+
+
+def run_walk_forward(
+    data: MarketData,
+    spec: StrategySpec,
+    grid: dict[str, list[object]],
+    *,
+    train_days: int,
+    test_days: int,
+    metric: str = "sharpe",
+    fee_bps: float = 0.0,
+    slippage_bps: float = 0.0,
+    lag_days: int = 1,
+    workers: int = 1,
+) -> WalkForwardResult:
+    """
+    Walk `spec` forward over `grid` (merged over `spec.params`), selecting the grid point with
+    the highest `metric` on each fold's train rows (ties go to the earlier grid point).
+    """
+    if metric not in SELECTION_METRICS:
+        raise ValueError(f"Unknown metric {metric!r}; expected one of {SELECTION_METRICS}")
+    sweep = run_param_sweep(
+        data,
+        spec,
+        grid,
+        fee_bps=fee_bps,
+        slippage_bps=slippage_bps,
+        lag_days=lag_days,
+        workers=workers,
+    )
+    index = sweep.daily_returns.index
+    folds = walk_forward_folds(len(index), train_days=train_days, test_days=test_days)
+    if not sweep.params or not folds:
+        raise ValueError(
+            f"Need valid grid points and more than train_days={train_days} dates "
+            f"(got {len(sweep.params)} points, {len(index)} dates)"
+        )
+
+    rets = sweep.daily_returns.to_numpy()
+    turnover = sweep.turnover.to_numpy()
+    exposure = sweep.exposure.to_numpy()
+    oos_rets: list[np.ndarray] = []
+    oos_turnover: list[np.ndarray] = []
+    oos_exposure: list[np.ndarray] = []
+    rows: list[dict[str, object]] = []
+    with span("walk_forward.select", folds=len(folds)):
+        for i, fold in enumerate(folds):
+            train = compute_all_metrics(rets[fold.train_start : fold.test_start])[metric]
+            best = int(np.argmax(train))
+            test_rows = slice(fold.test_start, fold.test_end)
+            test = rets[test_rows, best]
+            oos_rets.append(test)
+            oos_turnover.append(turnover[test_rows, best])
+            oos_exposure.append(exposure[test_rows, best])
+            rows.append(
+                {
+                    "fold": i,
+                    "train_start": str(index[fold.train_start])[:10],
+                    "test_start": str(index[fold.test_start])[:10],
+                    "test_end": str(index[fold.test_end - 1])[:10],
+                    **{name: sweep.params[best][name] for name in grid},
+                    f"train_{metric}": float(train[best]),
+                    f"test_{metric}": float(compute_all_metrics(test)[metric][0]),
+                    "test_return": float(np.prod(1.0 + np.nan_to_num(test)) - 1.0),
+                }
+            )
+
+    oos_index = index[folds[0].test_start :]
+    return WalkForwardResult(
+        sweep=sweep,
+        folds=pd.DataFrame(rows),
+        daily_returns=pd.Series(np.concatenate(oos_rets), index=oos_index),
+        turnover=pd.Series(np.concatenate(oos_turnover), index=oos_index),
+        exposure=pd.Series(np.concatenate(oos_exposure), index=oos_index),
+    )
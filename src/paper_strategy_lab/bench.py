@@ -0,0 +1,252 @@
+"""
+Performance benchmark suite over a synthetic Sharadar-shaped dataset (see `synthetic`).
+
+`run_bench` times the hot paths end to end: cold CSV scans and warm cache hits of the loaders,
+the liquid-universe build, every spec of a strategy file (weights only), the portfolio backtest,
+the metrics kernel, the full leaderboard and the columnar store. Results are plain JSON, so a
+baseline can be committed and later runs compared against it with `compare_to_baseline`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import shutil
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from paper_strategy_lab.backtest.leaderboard import (
+    LeaderboardConfig,
+    job_market_data,
+    prepare_leaderboard,
+    run_leaderboard,
+)
+from paper_strategy_lab.backtest.metrics import compute_all_metrics
+from paper_strategy_lab.backtest.portfolio import run_portfolio_backtest
+from paper_strategy_lab.cache import result_cache
+from paper_strategy_lab.data_sources.sharadar import (
+    load_daily_metrics,
+    load_equity_prices,
+    load_prices,
+    resolve_paths,
+)
+from paper_strategy_lab.data_sources.sharadar_store import ingest_csv
+from paper_strategy_lab.strategies.runner import run_strategy_weights
+from paper_strategy_lab.strategies.yaml_loader import load_strategy_specs
+from paper_strategy_lab.synthetic import SYNTHETIC_ETFS, SyntheticSpec, write_synthetic_sharadar
+from paper_strategy_lab.universe.sharadar_universe import build_us_equities_liquid
+
+BENCH_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    name: str
+    run: Callable[[], object]
+    setup: Callable[[], None] | None = None  # untimed, before every repeat
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    name: str
+    best: float  # seconds, fastest repeat
+    mean: float
+    repeats: int
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+
+def ensure_synthetic_data(root: Path, spec: SyntheticSpec) -> Path:
+    """
+    Synthetic dataset for `spec` under `root/<spec.name>`, generated on first use.
+    """
+    out = root / spec.name
+    if not (out / "SHARADAR_TICKERS_synthetic.csv").exists():
+        work = root / f".{spec.name}.tmp"
+        shutil.rmtree(work, ignore_errors=True)
+        write_synthetic_sharadar(work, spec)
+        shutil.rmtree(out, ignore_errors=True)
+        os.replace(work, out)
+    return out
+
+
+@contextmanager
+def _environment(**values: str) -> Iterator[None]:
+    saved = {k: os.environ.get(k) for k in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def time_case(case: BenchCase, *, repeat: int) -> BenchResult:
+    times: list[float] = []
+    for _ in range(max(1, repeat)):
+        if case.setup is not None:
+            case.setup()
+        t0 = time.perf_counter()
+        case.run()
+        times.append(time.perf_counter() - t0)
+    return BenchResult(case.name, min(times), float(np.mean(times)), len(times))
+
+
+def _bench_cases(spec_file: Path, work_dir: Path, config: LeaderboardConfig) -> Iterator[BenchCase]:
+    """
+    Cases in run order; later cases reuse state (warm caches, the ingested store) built by
+    earlier ones, and data needed only as input is loaded outside the timed region.
+    """
+    paths = resolve_paths()
+    cache = result_cache()
+    store_dir = work_dir / "store"
+    specs = load_strategy_specs(spec_file)
+
+    def cold() -> None:
+        cache.clear()
+
+    start, end = config.start, config.end
+    universe = build_us_equities_liquid(start=start, end=end, max_tickers=300)
+    cache.clear()
+
+    def warm() -> None:
+        load_equity_prices(universe, start=start)
+
+    yield BenchCase("scan.sfp_prices", lambda: load_prices(SYNTHETIC_ETFS, start=start), cold)
+    yield BenchCase("scan.sep_prices", lambda: load_equity_prices(universe, start=start), cold)
+    yield BenchCase(
+        "scan.daily_metrics",
+        lambda: load_daily_metrics(universe, fields=["pe", "pb"], start=start),
+        cold,
+    )
+    yield BenchCase("cache.sep_prices", lambda: load_equity_prices(universe, start=start), warm)
+    yield BenchCase(
+        "universe.us_equities_liquid",
+        lambda: build_us_equities_liquid(start=start, end=end, max_tickers=300),
+        cold,
+    )
+
+    jobs, panels = prepare_leaderboard(specs, config)
+    for job in jobs:
+        data = job_market_data(job, panels, config)
+        if data is not None:
+            yield BenchCase(
+                f"strategy.{job.spec.id}",
+                lambda data=data, spec=job.spec: run_strategy_weights(data, spec),
+            )
+
+    prices = load_equity_prices(universe, start=start)
+    weights = pd.DataFrame(
+        np.where(prices.notna(), 1.0 / max(1, prices.shape[1]), 0.0),
+        index=prices.index,
+        columns=prices.columns,
+    )
+    yield BenchCase(
+        "backtest.portfolio",
+        lambda: run_portfolio_backtest(prices, weights, fee_bps=5.0, slippage_bps=5.0),
+    )
+    returns = np.random.default_rng(0).normal(0.0003, 0.01, size=(len(prices), 1000))
+    yield BenchCase("metrics.compute_all_1000", lambda: compute_all_metrics(returns))
+
+    yield BenchCase("leaderboard.prepare", lambda: prepare_leaderboard(specs, config), cold)
+    yield BenchCase("leaderboard.run", lambda: run_leaderboard(jobs, panels, config))
+
+    yield BenchCase(
+        "store.ingest_sep",
+        lambda: ingest_csv(paths.sep_prices, store_dir=store_dir),
+        lambda: shutil.rmtree(store_dir, ignore_errors=True),
+    )
+    yield BenchCase("store.sep_prices", lambda: load_equity_prices(universe, start=start), cold)
+
+
+def run_bench(
+    data_dir: Path,
+    *,
+    spec_file: Path,
+    work_dir: Path,
+    repeat: int = 3,
+    only: str | None = None,
+    start: str | None = None,
+    on_result: Callable[[BenchResult], None] | None = None,
+) -> dict[str, object]:
+    """
+    Run the suite against the Sharadar CSVs in `data_dir` and return the JSON-able report.
+
+    Scratch state (result cache, columnar store) lives in `work_dir`, which is wiped first, so
+    runs never touch the user's cache. `only` keeps the cases whose name contains it.
+    """
+    shutil.rmtree(work_dir, ignore_errors=True)
+    work_dir.mkdir(parents=True)
+    config = LeaderboardConfig(start=start, end=None, years=5, fee_bps=5.0)
+    results: list[BenchResult] = []
+    with _environment(
+        SHARADAR_DIR=str(data_dir),
+        SHARADAR_STORE_DIR=str(work_dir / "store"),
+        PAPER_STRATEGY_LAB_CACHE_DIR=str(work_dir / "cache"),
+        PAPER_STRATEGY_LAB_PANEL_DTYPE="float64",
+    ):
+        for case in _bench_cases(spec_file, work_dir, config):
+            if only and only not in case.name:
+                continue
+            result = time_case(case, repeat=repeat)
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+    return {
+        "format": BENCH_FORMAT,
+        "meta": {
+            "data": data_dir.name,
+            "repeat": repeat,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": {r.name: asdict(r) for r in results},
+    }
+
+
+def load_report(path: Path) -> dict[str, object]:
+    report = json.loads(path.read_text(encoding="utf-8"))
+    if report.get("format") != BENCH_FORMAT:
+        raise ValueError(f"Unsupported bench report format in {path}: {report.get('format')!r}")
+    return report
+
+
+def compare_to_baseline(
+    current: dict[str, object], baseline: dict[str, object], *, tolerance: float = 0.25
+) -> list[Regression]:
+    """
+    Cases whose best time is more than `tolerance` (fraction) slower than in `baseline`.
+    """
+    now: dict = current["results"]  # type: ignore[assignment]
+    base: dict = baseline["results"]  # type: ignore[assignment]
+    out: list[Regression] = []
+    for name, r in now.items():
+        if name not in base:
+            continue
+        reg = Regression(name, float(base[name]["best"]), float(r["best"]))
+        if reg.ratio > 1.0 + tolerance:
+            out.append(reg)
+    return out
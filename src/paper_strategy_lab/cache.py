@@ -0,0 +1,301 @@
+"""
+Size-bounded on-disk result cache for loaded panels and small JSON results.
+
+Entries are addressed by the SHA-256 of their key (`<prefix>-<digest>/`). Wide panels are stored
+as `.npy` files (values, date index) plus `meta.json`, and are memory-mapped on read instead of
+unpickled. Writes go to a scratch directory that is renamed into place, so a reader never sees a
+partial entry. Once the cache grows past its size cap, least-recently-used entries are evicted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from paper_strategy_lab.config import cache_max_bytes, resolve_cache_dir
+
+CACHE_FORMAT = 1
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    name: str
+    path: Path
+    prefix: str
+    kind: str  # "frame" | "json" | "legacy"
+    bytes: int
+    created: float
+    last_used: float
+    hits: int
+    info: dict[str, object] = field(default_factory=dict)  # caller metadata (see `put_frame`)
+
+
+def _dir_bytes(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(p.stat().st_size for p in path.iterdir() if p.is_file())
+
+
+def _write_json(path: Path, value: object) -> None:
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+    tmp.write_text(json.dumps(value), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class ResultCache:
+    def __init__(self, root: Path | None = None, *, max_bytes: int | None = None) -> None:
+        self.root = resolve_cache_dir(root)
+        self.max_bytes = cache_max_bytes() if max_bytes is None else max_bytes
+        self.stats = CacheStats()
+
+    def entry_path(self, prefix: str, key: object) -> Path:
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return self.root / f"{prefix}-{digest}"
+
+    # -- reads ---------------------------------------------------------------------------------
+
+    def _open(self, path: Path, kind: str) -> tuple[Path, dict] | None:
+        try:
+            meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.stats.misses += 1
+            return None
+        if meta.get("format") != CACHE_FORMAT or meta.get("kind") != kind:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        self.stats.bytes_read += int(meta.get("bytes", 0))
+        meta["hits"] = int(meta.get("hits", 0)) + 1
+        meta["last_used"] = time.time()
+        with suppress(OSError):
+            _write_json(path / "meta.json", meta)
+        return path, meta
+
+    def get_frame(self, prefix: str, key: object) -> pd.DataFrame | None:
+        """
+        Cached date x column panel for `key`, memory-mapped read-only; None on a miss.
+        """
+        return self._read_frame(self.entry_path(prefix, key))
+
+    def read_entry(self, entry: CacheEntry) -> pd.DataFrame | None:
+        """
+        Panel stored in a `frame` entry found via `entries()`; None if it has been evicted.
+        """
+        return self._read_frame(entry.path)
+
+    def _read_frame(self, path: Path) -> pd.DataFrame | None:
+        opened = self._open(path, "frame")
+        if opened is None:
+            return None
+        path, meta = opened
+        try:
+            values = np.load(path / "values.npy", mmap_mode="r")
+            index = pd.DatetimeIndex(np.load(path / "index.npy"), name=meta["index_name"])
+        except (OSError, ValueError):
+            return None
+        return pd.DataFrame(values, index=index, columns=pd.Index(meta["columns"]), copy=False)
+
+    def get_json(self, prefix: str, key: object) -> object | None:
+        opened = self._open(self.entry_path(prefix, key), "json")
+        if opened is None:
+            return None
+        path, _ = opened
+        try:
+            return json.loads((path / "value.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    # -- writes --------------------------------------------------------------------------------
+
+    def _commit(self, prefix: str, key: object, kind: str, work: Path, extra: dict) -> None:
+        size = _dir_bytes(work)
+        now = time.time()
+        meta = {
+            "format": CACHE_FORMAT,
+            "kind": kind,
+            "prefix": prefix,
+            "key": repr(key),
+            "bytes": size,
+            "created": now,
+            "last_used": now,
+            "hits": 0,
+            **extra,
+        }
+        (work / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+        final = self.entry_path(prefix, key)
+        shutil.rmtree(final, ignore_errors=True)
+        try:
+            os.replace(work, final)
+        except OSError:
+            # Another process committed the same entry first; theirs is equivalent.
+            shutil.rmtree(work, ignore_errors=True)
+            return
+        self.stats.writes += 1
+        self.stats.bytes_written += size
+        if self.max_bytes > 0:
+            self.prune(self.max_bytes, keep=final)
+
+    def _scratch(self) -> Path:
+        self.root.mkdir(parents=True, exist_ok=True)
+        work = self.root / f".tmp-{uuid.uuid4().hex}"
+        work.mkdir()
+        return work
+
+    def put_frame(
+        self,
+        prefix: str,
+        key: object,
+        frame: pd.DataFrame,
+        *,
+        info: dict[str, object] | None = None,
+    ) -> None:
+        """
+        Cache a panel with a DatetimeIndex (or an empty frame) and numeric/bool values.
+
+        `info` is JSON metadata kept alongside the entry and returned by `entries()`, so callers
+        can find entries by content (e.g. the tickers and dates a panel covers) and not only by key.
+        """
+        if len(frame.index) and not isinstance(frame.index, pd.DatetimeIndex):
+            raise TypeError("Only date-indexed panels can be cached")
+        values = np.ascontiguousarray(frame.to_numpy())
+        if values.dtype == object:
+            raise TypeError("Only numeric/bool panels can be cached")
+        work = self._scratch()
+        try:
+            np.save(work / "values.npy", values)
+            np.save(work / "index.npy", pd.DatetimeIndex(frame.index).to_numpy())
+            extra = {
+                "index_name": frame.index.name,
+                "columns": [str(c) for c in frame.columns],
+                "info": info or {},
+            }
+            self._commit(prefix, key, "frame", work, extra)
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+    def put_json(self, prefix: str, key: object, value: object) -> None:
+        work = self._scratch()
+        try:
+            (work / "value.json").write_text(json.dumps(value), encoding="utf-8")
+            self._commit(prefix, key, "json", work, {})
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+    # -- maintenance ---------------------------------------------------------------------------
+
+    def entries(self, prefix: str | None = None) -> list[CacheEntry]:
+        """
+        All entries (or those of one prefix), least recently used first. Pre-existing
+        `*.pkl`/`*.json` files from the old pickle cache are listed as "legacy" so they can be
+        pruned/cleared too.
+        """
+        if not self.root.exists():
+            return []
+        out: list[CacheEntry] = []
+        for p in self.root.iterdir():
+            if p.name.startswith("."):
+                continue
+            if p.is_file():
+                # Legacy files are named `<prefix>_<digest>.pkl`.
+                entry_prefix = p.stem.rsplit("_", 1)[0]
+                if p.suffix not in {".pkl", ".json"} or prefix not in {None, entry_prefix}:
+                    continue
+                st = p.stat()
+                out.append(
+                    CacheEntry(p.name, p, entry_prefix, "legacy", st.st_size, st.st_mtime, 0.0, 0)
+                )
+                continue
+            if prefix is not None and not p.name.startswith(f"{prefix}-"):
+                continue
+            entry = self._entry_at(p)
+            if entry is not None:
+                out.append(entry)
+        return sorted(out, key=lambda e: (e.last_used, e.created))
+
+    def entry(self, prefix: str, key: object) -> CacheEntry | None:
+        """
+        The entry stored under `key` (metadata only; not counted as a hit), or None.
+        """
+        return self._entry_at(self.entry_path(prefix, key))
+
+    def _entry_at(self, path: Path) -> CacheEntry | None:
+        try:
+            meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(
+            name=path.name,
+            path=path,
+            prefix=str(meta.get("prefix", "")),
+            kind=str(meta.get("kind", "")),
+            bytes=int(meta.get("bytes", 0)),
+            created=float(meta.get("created", 0.0)),
+            last_used=float(meta.get("last_used", 0.0)),
+            hits=int(meta.get("hits", 0)),
+            info=dict(meta.get("info", {})),
+        )
+
+    def remove(self, entry: CacheEntry) -> None:
+        if entry.path.is_dir():
+            shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            entry.path.unlink(missing_ok=True)
+
+    def prune(self, max_bytes: int, *, keep: Path | None = None) -> list[CacheEntry]:
+        """
+        Evict least-recently-used entries until the cache fits in `max_bytes`.
+
+        `keep` (the entry just written) is evicted last: only if it alone exceeds the cap.
+        """
+        entries = self.entries()
+        entries.sort(key=lambda e: e.path == keep)  # stable: LRU order, `keep` last
+        total = sum(e.bytes for e in entries)
+        removed: list[CacheEntry] = []
+        for entry in entries:
+            if total <= max_bytes:
+                break
+            self.remove(entry)
+            total -= entry.bytes
+            removed.append(entry)
+        self.stats.evictions += len(removed)
+        return removed
+
+    def clear(self, prefix: str | None = None) -> int:
+        entries = self.entries(prefix)
+        for entry in entries:
+            self.remove(entry)
+        return len(entries)
+
+
+_DEFAULT: ResultCache | None = None
+
+
+def result_cache() -> ResultCache:
+    """
+    Process-wide cache at the configured location (see `config.resolve_cache_dir`).
+    """
+    global _DEFAULT
+    root = resolve_cache_dir()
+    if _DEFAULT is None or _DEFAULT.root != root:
+        _DEFAULT = ResultCache(root)
+    return _DEFAULT
@@ -1,68 +1,234 @@
 from __future__ import annotations
 
 import json
+import os
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from paper_strategy_lab.backtest.metrics import (
-    annualized_return,
-    annualized_volatility,
-    calmar_ratio,
-    max_drawdown,
-    sharpe_ratio,
-    sortino_ratio,
-)
-from paper_strategy_lab.backtest.portfolio import run_portfolio_backtest
-from paper_strategy_lab.data_sources.sharadar import (
-    load_daily_metrics,
-    load_equity_prices,
-    load_prices,
-)
-from paper_strategy_lab.market_data import MarketData
-from paper_strategy_lab.pdf_text import extract_pages
-from paper_strategy_lab.strategies.runner import run_strategy_weights
-from paper_strategy_lab.strategies.yaml_loader import load_strategy_specs
-from paper_strategy_lab.strategy_candidates import extract_candidates_from_pages_jsonl
-from paper_strategy_lab.universe.sharadar_universe import build_us_equities_liquid
+from paper_strategy_lab.config import project_root
+from paper_strategy_lab.memory import peak_memory_summary
+
+if TYPE_CHECKING:
+    from paper_strategy_lab.market_data import MarketData
+    from paper_strategy_lab.strategies.spec import StrategySpec
+
+# Commands import pandas, pypdf and the subsystems they use inside their bodies, so `--help` and
+# light commands (list-strategies, extract-text, cache) start without loading the numeric stack.
+# tests/test_cli_imports.py keeps this from regressing.
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
 console = Console()
 
 
+def _use_compact_panels(compact: bool) -> None:
+    if compact:
+        # Read by the loaders (and inherited by worker processes).
+        os.environ["PAPER_STRATEGY_LAB_PANEL_DTYPE"] = "float32"
+
+
+@contextmanager
+def _profile_run(profile: bool, trace: Path | None) -> Iterator[None]:
+    """
+    Profile the enclosed run if requested: print per-stage timings afterwards and write the
+    Chrome trace to `trace` (which implies profiling).
+    """
+    if not profile and trace is None:
+        yield
+        return
+    from paper_strategy_lab.profiling import Profiler
+
+    with Profiler() as prof:
+        yield
+
+    wall = prof.wall_ns / 1e9
+    table = Table(title=f"Profile ({wall:.2f}s wall)")
+    table.add_column("stage", style="cyan", no_wrap=True)
+    for col in ["calls", "seconds", "% wall", "rows", "cache hits", "cache misses"]:
+        table.add_column(col, justify="right")
+    for st in prof.stages():
+        table.add_row(
+            st.name,
+            str(st.calls),
+            f"{st.seconds:.3f}",
+            f"{st.seconds / wall:.0%}" if wall > 0 else "",
+            f"{st.counts['rows']:,}" if "rows" in st.counts else "",
+            str(st.counts.get("cache_hits", "")),
+            str(st.counts.get("cache_misses", "")),
+        )
+    console.print(table)
+    if trace is not None:
+        prof.write_trace(trace)
+        console.print(f"Wrote Chrome trace ({len(prof.events)} spans) -> {trace}")
+
+
+def _select_strategy(spec: Path, strategy_id: str) -> StrategySpec:
+    from paper_strategy_lab.strategies.yaml_loader import load_strategy_specs
+
+    try:
+        strategies = load_strategy_specs(spec)
+        selected = next(s for s in strategies if s.id == strategy_id)
+    except StopIteration:
+        raise typer.BadParameter(f"Unknown strategy_id={strategy_id!r}") from None
+
+    if not selected.universe and not selected.universe_type:
+        raise typer.BadParameter(f"Strategy {selected.id!r} missing universe")
+    return selected
+
+
+def _parse_grid(grid: list[str]) -> dict[str, list[object]]:
+    """
+    `--grid name=values` options as {name: values} (see `sweep.parse_grid_values`).
+    """
+    from paper_strategy_lab.backtest.sweep import parse_grid_values
+
+    param_grid: dict[str, list[object]] = {}
+    for item in grid:
+        name, sep, values = item.partition("=")
+        if not sep or not name.strip():
+            raise typer.BadParameter(f"Invalid --grid {item!r}; expected name=values")
+        try:
+            param_grid[name.strip()] = parse_grid_values(values)
+        except ValueError as e:
+            raise typer.BadParameter(f"Invalid --grid {item!r}: {e}") from None
+    return param_grid
+
+
+def _load_strategy_data(
+    selected: StrategySpec,
+    *,
+    start: str | None,
+    end: str | None,
+    years: int,
+    feature_store: bool = False,
+) -> tuple[list[str], MarketData]:
+    """
+    Resolve a spec's universe and load its prices plus the features its kind needs.
+    """
+    from paper_strategy_lab import feature_store as fs
+    from paper_strategy_lab.data_sources.sharadar import (
+        load_daily_metrics,
+        load_equity_prices,
+        load_prices,
+    )
+    from paper_strategy_lab.market_data import MarketData
+    from paper_strategy_lab.universe.sharadar_universe import (
+        DynamicUniverse,
+        build_us_equities_liquid,
+        build_us_equities_liquid_pit,
+        universe_kwargs_from_config,
+    )
+
+    tickers = selected.universe
+    dynamic: DynamicUniverse | None = None
+    if not tickers and selected.universe_type == "sharadar_us_equities_liquid":
+        universe_kwargs = universe_kwargs_from_config(selected.universe_config)
+        if selected.universe_config.get("point_in_time", False):
+            dynamic = build_us_equities_liquid_pit(start=start, end=end, **universe_kwargs)
+            tickers = dynamic.tickers
+        else:
+            tickers = build_us_equities_liquid(start=start, end=end, **universe_kwargs)
+
+    if dynamic is not None:
+        prices = dynamic.prices
+    elif selected.universe_type == "sharadar_us_equities_liquid":
+        prices = load_equity_prices(tickers, start=start, end=end)
+    else:
+        prices = load_prices(tickers, start=start, end=end)
+    if prices.empty:
+        raise typer.BadParameter(f"No prices found for {tickers}")
+
+    if start is None:
+        # Trailing N trading days window; use a simple 252*years convention.
+        n = 252 * years
+        if len(prices) > n:
+            prices = prices.iloc[-n:]
+
+    features = {}
+    if dynamic is not None:
+        features["universe_mask"] = dynamic.membership.reindex(
+            index=prices.index, columns=prices.columns, fill_value=False
+        )
+    if selected.kind in {"equity_value", "equity_multifactor"}:
+        value_field = str(selected.params.get("value_field", "pe"))
+        features[value_field] = (
+            load_daily_metrics(tickers, fields=[value_field], start=start, end=end)[value_field]
+            .reindex(prices.index)
+            .ffill()
+        )
+    if selected.kind == "equity_residual_momentum":
+        features["benchmark_spy"] = load_prices(["SPY"], start=start, end=end).reindex(prices.index)
+
+    store = fs.feature_store() if feature_store else None
+    return tickers, MarketData(prices=prices, features=features, store=store)
+
+
 @app.command("extract-text")
 def extract_text(
     pdf: Path = typer.Argument(..., exists=True, dir_okay=False, readable=True),
     out: Path = typer.Option(..., "--out", dir_okay=False),
+    workers: int = typer.Option(1, "--workers", min=1, help="Extract page ranges in N processes"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Re-extract every page instead of reusing the page cache"
+    ),
 ) -> None:
     """
     Extract per-page text from a PDF into JSONL: {"page_index": int, "text": str}.
     """
+    from paper_strategy_lab.pdf_text import iter_pages
+
     out.parent.mkdir(parents=True, exist_ok=True)
 
-    pages = extract_pages(pdf)
+    n = 0
     with out.open("w", encoding="utf-8") as f:
-        for page in pages:
+        for page in iter_pages(pdf, workers=workers, cache=not no_cache):
             f.write(
                 json.dumps({"page_index": page.page_index, "text": page.text}, ensure_ascii=False)
             )
             f.write("\n")
+            n += 1
 
-    console.print(f"Wrote {len(pages)} pages -> {out}")
+    console.print(f"Wrote {n} pages -> {out}")
 
 
 @app.command("extract-strategy-candidates")
 def extract_strategy_candidates(
-    pages_jsonl: Path = typer.Argument(..., exists=True, dir_okay=False, readable=True),
+    pages_jsonl: Path = typer.Argument(
+        ...,
+        exists=True,
+        dir_okay=False,
+        readable=True,
+        help="Pages JSONL from extract-text, or the PDF itself (pages come from the page cache)",
+    ),
     out: Path = typer.Option(..., "--out", dir_okay=False),
+    workers: int = typer.Option(1, "--workers", min=1, help="PDF input: extract in N processes"),
 ) -> None:
     """
     Heuristically extract likely strategy blocks from extracted page text.
     """
+    from paper_strategy_lab.strategy_candidates import (
+        extract_candidates_from_page,
+        extract_candidates_from_pages_jsonl,
+    )
+
     out.parent.mkdir(parents=True, exist_ok=True)
-    candidates = extract_candidates_from_pages_jsonl(pages_jsonl)
+    if pages_jsonl.suffix.lower() == ".pdf":
+        from paper_strategy_lab.pdf_text import iter_pages
+
+        candidates = [
+            c
+            for page in iter_pages(pages_jsonl, workers=workers)
+            for c in extract_candidates_from_page(page.page_index, page.text)
+        ]
+    else:
+        candidates = extract_candidates_from_pages_jsonl(pages_jsonl)
 
     with out.open("w", encoding="utf-8") as f:
         for c in candidates:
@@ -91,6 +257,8 @@ def list_strategies(
     """
     List YAML-defined strategies (once you encode them from the paper).
     """
+    from paper_strategy_lab.strategies.yaml_loader import load_strategy_specs
+
     strategies = load_strategy_specs(spec)
     if limit is not None:
         strategies = strategies[:limit]
@@ -110,6 +278,185 @@ def list_strategies(
     console.print(table)
 
 
+@app.command("ingest")
+def ingest(
+    tables: list[str] | None = typer.Argument(
+        None, help="Tables to ingest: SEP, SFP, DAILY (default: all three)"
+    ),
+    sharadar_dir: Path | None = typer.Option(None, "--sharadar-dir", file_okay=False),
+    store_dir: Path | None = typer.Option(
+        None, "--store-dir", file_okay=False, help="Defaults to SHARADAR_STORE_DIR or tmp/_store"
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Append only rows past each table's watermark (new dates or newer lastupdated)",
+    ),
+    delta: list[Path] | None = typer.Option(
+        None,
+        "--delta",
+        exists=True,
+        dir_okay=False,
+        help="Upsert the rows of a Sharadar update CSV into its table (repeatable)",
+    ),
+    compact: bool = typer.Option(
+        False, "--compact", help="Fold appended delta segments back into each table"
+    ),
+) -> None:
+    """
+    Convert Sharadar CSVs once into the columnar store used by the price/DAILY loaders.
+    """
+    from paper_strategy_lab.data_sources.sharadar import resolve_paths
+    from paper_strategy_lab.data_sources.sharadar_store import (
+        StoreInfo,
+        apply_delta_csv,
+        compact_table,
+        ingest_csv,
+    )
+
+    paths = resolve_paths(sharadar_dir)
+    selected = [t.strip().upper() for t in tables] if tables else list(paths.tables)
+    unknown = sorted(set(selected) - set(paths.tables))
+    if unknown:
+        raise typer.BadParameter(f"Unknown tables {unknown}; expected {sorted(paths.tables)}")
+
+    table = Table(title=f"Ingest: {paths.root}")
+    table.add_column("table", style="cyan", no_wrap=True)
+    table.add_column("source")
+    table.add_column("rows", justify="right")
+    table.add_column("tickers", justify="right")
+    table.add_column("dates")
+    table.add_column("deltas", justify="right")
+    table.add_column("seconds", justify="right")
+
+    jobs: list[tuple[str, Callable[[], StoreInfo]]] = []
+    if delta:
+        # Update files are matched to their table by name unless a single table is given.
+        target = selected[0] if tables and len(selected) == 1 else None
+        for p in delta:
+            jobs.append((p.name, partial(apply_delta_csv, p, table=target, store_dir=store_dir)))
+    elif compact:
+        for name in selected:
+            jobs.append((name, partial(compact_table, name, store_dir=store_dir)))
+    else:
+        for name in selected:
+            csv_path = paths.tables[name]
+            job = partial(ingest_csv, csv_path, store_dir=store_dir, incremental=incremental)
+            jobs.append((csv_path.name, job))
+
+    for source, job in jobs:
+        t0 = time.perf_counter()
+        try:
+            info = job()
+        except (FileNotFoundError, ValueError) as e:
+            raise typer.BadParameter(str(e)) from e
+        table.add_row(
+            info.table,
+            source,
+            f"{info.rows:,}",
+            f"{info.tickers:,}",
+            f"{info.first_date} .. {info.last_date}",
+            str(info.deltas),
+            f"{time.perf_counter() - t0:.1f}",
+        )
+    console.print(table)
+
+
+cache_app = typer.Typer(no_args_is_help=True, help="Inspect and trim the result cache.")
+app.add_typer(cache_app, name="cache")
+
+
+@cache_app.command("ls")
+def cache_ls(
+    cache_dir: Path | None = typer.Option(
+        None,
+        "--cache-dir",
+        file_okay=False,
+        help="Defaults to PAPER_STRATEGY_LAB_CACHE_DIR or tmp/_cache",
+    ),
+    prefix: str | None = typer.Option(
+        None, "--prefix", help="Only entries of this kind (e.g. prices_closeadj, feature)"
+    ),
+) -> None:
+    """
+    List cache entries, least recently used first.
+    """
+    from paper_strategy_lab.cache import ResultCache
+
+    cache = ResultCache(cache_dir)
+    entries = cache.entries(prefix)
+    table = Table(title=f"Cache: {cache.root}")
+    table.add_column("entry", style="cyan", no_wrap=True)
+    table.add_column("kind")
+    table.add_column("MB", justify="right")
+    table.add_column("hits", justify="right")
+    table.add_column("last used")
+    for e in entries:
+        last_used = e.last_used or e.created
+        table.add_row(
+            e.name[: len(e.prefix) + 13],
+            e.kind,
+            f"{e.bytes / 1024**2:.1f}",
+            str(e.hits),
+            time.strftime("%Y-%m-%d %H:%M", time.localtime(last_used)),
+        )
+    console.print(table)
+    total = sum(e.bytes for e in entries)
+    console.print(
+        f"{len(entries)} entries, {total / 1024**2:.1f} MB of {cache.max_bytes / 1024**2:.0f} MB, "
+        f"{sum(e.hits for e in entries)} hits"
+    )
+
+
+@cache_app.command("prune")
+def cache_prune(
+    max_mb: float | None = typer.Option(
+        None, "--max-mb", min=0.0, help="Target size (default: the configured cache cap)"
+    ),
+    cache_dir: Path | None = typer.Option(
+        None,
+        "--cache-dir",
+        file_okay=False,
+        help="Defaults to PAPER_STRATEGY_LAB_CACHE_DIR or tmp/_cache",
+    ),
+) -> None:
+    """
+    Evict least-recently-used entries until the cache fits the size cap.
+    """
+    from paper_strategy_lab.cache import ResultCache
+
+    cache = ResultCache(cache_dir)
+    limit = cache.max_bytes if max_mb is None else int(max_mb * 1024**2)
+    removed = cache.prune(limit)
+    freed = sum(e.bytes for e in removed)
+    left = sum(e.bytes for e in cache.entries())
+    console.print(
+        f"Evicted {len(removed)} entries ({freed / 1024**2:.1f} MB) from {cache.root}; "
+        f"{left / 1024**2:.1f} MB left"
+    )
+
+
+@cache_app.command("clear")
+def cache_clear(
+    cache_dir: Path | None = typer.Option(
+        None,
+        "--cache-dir",
+        file_okay=False,
+        help="Defaults to PAPER_STRATEGY_LAB_CACHE_DIR or tmp/_cache",
+    ),
+    prefix: str | None = typer.Option(
+        None, "--prefix", help="Only entries of this kind (e.g. prices_closeadj, feature)"
+    ),
+) -> None:
+    """
+    Remove every cache entry (or every entry of one kind).
+    """
+    from paper_strategy_lab.cache import ResultCache
+
+    cache = ResultCache(cache_dir)
+    console.print(f"Removed {cache.clear(prefix)} entries from {cache.root}")
+
+
 @app.command("backtest")
 def backtest(
     spec: Path = typer.Argument(..., exists=True, dir_okay=False, readable=True),
@@ -119,74 +466,64 @@ def backtest(
     end: str | None = typer.Option(None, "--end", help="YYYY-MM-DD"),
     fee_bps: float = typer.Option(0.0, "--fee-bps", min=0.0),
     slippage_bps: float = typer.Option(0.0, "--slippage-bps", min=0.0),
+    compact: bool = typer.Option(
+        False, "--compact", help="Load price/feature panels as float32 (half the memory)"
+    ),
+    feature_store: bool = typer.Option(
+        False,
+        "--feature-store",
+        help="Persist factor panels (momentum, volatility, residuals) in the result cache and "
+        "reuse them on later runs",
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Print per-stage timings, rows scanned and cache hits"
+    ),
+    trace: Path | None = typer.Option(
+        None, "--trace", dir_okay=False, help="Write a Chrome trace JSON (implies --profile)"
+    ),
 ) -> None:
     """
     Run a long-only portfolio backtest for a YAML-defined strategy using Sharadar prices.
     """
-    try:
-        strategies = load_strategy_specs(spec)
-        selected = next(s for s in strategies if s.id == strategy_id)
-    except StopIteration:
-        raise typer.BadParameter(f"Unknown strategy_id={strategy_id!r}") from None
+    from paper_strategy_lab.backtest.metrics import (
+        annualized_return,
+        annualized_volatility,
+        calmar_ratio,
+        max_drawdown,
+        sharpe_ratio,
+        sortino_ratio,
+    )
+    from paper_strategy_lab.backtest.portfolio import run_portfolio_backtest
+    from paper_strategy_lab.profiling import span
+    from paper_strategy_lab.strategies.runner import run_strategy_weights
 
-    if not selected.universe and not selected.universe_type:
-        raise typer.BadParameter(f"Strategy {selected.id!r} missing universe")
+    _use_compact_panels(compact)
+    selected = _select_strategy(spec, strategy_id)
 
-    try:
-        tickers = selected.universe
-        if not tickers and selected.universe_type == "sharadar_us_equities_liquid":
-            tickers = build_us_equities_liquid(
-                start=start,
-                end=end,
-                max_tickers=int(selected.universe_config.get("max_tickers", 500)),
-                min_price=float(selected.universe_config.get("min_price", 5.0)),
-                exchanges=list(selected.universe_config.get("exchanges", ["NYSE", "NASDAQ"])),
+    with _profile_run(profile, trace):
+        try:
+            tickers, data = _load_strategy_data(
+                selected, start=start, end=end, years=years, feature_store=feature_store
             )
-
-        prices = (
-            load_equity_prices(tickers, start=start, end=end)
-            if selected.universe_type == "sharadar_us_equities_liquid"
-            else load_prices(tickers, start=start, end=end)
-        )
-        if prices.empty:
-            raise typer.BadParameter(f"No prices found for {tickers}")
-
-        if start is None:
-            # Trailing N trading days window; use a simple 252*years convention.
-            n = 252 * years
-            if len(prices) > n:
-                prices = prices.iloc[-n:]
-
-        features = {}
-        if selected.kind in {"equity_value", "equity_multifactor"}:
-            value_field = str(selected.params.get("value_field", "pe"))
-            features[value_field] = load_daily_metrics(
-                tickers, fields=[value_field], start=start, end=end
-            )[value_field].reindex(prices.index).ffill()
-        if selected.kind == "equity_residual_momentum":
-            features["benchmark_spy"] = load_prices(["SPY"], start=start, end=end).reindex(
-                prices.index
+            prices = data.prices
+            weights = run_strategy_weights(data=data, spec=selected)
+            result = run_portfolio_backtest(
+                prices=prices, weights=weights, fee_bps=fee_bps, slippage_bps=slippage_bps
             )
+        except ImportError:
+            console.print(
+                "Missing deps. Install with: `uv sync --all-extras` "
+                "(or `uv pip install -e '.[analysis,dev]'`)."
+            )
+            raise typer.Exit(code=1) from None
 
-        weights = run_strategy_weights(
-            data=MarketData(prices=prices, features=features), spec=selected
-        )
-        result = run_portfolio_backtest(
-            prices=prices, weights=weights, fee_bps=fee_bps, slippage_bps=slippage_bps
-        )
-    except ImportError:
-        console.print(
-            "Missing deps. Install with: `uv sync --all-extras` "
-            "(or `uv pip install -e '.[analysis,dev]'`)."
-        )
-        raise typer.Exit(code=1) from None
-
-    cagr = annualized_return(result.daily_returns)
-    vol = annualized_volatility(result.daily_returns)
-    sharpe = sharpe_ratio(result.daily_returns)
-    sortino = sortino_ratio(result.daily_returns)
-    calmar = calmar_ratio(result.daily_returns)
-    mdd = max_drawdown(result.equity_curve)
+        with span("metrics.summary"):
+            cagr = annualized_return(result.daily_returns)
+            vol = annualized_volatility(result.daily_returns)
+            sharpe = sharpe_ratio(result.daily_returns)
+            sortino = sortino_ratio(result.daily_returns)
+            calmar = calmar_ratio(result.daily_returns)
+            mdd = max_drawdown(result.equity_curve)
 
     universe = (
         ",".join(selected.universe)
@@ -203,6 +540,335 @@ def backtest(
     table.add_row("Calmar", f"{calmar:.2f}")
     table.add_row("Max drawdown", f"{mdd:.2%}")
     console.print(table)
+    console.print(peak_memory_summary(), style="dim")
+
+
+@app.command("paper-trade")
+def paper_trade(
+    spec: Path = typer.Argument(..., exists=True, dir_okay=False, readable=True),
+    strategy_id: str = typer.Argument(...),
+    state: Path | None = typer.Option(
+        None, "--state", dir_okay=False, help="State file (default: tmp/live/<strategy_id>.npz)"
+    ),
+    years: int = typer.Option(5, "--years", min=1, help="Warm-up history for a new state"),
+    start: str | None = typer.Option(None, "--start", help="Warm-up start, YYYY-MM-DD"),
+    end: str | None = typer.Option(None, "--end", help="YYYY-MM-DD"),
+    fee_bps: float = typer.Option(0.0, "--fee-bps", min=0.0),
+    slippage_bps: float = typer.Option(0.0, "--slippage-bps", min=0.0),
+) -> None:
+    """
+    Advance a daily paper-trading run by the bars since its last update.
+
+    The first run warms the state up on the history window; later runs load the state file and
+    only process the new bars (fees and lag are fixed when the state is created).
+    """
+    import pandas as pd
+
+    from paper_strategy_lab.backtest.live import LiveStrategy, live_kinds
+    from paper_strategy_lab.data_sources.sharadar import load_equity_prices, load_prices
+
+    selected = _select_strategy(spec, strategy_id)
+    if selected.kind not in live_kinds():
+        raise typer.BadParameter(
+            f"Strategy kind={selected.kind!r} has no incremental runner; supported: {live_kinds()}"
+        )
+    if selected.universe_config.get("point_in_time", False):
+        raise typer.BadParameter("Point-in-time universes are not supported by paper-trade")
+    state_path = state or project_root() / "tmp" / "live" / f"{selected.id}.npz"
+
+    if state_path.exists():
+        live = LiveStrategy.load(state_path)
+        if live.kind != selected.kind or live.params != selected.params:
+            raise typer.BadParameter(
+                f"{state_path} was created for different strategy params; delete it to restart"
+            )
+        assert live.last_date is not None
+        since = str((live.last_date + pd.Timedelta(days=1)).date())
+        loader = (
+            load_equity_prices
+            if selected.universe_type == "sharadar_us_equities_liquid"
+            else load_prices
+        )
+        prices = loader(live.columns, start=since, end=end)
+    else:
+        _, data = _load_strategy_data(selected, start=start, end=end, years=years)
+        prices = data.prices
+        live = LiveStrategy(
+            str(selected.kind),
+            selected.params,
+            [str(c) for c in prices.columns],
+            fee_bps=fee_bps,
+            slippage_bps=slippage_bps,
+        )
+
+    t0 = time.perf_counter()
+    bars = live.run(prices)
+    elapsed = time.perf_counter() - t0
+    if not bars:
+        last_date = live.last_date.date() if live.last_date is not None else None
+        console.print(f"No new bars after {last_date}; state unchanged.")
+        return
+    live.save(state_path)
+
+    last, m = bars[-1], live.metrics
+    table = Table(title=f"Paper trade: {selected.id} as of {last.date.date()}")
+    table.add_column("metric", style="cyan", no_wrap=True)
+    table.add_column("value", style="bold")
+    table.add_row("Bars processed", f"{len(bars)} ({elapsed:.2f}s)")
+    table.add_row("Daily return", f"{last.daily_return:.2%}")
+    table.add_row("Equity", f"{last.equity:.4f}")
+    table.add_row("CAGR", f"{m.annualized_return():.2%}")
+    table.add_row("Sharpe", f"{m.sharpe_ratio():.2f}")
+    table.add_row("Sortino", f"{m.sortino_ratio():.2f}")
+    table.add_row("Max drawdown", f"{m.max_drawdown():.2%}")
+    console.print(table)
+
+    held = pd.Series(last.weights[last.weights > 0]).sort_values(ascending=False)
+    console.print(
+        "Target weights: "
+        + (", ".join(f"{t} {w:.1%}" for t, w in held.items()) if len(held) else "(flat)")
+    )
+    console.print(f"State saved -> {state_path}", style="dim")
+
+
+@app.command("sweep")
+def sweep(
+    spec: Path = typer.Argument(..., exists=True, dir_okay=False, readable=True),
+    strategy_id: str = typer.Argument(...),
+    grid: list[str] = typer.Option(
+        ...,
+        "--grid",
+        help="Param grid, repeatable: name=a,b,c or name=start:stop:step (stop inclusive)",
+    ),
+    years: int = typer.Option(5, "--years", min=1),
+    start: str | None = typer.Option(None, "--start", help="YYYY-MM-DD (overrides --years)"),
+    end: str | None = typer.Option(None, "--end", help="YYYY-MM-DD"),
+    fee_bps: float = typer.Option(0.0, "--fee-bps", min=0.0),
+    slippage_bps: float = typer.Option(0.0, "--slippage-bps", min=0.0),
+    sort_by: str = typer.Option("sharpe", "--sort", help="Sort by: sharpe|sortino|calmar|cagr"),
+    top: int = typer.Option(20, "--top", min=1, help="Rows to print"),
+    out_csv: Path | None = typer.Option(None, "--out-csv", dir_okay=False),
+    workers: int = typer.Option(
+        1, "--workers", min=1, help="Evaluate grid points in N processes (panels shared in memory)"
+    ),
+    compact: bool = typer.Option(
+        False, "--compact", help="Load price/feature panels as float32 (half the memory)"
+    ),
+    feature_store: bool = typer.Option(
+        False,
+        "--feature-store",
+        help="Persist factor panels (momentum, volatility, residuals) in the result cache and "
+        "reuse them on later runs",
+    ),
+) -> None:
+    """
+    Backtest a strategy over a grid of its `params`, sharing indicators across grid points.
+    """
+    from paper_strategy_lab.backtest.sweep import run_param_sweep, summarize_sweep
+
+    _use_compact_panels(compact)
+    selected = _select_strategy(spec, strategy_id)
+
+    param_grid = _parse_grid(grid)
+
+    sort_by = sort_by.strip().lower()
+    valid_sorts = {"sharpe", "sortino", "calmar", "cagr"}
+    if sort_by not in valid_sorts:
+        raise typer.BadParameter(
+            f"Invalid --sort={sort_by!r}; expected one of {sorted(valid_sorts)}"
+        )
+
+    _, data = _load_strategy_data(
+        selected, start=start, end=end, years=years, feature_store=feature_store
+    )
+    t0 = time.perf_counter()
+    result = run_param_sweep(
+        data,
+        selected,
+        param_grid,
+        fee_bps=fee_bps,
+        slippage_bps=slippage_bps,
+        workers=workers,
+    )
+    elapsed = time.perf_counter() - t0
+
+    df = summarize_sweep(result)
+    if df.empty:
+        console.print("No valid grid points (check parameter constraints).")
+        raise typer.Exit(code=1)
+    df = df.sort_values(sort_by, ascending=False)
+
+    table = Table(title=f"Sweep: {selected.id} ({len(df)} points, {elapsed:.2f}s)")
+    for name in param_grid:
+        table.add_column(name, style="cyan")
+    for col in ["sharpe", "sortino", "calmar", "cagr", "maxdd", "avg_turnover"]:
+        table.add_column(col)
+    for _, r in df.head(top).iterrows():
+        table.add_row(
+            *(str(r[name]) for name in param_grid),
+            f"{float(r['sharpe']):.2f}",
+            f"{float(r['sortino']):.2f}",
+            f"{float(r['calmar']):.2f}",
+            f"{float(r['cagr']):.2%}",
+            f"{float(r['maxdd']):.2%}",
+            f"{float(r['avg_turnover']):.2f}",
+        )
+    console.print(table)
+    console.print(peak_memory_summary(), style="dim")
+
+    if out_csv is not None:
+        out_csv.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(out_csv, index=False)
+        console.print(f"Wrote {len(df)} rows -> {out_csv}")
+
+
+@app.command("walk-forward")
+def walk_forward(
+    spec: Path = typer.Argument(..., exists=True, dir_okay=False, readable=True),
+    strategy_id: str = typer.Argument(...),
+    grid: list[str] = typer.Option(
+        ...,
+        "--grid",
+        help="Param grid, repeatable: name=a,b,c or name=start:stop:step (stop inclusive)",
+    ),
+    train_days: int = typer.Option(756, "--train-days", min=1, help="Train window (rows)"),
+    test_days: int = typer.Option(
+        21, "--test-days", min=1, help="Test window and step between folds (rows)"
+    ),
+    metric: str = typer.Option(
+        "sharpe", "--metric", help="Select params by: sharpe|sortino|calmar|cagr"
+    ),
+    years: int = typer.Option(5, "--years", min=1),
+    start: str | None = typer.Option(None, "--start", help="YYYY-MM-DD (overrides --years)"),
+    end: str | None = typer.Option(None, "--end", help="YYYY-MM-DD"),
+    fee_bps: float = typer.Option(0.0, "--fee-bps", min=0.0),
+    slippage_bps: float = typer.Option(0.0, "--slippage-bps", min=0.0),
+    show_folds: int = typer.Option(12, "--show-folds", min=0, help="Last N folds to print"),
+    out_csv: Path | None = typer.Option(
+        None, "--out-csv", dir_okay=False, help="Write one row per fold"
+    ),
+    out_returns: Path | None = typer.Option(
+        None, "--out-returns", dir_okay=False, help="Write the stitched out-of-sample returns"
+    ),
+    workers: int = typer.Option(
+        1, "--workers", min=1, help="Evaluate grid points in N processes (panels shared in memory)"
+    ),
+    compact: bool = typer.Option(
+        False, "--compact", help="Load price/feature panels as float32 (half the memory)"
+    ),
+    feature_store: bool = typer.Option(
+        False,
+        "--feature-store",
+        help="Persist factor panels (momentum, volatility, residuals) in the result cache and "
+        "reuse them on later runs",
+    ),
+) -> None:
+    """
+    Re-select a strategy's `params` on rolling train windows and report out-of-sample results.
+    """
+    from paper_strategy_lab.backtest.metrics import compute_all_metrics
+    from paper_strategy_lab.backtest.walk_forward import SELECTION_METRICS, run_walk_forward
+
+    _use_compact_panels(compact)
+    selected = _select_strategy(spec, strategy_id)
+    param_grid = _parse_grid(grid)
+    metric = metric.strip().lower()
+    if metric not in SELECTION_METRICS:
+        raise typer.BadParameter(
+            f"Invalid --metric={metric!r}; expected one of {list(SELECTION_METRICS)}"
+        )
+
+    _, data = _load_strategy_data(
+        selected, start=start, end=end, years=years, feature_store=feature_store
+    )
+    t0 = time.perf_counter()
+    try:
+        result = run_walk_forward(
+            data,
+            selected,
+            param_grid,
+            train_days=train_days,
+            test_days=test_days,
+            metric=metric,
+            fee_bps=fee_bps,
+            slippage_bps=slippage_bps,
+            workers=workers,
+        )
+    except ValueError as e:
+        console.print(f"Walk-forward not possible: {e}")
+        raise typer.Exit(code=1) from None
+    elapsed = time.perf_counter() - t0
+
+    folds = result.folds
+    oos = {
+        k: float(v[0])
+        for k, v in compute_all_metrics(
+            result.daily_returns,
+            turnover=result.turnover.to_numpy(),
+            exposure=result.exposure.to_numpy(),
+        ).items()
+    }
+    # The single grid point that did best over the same out-of-sample dates, in hindsight.
+    span_rets = result.sweep.daily_returns.loc[result.daily_returns.index]
+    fixed = compute_all_metrics(span_rets)
+    best = int(fixed[metric].argmax())
+    hindsight = {k: float(v[best]) for k, v in fixed.items()}
+    best_params = ", ".join(f"{k}={result.sweep.params[best][k]}" for k in param_grid)
+
+    table = Table(
+        title=(
+            f"Walk-forward: {selected.id} ({len(folds)} folds of {test_days}d after "
+            f"{train_days}d train, {len(result.sweep.params)} points, {elapsed:.2f}s)"
+        )
+    )
+    table.add_column("", style="cyan")
+    for col in ["sharpe", "sortino", "calmar", "cagr", "vol", "maxdd"]:
+        table.add_column(col)
+    for label, m in [
+        ("out-of-sample", oos),
+        (f"best fixed in hindsight ({best_params})", hindsight),
+    ]:
+        table.add_row(
+            label,
+            f"{m['sharpe']:.2f}",
+            f"{m['sortino']:.2f}",
+            f"{m['calmar']:.2f}",
+            f"{m['cagr']:.2%}",
+            f"{m['vol']:.2%}",
+            f"{m['maxdd']:.2%}",
+        )
+    console.print(table)
+    console.print(
+        f"Out-of-sample {folds['test_start'].iloc[0]} .. {folds['test_end'].iloc[-1]}; "
+        f"avg exposure {oos['avg_exposure']:.2f}, "
+        f"avg turnover {oos['avg_turnover']:.2f}."
+    )
+
+    if show_folds:
+        fold_table = Table(title=f"Last {min(show_folds, len(folds))} folds")
+        for col in ["test_start", "test_end", *param_grid]:
+            fold_table.add_column(col, style="cyan" if col in param_grid else None)
+        fold_table.add_column(f"train_{metric}")
+        fold_table.add_column("test_return")
+        for _, r in folds.tail(show_folds).iterrows():
+            fold_table.add_row(
+                str(r["test_start"]),
+                str(r["test_end"]),
+                *(str(r[name]) for name in param_grid),
+                f"{float(r[f'train_{metric}']):.2f}",
+                f"{float(r['test_return']):.2%}",
+            )
+        console.print(fold_table)
+    console.print(peak_memory_summary(), style="dim")
+
+    if out_csv is not None:
+        out_csv.parent.mkdir(parents=True, exist_ok=True)
+        folds.to_csv(out_csv, index=False)
+        console.print(f"Wrote {len(folds)} folds -> {out_csv}")
+    if out_returns is not None:
+        out_returns.parent.mkdir(parents=True, exist_ok=True)
+        result.daily_returns.rename("daily_return").to_csv(out_returns, index_label="date")
+        console.print(f"Wrote {len(result.daily_returns)} daily returns -> {out_returns}")
 
 
 @app.command("leaderboard")
@@ -220,6 +886,34 @@ def leaderboard(
     ),
     out_csv: Path | None = typer.Option(None, "--out-csv", dir_okay=False),
     out_md: Path | None = typer.Option(None, "--out-md", dir_okay=False),
+    workers: int = typer.Option(
+        1, "--workers", min=1, help="Backtest specs in N processes (panels shared in memory)"
+    ),
+    compact: bool = typer.Option(
+        False, "--compact", help="Load price/feature panels as float32 (half the memory)"
+    ),
+    feature_store: bool = typer.Option(
+        False,
+        "--feature-store",
+        help="Persist factor panels (momentum, volatility, residuals) in the result cache and "
+        "reuse them on later runs",
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Print per-stage timings, rows scanned and cache hits"
+    ),
+    trace: Path | None = typer.Option(
+        None, "--trace", dir_okay=False, help="Write a Chrome trace JSON (implies --profile)"
+    ),
+    bootstrap: int = typer.Option(
+        0,
+        "--bootstrap",
+        min=0,
+        help="Block-bootstrap N resamples for metric confidence intervals (0 = off)",
+    ),
+    block_days: int = typer.Option(21, "--block-days", min=1, help="Bootstrap block length"),
+    confidence: float = typer.Option(
+        0.9, "--confidence", min=0.5, max=0.999, help="Bootstrap interval coverage"
+    ),
 ) -> None:
     """
     Backtest all strategies in a spec file and print a Sharpe-ranked leaderboard.
@@ -230,152 +924,34 @@ def leaderboard(
         console.print("Missing deps. Install with: `uv sync --all-extras`.")
         raise typer.Exit(code=1) from None
 
-    specs = load_strategy_specs(spec)
-
-    bench_px_full = load_prices(["SPY"], start=start, end=end).dropna()
-
-    universe_cache: dict[tuple[object, ...], list[str]] = {}
-    prices_cache: dict[tuple[object, ...], pd.DataFrame] = {}
-    daily_cache: dict[tuple[object, ...], pd.DataFrame] = {}
-
-    rows: list[dict[str, object]] = []
-    for s in specs:
-        tickers = s.universe
-        if not tickers and s.universe_type == "sharadar_us_equities_liquid":
-            universe_key = (
-                s.universe_type,
-                start or "",
-                end or "",
-                int(s.universe_config.get("max_tickers", 500)),
-                float(s.universe_config.get("min_price", 5.0)),
-                tuple(s.universe_config.get("exchanges", ["NYSE", "NASDAQ"])),
-            )
-            cached_universe = universe_cache.get(universe_key)
-            if cached_universe is None:
-                cached_universe = build_us_equities_liquid(
-                    start=start,
-                    end=end,
-                    max_tickers=int(s.universe_config.get("max_tickers", 500)),
-                    min_price=float(s.universe_config.get("min_price", 5.0)),
-                    exchanges=list(s.universe_config.get("exchanges", ["NYSE", "NASDAQ"])),
-                )
-                universe_cache[universe_key] = cached_universe
-            tickers = cached_universe
-
-        if not tickers:
-            continue
-
-        if s.universe_type == "sharadar_us_equities_liquid":
-            px_key = ("equity_px", start or "", end or "", tuple(tickers))
-            cached_px = prices_cache.get(px_key)
-            if cached_px is None:
-                cached_px = load_equity_prices(tickers, start=start, end=end)
-                prices_cache[px_key] = cached_px
-            px_full = cached_px
-        else:
-            px_full = load_prices(tickers, start=start, end=end)
-
-        if px_full.empty:
-            continue
-
-        if start is None:
-            n = 252 * years
-            if len(px_full) > n:
-                px_full = px_full.iloc[-n:]
-
-        px_full = px_full.sort_index().dropna(how="all")
-        px_full = px_full.dropna(axis=1, how="all")
-        if px_full.empty:
-            continue
-        common_index = px_full.index.intersection(bench_px_full.index)
-        if len(common_index) < 252:
-            continue
-
-        px = px_full.loc[common_index]
-        bench_px = bench_px_full.loc[common_index]
-
-        features = {}
-        if s.kind in {"equity_value", "equity_multifactor"}:
-            value_field = str(s.params.get("value_field", "pe"))
-            daily_key = ("daily", value_field, start or "", end or "", tuple(tickers))
-            daily = daily_cache.get(daily_key)
-            if daily is None:
-                daily = load_daily_metrics(tickers, fields=[value_field], start=start, end=end)[
-                    value_field
-                ]
-                daily_cache[daily_key] = daily
-            features[value_field] = daily.reindex(px.index).ffill()
-        if s.kind == "equity_residual_momentum":
-            features["benchmark_spy"] = bench_px.reindex(px.index)
-
-        w = run_strategy_weights(data=MarketData(prices=px, features=features), spec=s)
-        avg_exposure = float(w.shift(1).fillna(0.0).sum(axis=1).mean())
-
-        bt = run_portfolio_backtest(
-            prices=px,
-            weights=w,
-            fee_bps=fee_bps,
-            slippage_bps=slippage_bps,
-        )
-        avg_turnover = float(bt.turnover.mean()) if len(bt.turnover) else 0.0
+    from paper_strategy_lab.backtest.bootstrap import BOOTSTRAP_METRICS, BootstrapConfig
+    from paper_strategy_lab.backtest.leaderboard import (
+        LeaderboardConfig,
+        prepare_leaderboard,
+        run_leaderboard,
+    )
+    from paper_strategy_lab.strategies.yaml_loader import load_strategy_specs
 
-        bench_w = pd.DataFrame(1.0, index=bench_px.index, columns=bench_px.columns)
-        bench_bt = run_portfolio_backtest(
-            prices=bench_px,
-            weights=bench_w,
-            fee_bps=fee_bps,
-            slippage_bps=slippage_bps,
-        )
-        bench_sharpe = sharpe_ratio(bench_bt.daily_returns)
-        bench_sortino = sortino_ratio(bench_bt.daily_returns)
-        bench_calmar = calmar_ratio(bench_bt.daily_returns)
-        bench_cagr = annualized_return(bench_bt.daily_returns)
-        bench_vol = annualized_volatility(bench_bt.daily_returns)
-        bench_maxdd = max_drawdown(bench_bt.equity_curve)
-
-        strat_sharpe = sharpe_ratio(bt.daily_returns)
-        strat_sortino = sortino_ratio(bt.daily_returns)
-        strat_calmar = calmar_ratio(bt.daily_returns)
-        strat_cagr = annualized_return(bt.daily_returns)
-        strat_vol = annualized_volatility(bt.daily_returns)
-        strat_maxdd = max_drawdown(bt.equity_curve)
-
-        rows.append(
-            {
-                "paper_section": s.paper_section or "",
-                "id": s.id,
-                "name": s.name,
-                "kind": s.kind,
-                "universe": (
-                    ",".join(s.universe)
-                    if s.universe
-                    else f"{s.universe_type}(n={len(tickers)})"
-                ),
-                "start_date": str(px.index.min())[:10],
-                "end_date": str(px.index.max())[:10],
-                "days": int(len(px)),
-                "sharpe": strat_sharpe,
-                "sortino": strat_sortino,
-                "calmar": strat_calmar,
-                "cagr": strat_cagr,
-                "vol": strat_vol,
-                "maxdd": strat_maxdd,
-                "avg_exposure": avg_exposure,
-                "avg_turnover": avg_turnover,
-                "bench_id": "bh-spy",
-                "bench_sharpe": bench_sharpe,
-                "bench_sortino": bench_sortino,
-                "bench_calmar": bench_calmar,
-                "bench_cagr": bench_cagr,
-                "bench_vol": bench_vol,
-                "bench_maxdd": bench_maxdd,
-                "sharpe_vs_bh": strat_sharpe - bench_sharpe,
-                "sortino_vs_bh": strat_sortino - bench_sortino,
-                "calmar_vs_bh": strat_calmar - bench_calmar,
-                "cagr_vs_bh": strat_cagr - bench_cagr,
-                "maxdd_vs_bh": strat_maxdd - bench_maxdd,
-            }
-        )
+    _use_compact_panels(compact)
+    specs = load_strategy_specs(spec)
+    bootstrap_config = (
+        BootstrapConfig(samples=bootstrap, block_days=block_days, confidence=confidence)
+        if bootstrap
+        else None
+    )
+    config = LeaderboardConfig(
+        start=start,
+        end=end,
+        years=years,
+        fee_bps=fee_bps,
+        slippage_bps=slippage_bps,
+        feature_store=feature_store,
+        bootstrap=bootstrap_config,
+    )
+    with _profile_run(profile, trace):
+        jobs, panels = prepare_leaderboard(specs, config)
+        rows = run_leaderboard(jobs, panels, config, workers=workers)
+    panel_mb = sum(int(p.memory_usage(deep=False).sum()) for p in panels.values()) / 1024**2
 
     df = pd.DataFrame(rows)
     if df.empty:
@@ -405,9 +981,21 @@ def leaderboard(
         "avg_exposure",
         "avg_turnover",
     ]
-    for col in table_cols:
+    # With --bootstrap: the interval of the sort metric (Sharpe when sorting by CAGR) and the
+    # probability of beating the benchmark on it.
+    ci_metric = sort_by if sort_by in BOOTSTRAP_METRICS else "sharpe"
+    ci_cols = [f"{ci_metric} {confidence:.0%} CI", "P(>bench)"] if bootstrap else []
+    for col in [*table_cols, *ci_cols]:
         table.add_column(col)
     for _, r in df.iterrows():
+        ci_cells = (
+            [
+                f"[{float(r[f'{ci_metric}_lo']):.2f}, {float(r[f'{ci_metric}_hi']):.2f}]",
+                f"{float(r[f'p_beat_{ci_metric}']):.0%}",
+            ]
+            if bootstrap
+            else []
+        )
         table.add_row(
             str(r["paper_section"]),
             str(r["id"]),
@@ -420,8 +1008,12 @@ def leaderboard(
             f"{float(r['sharpe_vs_bh']):+.2f}",
             f"{float(r['avg_exposure']):.2f}",
             f"{float(r['avg_turnover']):.2f}",
+            *ci_cells,
         )
     console.print(table)
+    console.print(
+        f"Loaded {len(panels)} panels ({panel_mb:,.0f} MB). {peak_memory_summary()}", style="dim"
+    )
 
     if out_csv is not None:
         out_csv.parent.mkdir(parents=True, exist_ok=True)
@@ -461,6 +1053,8 @@ def leaderboard(
             "cagr_vs_bh",
             "maxdd_vs_bh",
         ]
+        if bootstrap:
+            cols += [c for m in BOOTSTRAP_METRICS for c in (f"{m}_ci", f"p_beat_{m}")]
 
         fmt = df.copy()
         fmt["sharpe"] = fmt["sharpe"].map(lambda x: f"{float(x):.2f}")
@@ -482,6 +1076,14 @@ def leaderboard(
         fmt["calmar_vs_bh"] = fmt["calmar_vs_bh"].map(lambda x: f"{float(x):+.2f}")
         fmt["cagr_vs_bh"] = fmt["cagr_vs_bh"].map(lambda x: f"{float(x):+.2%}")
         fmt["maxdd_vs_bh"] = fmt["maxdd_vs_bh"].map(lambda x: f"{float(x):+.2%}")
+        if bootstrap:
+            for m in BOOTSTRAP_METRICS:
+                number = "{:.2%}" if m == "maxdd" else "{:.2f}"
+                fmt[f"{m}_ci"] = [
+                    f"[{number.format(float(lo))}, {number.format(float(hi))}]"
+                    for lo, hi in zip(fmt[f"{m}_lo"], fmt[f"{m}_hi"], strict=True)
+                ]
+                fmt[f"p_beat_{m}"] = fmt[f"p_beat_{m}"].map(lambda x: f"{float(x):.0%}")
 
         header = "| " + " | ".join(cols) + " |"
         sep = "|" + "|".join(["---"] * len(cols)) + "|"
@@ -510,6 +1112,12 @@ def leaderboard(
         md_lines.append(
             f"- Costs: fee={fee_bps} bps, slippage={slippage_bps} bps (applied to turnover)."
         )
+        if bootstrap:
+            md_lines.append(
+                f"- Confidence intervals: {confidence:.0%}, from {bootstrap} circular block "
+                f"bootstrap resamples of the daily returns ({block_days}-day blocks); "
+                "`p_beat_*` is the share of resamples beating the benchmark on the same path."
+            )
         md_lines.append("")
         md_lines.append(f"## Leaderboard ({sort_by.capitalize()}-ranked)")
         md_lines.append("")
@@ -519,3 +1127,103 @@ def leaderboard(
         out_md.parent.mkdir(parents=True, exist_ok=True)
         out_md.write_text("\n".join(md_lines), encoding="utf-8")
         console.print(f"Wrote {len(df)} rows -> {out_md}")
+
+
+@app.command("bench")
+def bench(
+    out: Path | None = typer.Option(None, "--out", dir_okay=False, help="Write the JSON report"),
+    baseline: Path | None = typer.Option(
+        None, "--baseline", exists=True, dir_okay=False, help="Compare against a JSON report"
+    ),
+    tolerance: float = typer.Option(
+        0.25, "--tolerance", min=0.0, help="Allowed slowdown vs --baseline (0.25 = 25%)"
+    ),
+    tickers: int = typer.Option(500, "--tickers", min=10, help="Synthetic equities"),
+    data_start: str = typer.Option("2015-01-01", "--data-start", help="Synthetic data start"),
+    data_end: str = typer.Option("2024-12-31", "--data-end", help="Synthetic data end"),
+    seed: int = typer.Option(0, "--seed"),
+    sharadar_dir: Path | None = typer.Option(
+        None, "--sharadar-dir", file_okay=False, help="Benchmark a real dump instead"
+    ),
+    spec: Path = typer.Option(
+        project_root() / "strategies" / "ssrn-3247865.yaml",
+        "--spec",
+        exists=True,
+        dir_okay=False,
+        help="Strategy file for the strategy/leaderboard cases",
+    ),
+    repeat: int = typer.Option(3, "--repeat", min=1),
+    only: str | None = typer.Option(None, "--only", help="Only cases whose name contains this"),
+) -> None:
+    """
+    Time the loaders, universe build, strategies, backtest and leaderboard on synthetic data.
+    """
+    from paper_strategy_lab.bench import (
+        BenchResult,
+        compare_to_baseline,
+        ensure_synthetic_data,
+        load_report,
+        run_bench,
+    )
+    from paper_strategy_lab.synthetic import SyntheticSpec
+
+    bench_root = project_root() / "tmp" / "_bench"
+    if sharadar_dir is None:
+        synthetic = SyntheticSpec(n_equities=tickers, start=data_start, end=data_end, seed=seed)
+        console.print(f"Synthetic data: {synthetic.name}", style="dim")
+        data_dir = ensure_synthetic_data(bench_root, synthetic)
+    else:
+        data_dir = sharadar_dir
+
+    base = load_report(baseline) if baseline is not None else None
+    base_results: dict = base["results"] if base is not None else {}  # type: ignore[assignment]
+
+    table = Table(title=f"Bench ({data_dir.name}, best of {repeat})")
+    table.add_column("case", style="cyan", no_wrap=True)
+    table.add_column("best", justify="right")
+    table.add_column("mean", justify="right")
+    if base is not None:
+        table.add_column("baseline", justify="right")
+        table.add_column("ratio", justify="right")
+
+    def add_row(r: BenchResult) -> None:
+        row = [r.name, f"{r.best * 1e3:,.1f} ms", f"{r.mean * 1e3:,.1f} ms"]
+        if base is not None:
+            prev = base_results.get(r.name)
+            if prev is None:
+                row += ["-", "-"]
+            else:
+                ratio = r.best / float(prev["best"]) if float(prev["best"]) > 0 else float("inf")
+                text = f"{ratio:.2f}x"
+                if ratio > 1.0 + tolerance:
+                    text = f"[red]{text}[/red]"
+                row += [f"{float(prev['best']) * 1e3:,.1f} ms", text]
+        table.add_row(*row)
+        console.print(f"  {r.name}: {r.best * 1e3:,.1f} ms", style="dim")
+
+    report = run_bench(
+        data_dir,
+        spec_file=spec,
+        work_dir=bench_root / "work",
+        repeat=repeat,
+        only=only,
+        on_result=add_row,
+    )
+    console.print(table)
+
+    if out is not None:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        console.print(f"Wrote report -> {out}")
+
+    if base is not None:
+        regressions = compare_to_baseline(report, base, tolerance=tolerance)
+        if regressions:
+            for reg in regressions:
+                console.print(
+                    f"Regression: {reg.name} {reg.baseline * 1e3:,.1f} ms -> "
+                    f"{reg.current * 1e3:,.1f} ms ({reg.ratio:.2f}x)",
+                    style="red",
+                )
+            raise typer.Exit(code=1)
+        console.print(f"No regressions beyond {tolerance:.0%} vs {baseline}")
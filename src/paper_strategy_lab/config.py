@@ -37,3 +37,54 @@ def resolve_sharadar_dir(explicit: Path | None = None) -> Path:
 
     return (Path.home() / "Downloads" / "sharadar").resolve()
 
+
+def resolve_store_dir(explicit: Path | None = None) -> Path:
+    if explicit is not None:
+        return explicit.expanduser().resolve()
+
+    env = os.getenv("SHARADAR_STORE_DIR")
+    if env:
+        return Path(env).expanduser().resolve()
+
+    return (project_root() / "tmp" / "_store").resolve()
+
+
+def resolve_cache_dir(explicit: Path | None = None) -> Path:
+    if explicit is not None:
+        return explicit.expanduser().resolve()
+
+    env = os.getenv("PAPER_STRATEGY_LAB_CACHE_DIR")
+    if env:
+        return Path(env).expanduser().resolve()
+
+    return (project_root() / "tmp" / "_cache").resolve()
+
+
+def cache_max_bytes() -> int:
+    """
+    Size cap of the result cache (`PAPER_STRATEGY_LAB_CACHE_MAX_MB`, default 4 GiB).
+    """
+    env = os.getenv("PAPER_STRATEGY_LAB_CACHE_MAX_MB")
+    return int(float(env) * 1024 * 1024) if env else 4 * 1024**3
+
+
+def panel_dtype() -> str:
+    """
+    Value dtype of loaded wide panels: "float64" (default) or "float32" for compact panels
+    (`PAPER_STRATEGY_LAB_PANEL_DTYPE`).
+    """
+    dtype = os.getenv("PAPER_STRATEGY_LAB_PANEL_DTYPE", "float64").strip().lower()
+    if dtype not in {"float64", "float32"}:
+        raise ValueError(f"Expected float64 or float32 panel dtype, got {dtype!r}")
+    return dtype
+
+
+def scan_workers() -> int:
+    """
+    Processes used to parse one large CSV in parallel byte ranges
+    (`PAPER_STRATEGY_LAB_SCAN_WORKERS`, default: CPU count, at most 4; 1 disables).
+    """
+    env = os.getenv("PAPER_STRATEGY_LAB_SCAN_WORKERS")
+    if env:
+        return max(1, int(env))
+    return max(1, min(4, os.cpu_count() or 1))
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-import hashlib
+import io
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from paper_strategy_lab.config import project_root, resolve_sharadar_dir
+from paper_strategy_lab.cache import CacheEntry, ResultCache, result_cache
+from paper_strategy_lab.config import panel_dtype, resolve_sharadar_dir, scan_workers
+from paper_strategy_lab.data_sources.sharadar_store import open_table_for
+from paper_strategy_lab.profiling import add_count, profiled, span
 
 
 @dataclass(frozen=True)
@@ -19,6 +25,13 @@ class SharadarPaths:
     daily_metrics: Path
     tickers: Path
 
+    @property
+    def tables(self) -> dict[str, Path]:
+        """
+        Large per-(ticker, date) tables that can be ingested into the columnar store.
+        """
+        return {"SEP": self.sep_prices, "SFP": self.sfp_prices, "DAILY": self.daily_metrics}
+
 
 def _find_first(root: Path, pattern: re.Pattern[str]) -> Path:
     for p in sorted(root.glob("*.csv")):
@@ -27,6 +40,7 @@ def _find_first(root: Path, pattern: re.Pattern[str]) -> Path:
     raise FileNotFoundError(f"Could not find {pattern.pattern!r} under {root}")
 
 
+@profiled("sharadar.resolve_paths")
 def resolve_paths(sharadar_dir: Path | None = None) -> SharadarPaths:
     root = resolve_sharadar_dir(sharadar_dir)
     if not root.exists():
@@ -43,68 +57,347 @@ def resolve_paths(sharadar_dir: Path | None = None) -> SharadarPaths:
     )
 
 
-def _cache_path(prefix: str, key: dict) -> Path:
-    cache_dir = project_root() / "tmp" / "_cache"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:16]
-    return cache_dir / f"{prefix}_{digest}.pkl"
+def _day(value: str | None) -> str:
+    return str(pd.Timestamp(value).date()) if value else ""
 
 
-def _load_prices_from_file(
+def _covers(info: dict[str, object], start: str, end: str) -> bool:
+    """
+    Whether a cached panel's [start, end] window ("" = unbounded) contains the requested one.
+    """
+    lo, hi = str(info.get("start", "")), str(info.get("end", ""))
+    return (not lo or (bool(start) and lo <= start)) and (not hi or (bool(end) and hi >= end))
+
+
+def _cached_superset(
+    cache: ResultCache,
+    prefix: str,
+    source: dict[str, object],
+    field: str,
+    tick_set: set[str],
+    start: str,
+    end: str,
+) -> tuple[pd.DataFrame, CacheEntry] | None:
+    """
+    The cached `field` panel of the same source file whose date window covers [start, end] and
+    which holds the most requested tickers (smallest such panel on ties).
+    """
+    best: tuple[int, int, CacheEntry] | None = None
+    for entry in cache.entries(prefix):
+        info = entry.info
+        if (
+            info.get("source") != source
+            or info.get("field") != field
+            or not _covers(info, start, end)
+        ):
+            continue
+        tickers = info.get("tickers")
+        if not isinstance(tickers, list):
+            continue
+        overlap = len(tick_set.intersection(tickers))
+        if overlap and (best is None or (overlap, -len(tickers)) > best[:2]):
+            best = (overlap, -len(tickers), entry)
+    if best is None:
+        return None
+    panel = cache.read_entry(best[2])
+    return None if panel is None else (panel, best[2])
+
+
+def _slice_panel(
+    panel: pd.DataFrame, tick_set: set[str], start: str | None, end: str | None
+) -> pd.DataFrame:
+    """
+    Cut a superset panel down to what a direct pivot of `tick_set` over [start, end] returns.
+    """
+    if panel.empty:
+        return pd.DataFrame()
+    sub = panel.loc[:, [c for c in panel.columns if c in tick_set]]
+    if start:
+        sub = sub[sub.index >= pd.to_datetime(start)]
+    if end:
+        sub = sub[sub.index <= pd.to_datetime(end)]
+    return sub.dropna(how="all").dropna(axis=1, how="all")
+
+
+def _pivot_field(rows: pd.DataFrame, field: str, dtype: str = "float64") -> pd.DataFrame:
+    """
+    Long (ticker, date, field) rows -> date x ticker panel of `dtype`.
+
+    Equivalent to `dropna(subset=[field]).pivot_table(..., aggfunc="last")`, but built from
+    integer date/ticker codes straight into one preallocated array.
+    """
+    if rows.empty:
+        return pd.DataFrame()
+    vals = rows[field].to_numpy(dtype=np.float64)
+    ok = ~np.isnan(vals)
+    if not ok.any():
+        return pd.DataFrame()
+    date_codes, dates = pd.factorize(rows["date"].to_numpy()[ok], sort=True)
+    tick_codes, names = pd.factorize(rows["ticker"].to_numpy()[ok], sort=True)
+    # Later rows win for a duplicated (date, ticker), as with aggfunc="last".
+    key = date_codes.astype(np.int64) * len(names) + tick_codes
+    last = ~pd.Series(key).duplicated(keep="last").to_numpy()
+
+    panel = np.full((len(dates), len(names)), np.nan, dtype=dtype)
+    panel[date_codes[last], tick_codes[last]] = vals[ok][last]
+    return pd.DataFrame(panel, index=pd.DatetimeIndex(dates, name="date"), columns=pd.Index(names))
+
+
+# Files at least twice this size are parsed as byte ranges of about this size in parallel.
+_RANGE_BYTES = 64 * 1024**2
+
+
+def _filter_rows(
+    chunk: pd.DataFrame, tickers: set[str], scan_lo: str, scan_hi: str
+) -> pd.DataFrame:
+    chunk["ticker"] = chunk["ticker"].astype(str).str.upper()
+    chunk = pd.DataFrame(chunk[chunk["ticker"].isin(list(tickers))])
+    if chunk.empty:
+        return chunk
+    chunk["date"] = pd.to_datetime(chunk["date"])
+    if scan_lo:
+        chunk = pd.DataFrame(chunk[chunk["date"] >= pd.to_datetime(scan_lo)])
+    if scan_hi:
+        chunk = pd.DataFrame(chunk[chunk["date"] <= pd.to_datetime(scan_hi)])
+    return chunk
+
+
+def _range_count(csv_path: Path) -> int:
+    return csv_path.stat().st_size // _RANGE_BYTES
+
+
+def _byte_ranges(csv_path: Path, n_ranges: int) -> list[tuple[int, int]]:
+    """
+    Split the rows of `csv_path` (after the header line) into about `n_ranges` [lo, hi) byte
+    ranges that start and end on line boundaries. Sharadar files have no quoted newlines.
+    """
+    size = csv_path.stat().st_size
+    with csv_path.open("rb") as f:
+        bounds = [len(f.readline())]
+        for k in range(1, n_ranges):
+            f.seek(max(bounds[0], size * k // n_ranges))
+            f.readline()
+            bounds.append(f.tell())
+    bounds.append(size)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:], strict=False) if lo < hi]
+
+
+def _scan_range(
+    csv_path: Path,
+    lo: int,
+    hi: int,
+    *,
+    columns: list[str],
+    usecols: list[str],
+    tickers: set[str],
+    scan_lo: str,
+    scan_hi: str,
+) -> tuple[pd.DataFrame, int]:
+    """
+    Matching rows of one byte range (see `_byte_ranges`) and the number of rows parsed.
+    """
+    with csv_path.open("rb") as f:
+        f.seek(lo)
+        data = f.read(hi - lo)
+    chunk = pd.read_csv(  # type: ignore[call-overload]
+        io.BytesIO(data),
+        header=None,
+        names=columns,
+        usecols=usecols,  # pyright: ignore[reportArgumentType]
+    )
+    return _filter_rows(chunk, tickers, scan_lo, scan_hi), len(chunk)
+
+
+def _scan_csv(
+    csv_path: Path, usecols: list[str], tickers: set[str], *, scan_lo: str, scan_hi: str
+) -> pd.DataFrame:
+    """
+    The `usecols` of every row of `csv_path` for `tickers` within [scan_lo, scan_hi], in file
+    order (so later rows still win in `_pivot_field`).
+
+    Large files are parsed as line-aligned byte ranges across `scan_workers()` processes;
+    otherwise the file is read in chunks in this process.
+    """
+    workers = scan_workers()
+    n_ranges = _range_count(csv_path)
+    chunks: list[pd.DataFrame] = []
+    if workers > 1 and n_ranges >= 2:
+        columns = list(pd.read_csv(csv_path, nrows=0).columns)
+        ranges = _byte_ranges(csv_path, n_ranges)
+        scan = partial(
+            _scan_range,
+            csv_path,
+            columns=columns,
+            usecols=usecols,
+            tickers=tickers,
+            scan_lo=scan_lo,
+            scan_hi=scan_hi,
+        )
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+            for chunk, n_rows in pool.map(scan, *zip(*ranges, strict=True)):
+                add_count("rows", n_rows)
+                chunks.append(chunk)
+    else:
+        for chunk in pd.read_csv(  # type: ignore[call-overload, arg-type]
+            csv_path,
+            usecols=usecols,  # pyright: ignore[reportArgumentType]
+            chunksize=2_000_000,
+        ):
+            add_count("rows", len(chunk))
+            chunks.append(_filter_rows(chunk, tickers, scan_lo, scan_hi))
+    chunks = [c for c in chunks if not c.empty]
+    return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+
+@profiled("sharadar.load_fields")
+def _load_fields_from_file(
     csv_path: Path,
     tickers: list[str],
     *,
     start: str | None,
     end: str | None,
-    field: str,
-) -> pd.DataFrame:
-    usecols: object = ["ticker", "date", field]
+    fields: list[str],
+    cache_prefix: str,
+) -> dict[str, pd.DataFrame]:
+    """
+    Load several value columns of a Sharadar table into per-field wide panels.
+
+    Cached panels are reused whenever they cover the request: a panel cached for a wider window
+    or a larger ticker set is sliced in memory. If the best cached panel lacks some tickers, only
+    those are read and the panel is extended (and replaced) in the cache. Everything that has to
+    come from the CSV is read in a single pass, regardless of how many fields are requested.
+    """
+    fields = list(dict.fromkeys(fields))
     tick_set = {t.strip().upper() for t in tickers if t.strip()}
-    if not tick_set:
-        return pd.DataFrame()
+    if not tick_set or not fields:
+        return {f: pd.DataFrame() for f in fields}
+
+    dtype = panel_dtype()
+    store = open_table_for(csv_path)
+    if store is not None:
+        return store.read_wide(sorted(tick_set), fields, start=start, end=end, dtype=dtype)
 
-    key = {
+    cache = result_cache()
+    source: dict[str, object] = {
         "file": str(csv_path),
         "mtime": csv_path.stat().st_mtime_ns,
-        "field": field,
-        "start": start or "",
-        "end": end or "",
-        "tickers": sorted(tick_set),
+        "dtype": dtype,
     }
-    cache_path = _cache_path("prices", key)
-    if cache_path.exists():
+    lo, hi = _day(start), _day(end)
+    out: dict[str, pd.DataFrame] = {}
+    # field -> (cached base panel and its entry, or None; tickers still to read)
+    pending: dict[str, tuple[tuple[pd.DataFrame, CacheEntry] | None, set[str]]] = {}
+    for field in fields:
+        prefix = cache_prefix.format(field=field)
+        hit = _cached_superset(cache, prefix, source, field, tick_set, lo, hi)
+        covered = set(hit[1].info["tickers"]) if hit else set()  # type: ignore[arg-type]
+        if hit and tick_set <= covered:
+            add_count("cache_hits")
+            out[field] = _slice_panel(hit[0], tick_set, start, end)
+        else:
+            add_count("cache_misses")
+            pending[field] = (hit, tick_set - covered)
+
+    if not pending:
+        return out
+
+    # A cached base is extended over its own window, so it stays reusable for wider requests.
+    windows = [
+        (str(hit[1].info["start"]), str(hit[1].info["end"])) if hit else (lo, hi)
+        for hit, _ in pending.values()
+    ]
+    scan_lo = "" if any(not w[0] for w in windows) else min(w[0] for w in windows)
+    scan_hi = "" if any(not w[1] for w in windows) else max(w[1] for w in windows)
+    scan_tickers = set().union(*(need for _, need in pending.values()))
+
+    with span("sharadar.scan_csv", file=csv_path.name):
+        rows = _scan_csv(
+            csv_path, ["ticker", "date", *pending], scan_tickers, scan_lo=scan_lo, scan_hi=scan_hi
+        )
+    for (field, (hit, need)), (w_lo, w_hi) in zip(pending.items(), windows, strict=True):
+        part = rows
+        if not rows.empty:
+            mask = rows["ticker"].isin(sorted(need))
+            if w_lo:
+                mask &= rows["date"] >= pd.to_datetime(w_lo)
+            if w_hi:
+                mask &= rows["date"] <= pd.to_datetime(w_hi)
+            part = pd.DataFrame(rows[mask])
+        with span("sharadar.pivot", field=field):
+            panel = _pivot_field(part, field, dtype)
+        covered = sorted(need)
+        if hit is not None:
+            base, entry = hit
+            covered = sorted(need.union(entry.info["tickers"]))  # type: ignore[arg-type]
+            if not panel.empty:
+                merged = pd.concat([base, panel], axis=1).sort_index()
+                panel = merged.reindex(columns=sorted(merged.columns))
+            else:
+                panel = base
+        prefix = cache_prefix.format(field=field)
+        info = {"source": source, "field": field, "start": w_lo, "end": w_hi, "tickers": covered}
         with suppress(Exception):
-            cached = pd.read_pickle(cache_path)
-            if isinstance(cached, pd.DataFrame):
-                return cached
+            cache.put_frame(prefix, info, panel, info=info)
+            if hit is not None:
+                cache.remove(hit[1])
+        out[field] = _slice_panel(panel, tick_set, start, end)
 
-    chunks: list[pd.DataFrame] = []
-    for chunk in pd.read_csv(  # type: ignore[call-overload, arg-type]
-        csv_path, usecols=usecols, chunksize=2_000_000  # pyright: ignore[reportArgumentType]
-    ):
-        chunk["ticker"] = chunk["ticker"].astype(str).str.upper()
-        chunk = chunk[chunk["ticker"].isin(tick_set)]
-        if chunk.empty:
-            continue
-        chunk["date"] = pd.to_datetime(chunk["date"])
-        if start:
-            chunk = chunk[chunk["date"] >= pd.to_datetime(start)]
-        if end:
-            chunk = chunk[chunk["date"] <= pd.to_datetime(end)]
-        if chunk.empty:
-            continue
-        chunks.append(chunk)
+    return {f: out[f] for f in fields}
 
-    if not chunks:
-        return pd.DataFrame()
 
-    df = pd.concat(chunks, ignore_index=True)
-    df = df.dropna(subset=[field])
-    df = df.pivot_table(index="date", columns="ticker", values=field, aggfunc="last").sort_index()
-    df.columns.name = None
-    with suppress(Exception):
-        df.to_pickle(cache_path)
-    return df
+def _load_prices_from_file(
+    csv_path: Path,
+    tickers: list[str],
+    *,
+    start: str | None,
+    end: str | None,
+    field: str,
+) -> pd.DataFrame:
+    return _load_fields_from_file(
+        csv_path, tickers, start=start, end=end, fields=[field], cache_prefix="prices_{field}"
+    )[field]
+
+
+def load_price_fields(
+    tickers: list[str],
+    *,
+    fields: list[str],
+    start: str | None = None,
+    end: str | None = None,
+    sharadar_dir: Path | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Load several OHLCV fields (e.g. closeadj + volume) for `tickers` from SEP and SFP.
+
+    Each file is scanned once for all fields; SEP values take precedence over SFP. The two files
+    are loaded concurrently in threads, unless one of them is large enough to be parsed across
+    processes (see `_scan_csv`): then each file gets all the scan workers in turn (and no worker
+    process is forked from a loader thread).
+    """
+    paths = resolve_paths(sharadar_dir)
+    load = partial(
+        _load_fields_from_file,
+        tickers=tickers,
+        start=start,
+        end=end,
+        fields=fields,
+        cache_prefix="prices_{field}",
+    )
+    files = (paths.sep_prices, paths.sfp_prices)
+    if scan_workers() > 1 and any(_range_count(f) >= 2 for f in files):
+        sep, sfp = (load(f) for f in files)
+    else:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            sep, sfp = pool.map(load, files)
+    out: dict[str, pd.DataFrame] = {}
+    for field in sep:
+        if sep[field].empty:
+            out[field] = sfp[field]
+        elif sfp[field].empty:
+            out[field] = sep[field]
+        else:
+            out[field] = sep[field].combine_first(sfp[field]).sort_index()
+    return out
 
 
 def load_prices(
@@ -120,14 +413,28 @@ def load_prices(
 
     Returns a pandas.DataFrame indexed by date with one column per ticker.
     """
+    return load_price_fields(
+        tickers, fields=[field], start=start, end=end, sharadar_dir=sharadar_dir
+    )[field]
+
+
+def load_equity_price_fields(
+    tickers: list[str],
+    *,
+    fields: list[str],
+    start: str | None = None,
+    end: str | None = None,
+    sharadar_dir: Path | None = None,
+) -> dict[str, pd.DataFrame]:
     paths = resolve_paths(sharadar_dir)
-    sep = _load_prices_from_file(paths.sep_prices, tickers, start=start, end=end, field=field)
-    sfp = _load_prices_from_file(paths.sfp_prices, tickers, start=start, end=end, field=field)
-    if sep.empty:
-        return sfp
-    if sfp.empty:
-        return sep
-    return sep.combine_first(sfp).sort_index()
+    return _load_fields_from_file(
+        paths.sep_prices,
+        tickers,
+        start=start,
+        end=end,
+        fields=fields,
+        cache_prefix="prices_{field}",
+    )
 
 
 def load_equity_prices(
@@ -164,63 +471,18 @@ def load_daily_metrics(
 ) -> dict[str, pd.DataFrame]:
     """
     Load DAILY metrics (e.g., pe/pb/ps/marketcap) into per-field DataFrames.
+
+    All requested fields are read in one pass over the DAILY file.
     """
     paths = resolve_paths(sharadar_dir)
-    tick_set = {t.strip().upper() for t in tickers if t.strip()}
-    if not tick_set:
-        return {f: pd.DataFrame() for f in fields}
-
-    out: dict[str, pd.DataFrame] = {}
-    for field in fields:
-        usecols: object = ["ticker", "date", field]
-        key = {
-            "file": str(paths.daily_metrics),
-            "mtime": paths.daily_metrics.stat().st_mtime_ns,
-            "field": field,
-            "start": start or "",
-            "end": end or "",
-            "tickers": sorted(tick_set),
-        }
-        cache_path = _cache_path(f"daily_{field}", key)
-        if cache_path.exists():
-            with suppress(Exception):
-                cached = pd.read_pickle(cache_path)
-                if isinstance(cached, pd.DataFrame):
-                    out[field] = cached
-                    continue
-
-        chunks: list[pd.DataFrame] = []
-        for chunk in pd.read_csv(  # type: ignore[call-overload, arg-type]
-            paths.daily_metrics, usecols=usecols, chunksize=2_000_000  # pyright: ignore[reportArgumentType]
-        ):
-            chunk["ticker"] = chunk["ticker"].astype(str).str.upper()
-            chunk = chunk[chunk["ticker"].isin(tick_set)]
-            if chunk.empty:
-                continue
-            chunk["date"] = pd.to_datetime(chunk["date"])
-            if start:
-                chunk = chunk[chunk["date"] >= pd.to_datetime(start)]
-            if end:
-                chunk = chunk[chunk["date"] <= pd.to_datetime(end)]
-            if chunk.empty:
-                continue
-            chunks.append(chunk)
-
-        if not chunks:
-            out[field] = pd.DataFrame()
-            continue
-
-        df = pd.concat(chunks, ignore_index=True)
-        df = df.dropna(subset=[field])
-        df = df.pivot_table(
-            index="date", columns="ticker", values=field, aggfunc="last"
-        ).sort_index()
-        df.columns.name = None
-        with suppress(Exception):
-            df.to_pickle(cache_path)
-        out[field] = df
-
-    return out
+    return _load_fields_from_file(
+        paths.daily_metrics,
+        tickers,
+        start=start,
+        end=end,
+        fields=fields,
+        cache_prefix="daily_{field}",
+    )
 
 
 def load_tickers_metadata(sharadar_dir: Path | None = None) -> pd.DataFrame:
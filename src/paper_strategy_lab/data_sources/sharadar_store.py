@@ -0,0 +1,645 @@
+"""
+Columnar on-disk store for the large Sharadar tables (SEP/SFP/DAILY).
+
+Each table is ingested once from its CSV into a directory of `.npy` column files sorted by
+(ticker, date). Tickers are dictionary-encoded: `tickers.json` holds the sorted ticker dictionary
+and `offsets.npy` the row range of each ticker, so a read only touches the byte ranges of the
+requested tickers and columns (column files are memory-mapped, dates are `datetime64[D]`).
+
+Updates are appended as small delta segments (`deltas/NNNNNN/`, same layout as the base) instead
+of rewriting the table: reads merge the segments with the latest row winning per (ticker, date),
+and `compact_table` folds the deltas back into the base segment. `meta.json` keeps a watermark
+(last ingested date and `lastupdated`), so an incremental ingest only keeps rows past it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from paper_strategy_lab.config import resolve_store_dir
+from paper_strategy_lab.profiling import add_count, span
+
+STORE_FORMAT = 1
+
+_TABLE_RE = re.compile(r"^SHARADAR_([A-Z]+)_.*\.csv$")
+_NON_VALUE_COLUMNS = {"ticker", "date", "lastupdated"}
+
+
+@dataclass(frozen=True)
+class StoreInfo:
+    table: str
+    path: Path
+    rows: int
+    tickers: int
+    columns: list[str]
+    first_date: str | None
+    last_date: str | None
+    deltas: int = 0
+    lastupdated: str | None = None
+
+
+@dataclass(frozen=True)
+class StoreRows:
+    """
+    Long-format rows read from a table: `tickers[i]` owns rows `starts[i]:starts[i + 1]`, sorted
+    by date with one row per (ticker, date).
+    """
+
+    tickers: list[str]
+    starts: np.ndarray
+    dates: np.ndarray
+    values: dict[str, np.ndarray]
+
+
+def table_name(csv_path: Path) -> str:
+    m = _TABLE_RE.match(csv_path.name)
+    if not m:
+        raise ValueError(f"Not a Sharadar table CSV: {csv_path.name!r}")
+    return m.group(1)
+
+
+def _to_day(value: str) -> np.datetime64:
+    return pd.Timestamp(value).to_datetime64().astype("datetime64[D]")
+
+
+def _source_fingerprint(csv_path: Path) -> dict[str, object]:
+    st = csv_path.stat()
+    return {"name": csv_path.name, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _write_meta(path: Path, meta: dict[str, object]) -> None:
+    tmp = path / ".meta.json.tmp"
+    tmp.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    os.replace(tmp, path / "meta.json")
+
+
+def _swap_in(work: Path, out_dir: Path) -> None:
+    if out_dir.exists():
+        old = out_dir.with_name(f".{out_dir.name}.old")
+        shutil.rmtree(old, ignore_errors=True)
+        out_dir.rename(old)
+        work.rename(out_dir)
+        shutil.rmtree(old, ignore_errors=True)
+    else:
+        work.rename(out_dir)
+
+
+def _value_columns(csv_path: Path, columns: list[str] | None) -> tuple[list[str], bool]:
+    header = list(pd.read_csv(csv_path, nrows=0).columns)
+    value_cols = columns or [c for c in header if c not in _NON_VALUE_COLUMNS]
+    missing = [c for c in value_cols if c not in header]
+    if missing:
+        raise ValueError(f"Columns {missing} not found in {csv_path.name}")
+    return value_cols, "lastupdated" in header
+
+
+def _spill_parts(
+    csv_path: Path,
+    work: Path,
+    value_cols: list[str],
+    *,
+    chunksize: int,
+    has_lastupdated: bool,
+    after: tuple[str | None, str | None] | None = None,
+) -> tuple[dict[str, int], int, str | None]:
+    """
+    Pass 1: stream the CSV once, dictionary-encode tickers and spill typed chunk arrays.
+
+    With `after=(date, lastupdated)` only rows dated after `date` or updated after `lastupdated`
+    are kept. Returns (ticker codes, number of parts, max lastupdated seen).
+    """
+    codes: dict[str, int] = {}
+    n_parts = 0
+    max_updated: str | None = None
+    extra = ["lastupdated"] if has_lastupdated else []
+    usecols: object = ["ticker", "date", *extra, *value_cols]
+    for chunk in pd.read_csv(  # type: ignore[call-overload, arg-type]
+        csv_path,
+        usecols=usecols,  # pyright: ignore[reportArgumentType]
+        dtype={"ticker": str, "lastupdated": str},
+        chunksize=chunksize,
+    ):
+        chunk = chunk.dropna(subset=["ticker", "date"])
+        dates = pd.to_datetime(chunk["date"], errors="coerce")
+        ok = dates.notna()
+        updated = chunk["lastupdated"].fillna("") if has_lastupdated else None
+        if after is not None:
+            since_date, since_updated = after
+            fresh = pd.Series(False, index=chunk.index)
+            if since_date:
+                fresh |= dates > pd.Timestamp(since_date)
+            else:
+                fresh |= ok
+            if since_updated and updated is not None:
+                fresh |= updated > since_updated
+            ok &= fresh
+        if updated is not None and len(updated):
+            top = str(updated.max())
+            if top and (max_updated is None or top > max_updated):
+                max_updated = top
+        chunk = chunk.loc[ok]
+        if chunk.empty:
+            continue
+        cat = pd.Categorical(chunk["ticker"].astype(str).str.upper())
+        for t in cat.categories:
+            codes.setdefault(str(t), len(codes))
+        lut = np.array([codes[str(t)] for t in cat.categories], dtype=np.int32)
+
+        np.save(work / f"part{n_parts}.ticker.npy", lut[cat.codes])
+        np.save(
+            work / f"part{n_parts}.date.npy",
+            dates.loc[chunk.index].to_numpy().astype("datetime64[D]"),
+        )
+        for col in value_cols:
+            vals = np.asarray(pd.to_numeric(chunk[col], errors="coerce"), dtype=np.float64)
+            np.save(work / f"part{n_parts}.{col}.npy", vals)
+        n_parts += 1
+    return codes, n_parts, max_updated
+
+
+def _write_segment(
+    work: Path, codes: dict[str, int], n_parts: int, value_cols: list[str]
+) -> dict[str, object]:
+    """
+    Pass 2: sort the spilled parts by (ticker, date), drop duplicate keys (last row wins) and write
+    one file per column. Returns the segment's row count and date range.
+    """
+    names = sorted(codes)
+    rank = np.empty(len(names), dtype=np.int32)
+    rank[[codes[t] for t in names]] = np.arange(len(names), dtype=np.int32)
+
+    def _concat(col: str, dtype: str) -> np.ndarray:
+        parts = [np.load(work / f"part{i}.{col}.npy") for i in range(n_parts)]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+    tick = rank[_concat("ticker", "int32")] if n_parts else np.empty(0, dtype=np.int32)
+    dates = _concat("date", "datetime64[D]")
+    order = np.lexsort((dates, tick))
+    tick, dates = tick[order], dates[order]
+    if len(order):
+        last = np.ones(len(order), dtype=bool)
+        last[:-1] = (tick[1:] != tick[:-1]) | (dates[1:] != dates[:-1])
+        order, tick, dates = order[last], tick[last], dates[last]
+
+    np.save(work / "date.npy", dates)
+    np.save(
+        work / "offsets.npy",
+        np.searchsorted(tick, np.arange(len(names) + 1)).astype(np.int64),
+    )
+    for col in value_cols:
+        np.save(work / f"{col}.npy", _concat(col, "float64")[order])
+
+    for p in work.glob("part*.npy"):
+        p.unlink()
+
+    (work / "tickers.json").write_text(json.dumps(names), encoding="utf-8")
+    return {
+        "rows": int(len(order)),
+        "first_date": str(dates.min()) if len(dates) else None,
+        "last_date": str(dates.max()) if len(dates) else None,
+    }
+
+
+def ingest_csv(
+    csv_path: Path,
+    *,
+    store_dir: Path | None = None,
+    columns: list[str] | None = None,
+    chunksize: int = 2_000_000,
+    incremental: bool = False,
+) -> StoreInfo:
+    """
+    Convert one Sharadar CSV into a columnar table under `store_dir/<TABLE>/`.
+
+    By default every numeric column is kept (everything except ticker/date/lastupdated). Duplicate
+    (ticker, date) rows keep the last occurrence, matching the CSV loaders' `aggfunc="last"`.
+    The table is built in a scratch directory and swapped in at the end, so readers never see a
+    half-written table.
+
+    With `incremental=True` and an existing table, the refreshed CSV is instead appended as a delta
+    segment holding only the rows past the table's watermark (newer dates, or a newer
+    `lastupdated` for corrections), and the table is marked as ingested from this CSV.
+    """
+    table = table_name(csv_path)
+    out_dir = resolve_store_dir(store_dir) / table
+    if incremental:
+        existing = open_table(table, store_dir=store_dir)
+        if existing is not None:
+            if existing.is_fresh(csv_path):
+                return existing.info()
+            after = (existing.meta.get("last_date"), existing.meta.get("lastupdated"))
+            return _append_delta(
+                existing, csv_path, after=after, adopt_source=True, chunksize=chunksize
+            )
+
+    value_cols, has_lastupdated = _value_columns(csv_path, columns)
+    work = out_dir.with_name(f".{table}.ingest")
+    shutil.rmtree(work, ignore_errors=True)
+    work.mkdir(parents=True)
+
+    codes, n_parts, max_updated = _spill_parts(
+        csv_path, work, value_cols, chunksize=chunksize, has_lastupdated=has_lastupdated
+    )
+    segment = _write_segment(work, codes, n_parts, value_cols)
+    meta = {
+        "format": STORE_FORMAT,
+        "table": table,
+        "source": _source_fingerprint(csv_path),
+        "columns": value_cols,
+        **segment,
+        "lastupdated": max_updated,
+        "deltas": [],
+    }
+    _write_meta(work, meta)
+    _swap_in(work, out_dir)
+    return ColumnarTable(out_dir).info()
+
+
+def apply_delta_csv(
+    csv_path: Path,
+    *,
+    table: str | None = None,
+    store_dir: Path | None = None,
+    chunksize: int = 2_000_000,
+) -> StoreInfo:
+    """
+    Upsert every row of a delta CSV (e.g. a Sharadar daily update file) into an ingested table.
+
+    The rows become a new delta segment; rows for an existing (ticker, date) replace it on read.
+    """
+    table = table or table_name(csv_path)
+    existing = open_table(table, store_dir=store_dir)
+    if existing is None:
+        raise FileNotFoundError(f"No ingested {table} table; run a full ingest first")
+    return _append_delta(existing, csv_path, after=None, adopt_source=False, chunksize=chunksize)
+
+
+def _append_delta(
+    store: ColumnarTable,
+    csv_path: Path,
+    *,
+    after: tuple[str | None, str | None] | None,
+    adopt_source: bool,
+    chunksize: int,
+) -> StoreInfo:
+    value_cols, has_lastupdated = _value_columns(csv_path, store.columns)
+    deltas: list[dict] = list(store.meta.get("deltas", []))
+    name = f"{max((int(d['name']) for d in deltas), default=0) + 1:06d}"
+    deltas_dir = store.path / "deltas"
+    work = deltas_dir / f".{name}.ingest"
+    shutil.rmtree(work, ignore_errors=True)
+    work.mkdir(parents=True)
+
+    codes, n_parts, max_updated = _spill_parts(
+        csv_path,
+        work,
+        value_cols,
+        chunksize=chunksize,
+        has_lastupdated=has_lastupdated,
+        after=after,
+    )
+    meta = dict(store.meta)
+    if codes:
+        segment = _write_segment(work, codes, n_parts, value_cols)
+        work.rename(deltas_dir / name)
+        delta = {"name": name, "source": _source_fingerprint(csv_path), **segment}
+        meta["deltas"] = [*deltas, delta]
+        firsts = [str(d) for d in (meta.get("first_date"), segment["first_date"]) if d]
+        lasts = [str(d) for d in (meta.get("last_date"), segment["last_date"]) if d]
+        meta["first_date"] = min(firsts) if firsts else None
+        meta["last_date"] = max(lasts) if lasts else None
+    else:
+        shutil.rmtree(work, ignore_errors=True)
+    if max_updated and (not meta.get("lastupdated") or max_updated > meta["lastupdated"]):
+        meta["lastupdated"] = max_updated
+    if adopt_source:
+        meta["source"] = _source_fingerprint(csv_path)
+    _write_meta(store.path, meta)
+    return ColumnarTable(store.path).info()
+
+
+def compact_table(table: str, *, store_dir: Path | None = None) -> StoreInfo:
+    """
+    Merge a table's delta segments into a single base segment (one column in memory at a time).
+    """
+    store = open_table(table, store_dir=store_dir)
+    if store is None:
+        raise FileNotFoundError(f"No ingested {table} table under {resolve_store_dir(store_dir)}")
+    if len(store.segments) == 1:
+        return store.info()
+
+    names = store.tickers
+    per_seg = [seg.row_ranges(names, None, None) for seg in store.segments]
+    order, tick, dates = _merge_order(store.segments, per_seg, {t: i for i, t in enumerate(names)})
+
+    work = store.path.with_name(f".{table}.compact")
+    shutil.rmtree(work, ignore_errors=True)
+    work.mkdir(parents=True)
+    np.save(work / "date.npy", dates)
+    np.save(
+        work / "offsets.npy",
+        np.searchsorted(tick, np.arange(len(names) + 1)).astype(np.int64),
+    )
+    for col in store.columns:
+        np.save(work / f"{col}.npy", _gather(store.segments, per_seg, col, "float64")[order])
+    (work / "tickers.json").write_text(json.dumps(names), encoding="utf-8")
+    meta = {**store.meta, "rows": int(len(order)), "deltas": []}
+    _write_meta(work, meta)
+    _swap_in(work, store.path)
+    return ColumnarTable(store.path).info()
+
+
+class _Segment:
+    """
+    One (ticker, date)-sorted block of column files: the base table or a delta.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.tickers: list[str] = json.loads((path / "tickers.json").read_text(encoding="utf-8"))
+        self._ticker_pos = {t: i for i, t in enumerate(self.tickers)}
+        self.offsets: np.ndarray = np.load(path / "offsets.npy")
+        self._arrays: dict[str, np.ndarray] = {}
+
+    def array(self, name: str) -> np.ndarray:
+        arr = self._arrays.get(name)
+        if arr is None:
+            arr = np.load(self.path / f"{name}.npy", mmap_mode="r")
+            self._arrays[name] = arr
+        return arr
+
+    def row_ranges(
+        self, tickers: list[str], lo_date: np.datetime64 | None, hi_date: np.datetime64 | None
+    ) -> list[tuple[str, int, int]]:
+        """
+        (ticker, first_row, end_row) for each of the (sorted, upper-case) `tickers` present.
+        """
+        dates = self.array("date")
+        ranges: list[tuple[str, int, int]] = []
+        for t in tickers:
+            pos = self._ticker_pos.get(t)
+            if pos is None:
+                continue
+            a, b = int(self.offsets[pos]), int(self.offsets[pos + 1])
+            if lo_date is not None or hi_date is not None:
+                seg = dates[a:b]
+                if lo_date is not None:
+                    a += int(np.searchsorted(seg, lo_date, side="left"))
+                if hi_date is not None:
+                    b = a + int(np.searchsorted(dates[a:b], hi_date, side="right"))
+            if b > a:
+                ranges.append((t, a, b))
+        return ranges
+
+
+def _gather(
+    segments: list[_Segment],
+    per_seg: list[list[tuple[str, int, int]]],
+    name: str,
+    dtype: str,
+) -> np.ndarray:
+    parts = [
+        seg.array(name)[a:b]
+        for seg, ranges in zip(segments, per_seg, strict=True)
+        for _, a, b in ranges
+    ]
+    return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+
+def _merge_order(
+    segments: list[_Segment],
+    per_seg: list[list[tuple[str, int, int]]],
+    pos: dict[str, int],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Permutation of the concatenated segment rows that sorts them by (ticker, date) and keeps the
+    row of the latest segment for each key, plus the resulting ticker positions and dates.
+    """
+    empty = [np.empty(0, dtype=np.int64)]
+    tick = np.concatenate(
+        [np.full(b - a, pos[t], dtype=np.int64) for ranges in per_seg for t, a, b in ranges]
+        or empty
+    )
+    seg_no = np.concatenate(
+        [
+            np.full(b - a, i, dtype=np.int64)
+            for i, ranges in enumerate(per_seg)
+            for _, a, b in ranges
+        ]
+        or empty
+    )
+    dates = _gather(segments, per_seg, "date", "datetime64[D]")
+    order = np.lexsort((seg_no, dates, tick))
+    tick, dates = tick[order], dates[order]
+    if len(order):
+        last = np.ones(len(order), dtype=bool)
+        last[:-1] = (tick[1:] != tick[:-1]) | (dates[1:] != dates[:-1])
+        order, tick, dates = order[last], tick[last], dates[last]
+    return order, tick, dates
+
+
+class ColumnarTable:
+    """
+    Read-only view over one ingested table; column files are memory-mapped on first use.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.meta: dict = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        if self.meta.get("format") != STORE_FORMAT:
+            raise ValueError(f"Unsupported store format in {path}: {self.meta.get('format')!r}")
+        self.segments = [_Segment(path)] + [
+            _Segment(path / "deltas" / str(d["name"])) for d in self.meta.get("deltas", [])
+        ]
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self.meta["columns"])
+
+    @property
+    def tickers(self) -> list[str]:
+        if len(self.segments) == 1:
+            return self.segments[0].tickers
+        return sorted(set().union(*(seg.tickers for seg in self.segments)))
+
+    def info(self) -> StoreInfo:
+        deltas = self.meta.get("deltas", [])
+        return StoreInfo(
+            table=str(self.meta["table"]),
+            path=self.path,
+            rows=int(self.meta["rows"]) + sum(int(d["rows"]) for d in deltas),
+            tickers=len(self.tickers),
+            columns=self.columns,
+            first_date=self.meta.get("first_date"),
+            last_date=self.meta.get("last_date"),
+            deltas=len(deltas),
+            lastupdated=self.meta.get("lastupdated"),
+        )
+
+    def is_fresh(self, csv_path: Path) -> bool:
+        """
+        True if the table was (fully or incrementally) ingested from `csv_path` as it currently
+        exists on disk.
+        """
+        return self.meta.get("source") == _source_fingerprint(csv_path)
+
+    def read_rows(
+        self,
+        tickers: list[str],
+        fields: list[str],
+        *,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> StoreRows:
+        """
+        Rows of `fields` for `tickers` within [start, end], merged across delta segments.
+        """
+        unknown = [f for f in fields if f not in self.meta["columns"]]
+        if unknown:
+            raise KeyError(f"Columns {unknown} not in {self.meta['table']} store")
+        wanted = sorted({t.strip().upper() for t in tickers if t.strip()})
+        lo_date = _to_day(start) if start else None
+        hi_date = _to_day(end) if end else None
+        per_seg = [seg.row_ranges(wanted, lo_date, hi_date) for seg in self.segments]
+
+        if len(self.segments) == 1:
+            ranges = per_seg[0]
+            names = [t for t, _, _ in ranges]
+            starts = np.zeros(len(ranges) + 1, dtype=np.int64)
+            np.cumsum([b - a for _, a, b in ranges], out=starts[1:])
+            return StoreRows(
+                tickers=names,
+                starts=starts,
+                dates=_gather(self.segments, per_seg, "date", "datetime64[D]"),
+                values={f: _gather(self.segments, per_seg, f, "float64") for f in fields},
+            )
+
+        names = sorted({t for ranges in per_seg for t, _, _ in ranges})
+        order, tick, dates = _merge_order(
+            self.segments, per_seg, {t: i for i, t in enumerate(names)}
+        )
+        return StoreRows(
+            tickers=names,
+            starts=np.searchsorted(tick, np.arange(len(names) + 1)).astype(np.int64),
+            dates=dates,
+            values={f: _gather(self.segments, per_seg, f, "float64")[order] for f in fields},
+        )
+
+    def read_wide(
+        self,
+        tickers: list[str],
+        fields: list[str],
+        *,
+        start: str | None = None,
+        end: str | None = None,
+        dtype: str = "float64",
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Read `fields` for `tickers` within [start, end] as date x ticker panels of `dtype`.
+
+        The result matches pivoting the CSV rows with `pivot_table(..., aggfunc="last")` after
+        dropping missing values: only dates/tickers with at least one value appear.
+        """
+        with span("store.read_rows", table=self.meta["table"]):
+            rows = self.read_rows(tickers, fields, start=start, end=end)
+            add_count("rows", len(rows.dates))
+        if not rows.tickers:
+            return {f: pd.DataFrame() for f in fields}
+
+        names = rows.tickers
+        col_pos = np.repeat(np.arange(len(names), dtype=np.int64), np.diff(rows.starts))
+        out: dict[str, pd.DataFrame] = {}
+        for field in fields:
+            vals = rows.values[field]
+            ok = ~np.isnan(vals)
+            if not ok.any():
+                out[field] = pd.DataFrame()
+                continue
+            uniq, row_pos = np.unique(rows.dates[ok], return_inverse=True)
+            present = np.unique(col_pos[ok])
+            remap = np.full(len(names), -1, dtype=np.int64)
+            remap[present] = np.arange(len(present))
+
+            panel = np.full((len(uniq), len(present)), np.nan, dtype=dtype)
+            panel[row_pos, remap[col_pos[ok]]] = vals[ok]
+            index = pd.DatetimeIndex(uniq.astype("datetime64[ns]"), name="date")
+            out[field] = pd.DataFrame(
+                panel, index=index, columns=pd.Index([names[j] for j in present])
+            )
+        return out
+
+    def iter_wide(
+        self,
+        tickers: list[str],
+        fields: list[str],
+        *,
+        start: str | None = None,
+        end: str | None = None,
+        block_days: int = 365,
+        dtype: str = "float64",
+    ) -> Iterator[dict[str, pd.DataFrame]]:
+        """
+        `read_wide` in consecutive calendar windows of `block_days`, for streaming consumers such
+        as `run_portfolio_backtest_streaming`.
+
+        Every block has the same columns (the requested tickers that exist in the table), so the
+        blocks concatenate to the `read_wide` panel apart from tickers without any value in the
+        window, which stay as all-NaN columns. Blocks without any rows are skipped.
+        """
+        if block_days < 1:
+            raise ValueError(f"Expected block_days >= 1, got {block_days}")
+        first, last = self.meta.get("first_date"), self.meta.get("last_date")
+        if not first or not last:
+            return
+        known = set(self.tickers)
+        columns = pd.Index(sorted({t.strip().upper() for t in tickers} & known))
+        lo = max(_to_day(start), _to_day(first)) if start else _to_day(first)
+        hi = min(_to_day(end), _to_day(last)) if end else _to_day(last)
+        step = np.timedelta64(block_days, "D")
+        while lo <= hi:
+            stop = min(lo + step - np.timedelta64(1, "D"), hi)
+            panels = self.read_wide(
+                list(columns), fields, start=str(lo), end=str(stop), dtype=dtype
+            )
+            index = pd.DatetimeIndex(
+                sorted(set().union(*(p.index for p in panels.values()))), name="date"
+            )
+            if len(index):
+                yield {
+                    f: p.reindex(index=index, columns=columns).astype(dtype)
+                    for f, p in panels.items()
+                }
+            lo = stop + np.timedelta64(1, "D")
+
+
+def open_table(table: str, *, store_dir: Path | None = None) -> ColumnarTable | None:
+    path = resolve_store_dir(store_dir) / table
+    if not (path / "meta.json").exists():
+        return None
+    try:
+        return ColumnarTable(path)
+    except (OSError, ValueError, json.JSONDecodeError):
+        return None
+
+
+def open_table_for(csv_path: Path, *, store_dir: Path | None = None) -> ColumnarTable | None:
+    """
+    Return the ingested table for `csv_path` if one exists and is up to date, else None.
+    """
+    try:
+        table = table_name(csv_path)
+    except ValueError:
+        return None
+    store = open_table(table, store_dir=store_dir)
+    if store is None or not store.is_fresh(csv_path):
+        return None
+    return store
@@ -0,0 +1,166 @@
+"""
+Persistent store of derived factor panels (trailing returns, rolling volatility, CAPM residuals).
+
+Panels live in the result cache as `feature-*` entries and are memory-mapped on later runs. An
+entry is addressed by the feature name, its parameters, the input columns and the first input
+date, so a lookup reads a single entry. It records digests of the input rows it was computed
+from: of all rows, and of the first 63, 126, ... rows (checkpoints). A request is served from
+the longest stored prefix whose inputs still match:
+
+- same rows: the stored panel;
+- fewer rows (an earlier end date): the stored panel cut to the requested rows, up to the last
+  checkpoint; only the rows after it are computed, and the longer entry is kept;
+- new dates appended: only the new dates are computed, starting `warmup` rows earlier so rolling
+  windows are complete, and the entry is replaced by the extended panel;
+- changed history (restated prices): recomputed from the last matching checkpoint.
+
+A different window start is a different entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+from contextlib import suppress
+
+import numpy as np
+import pandas as pd
+
+from paper_strategy_lab.cache import ResultCache, result_cache
+from paper_strategy_lab.profiling import add_count, span
+
+FEATURE_PREFIX = "feature"
+
+# Rows between recorded input digests (about a quarter of trading days).
+_CHECKPOINT_ROWS = 63
+
+FeatureInputs = dict[str, pd.DataFrame]
+
+
+def _inputs_digests(inputs: FeatureInputs, marks: list[int]) -> dict[int, str]:
+    """
+    Digest of the first `m` rows (dates and values) of every input, for each `m` in `marks`,
+    computed in a single pass.
+    """
+    frames = [
+        (name.encode("utf-8"), pd.DatetimeIndex(frame.index).asi8, frame.to_numpy())
+        for name, frame in sorted(inputs.items())
+    ]
+    h = hashlib.sha1()
+    out: dict[int, str] = {}
+    lo = 0
+    for hi in sorted(set(marks)):
+        for name, dates, values in frames:
+            h.update(name)
+            h.update(np.ascontiguousarray(dates[lo:hi]).tobytes())
+            h.update(np.ascontiguousarray(values[lo:hi]).tobytes())
+        out[hi] = h.hexdigest()
+        lo = hi
+    return out
+
+
+def _checkpoints(rows: int) -> list[int]:
+    return list(range(_CHECKPOINT_ROWS, rows + 1, _CHECKPOINT_ROWS))
+
+
+def _layout(inputs: FeatureInputs) -> dict[str, object]:
+    return {
+        name: [[str(c) for c in frame.columns], str(frame.to_numpy().dtype)]
+        for name, frame in sorted(inputs.items())
+    }
+
+
+def _on_index(panel: pd.DataFrame, index: pd.DatetimeIndex) -> pd.DataFrame:
+    # Stored panels lose the index name/freq; hand back the caller's index (no copy).
+    return pd.DataFrame(panel.to_numpy(), index=index, columns=panel.columns, copy=False)
+
+
+class FeatureStore:
+    """
+    Derived panels computed once per (feature, params, inputs) and extended with new dates.
+    """
+
+    def __init__(self, cache: ResultCache | None = None) -> None:
+        self.cache = cache or result_cache()
+
+    def panel(
+        self,
+        name: str,
+        params: dict[str, object],
+        inputs: FeatureInputs,
+        compute: Callable[[FeatureInputs], pd.DataFrame],
+        *,
+        warmup: int,
+    ) -> pd.DataFrame:
+        """
+        `compute(inputs)`, read from the store when possible.
+
+        `inputs` share one DatetimeIndex; `compute` must be row-causal (row t only depends on
+        input rows t - `warmup` .. t), which is what makes reusing a stored prefix valid.
+        """
+        index = next(iter(inputs.values())).index
+        if not isinstance(index, pd.DatetimeIndex) or index.empty:
+            return compute(inputs)
+        params = {k: params[k] for k in sorted(params)}
+        layout = _layout(inputs)
+        first, n = str(index[0]), len(index)
+        key = (name, params, layout, first)
+
+        with span("features.derived", feature=name):
+            entry = self.cache.entry(FEATURE_PREFIX, key)
+            info = entry.info if entry is not None else {}
+            rows = int(info.get("rows", 0))  # type: ignore[arg-type]
+            stored_digests = [*info.get("checkpoints", []), info.get("digest")]  # type: ignore[misc]
+            marks = dict(zip([*_checkpoints(rows), rows], stored_digests, strict=False))
+            usable = {m: d for m, d in marks.items() if 0 < m <= n}
+            digests = _inputs_digests(inputs, [*_checkpoints(n), n, *usable])
+            matched = [m for m, d in usable.items() if digests[m] == d]
+            # Longest stored prefix computed from the same input rows as this request.
+            reuse = max(matched, default=0)
+            stale = len(matched) < len(usable)
+            stored = self.cache.read_entry(entry) if entry is not None and reuse else None
+            if stored is None:
+                reuse = 0
+
+            if reuse == n:
+                add_count("cache_hits")
+                return _on_index(stored.iloc[:n], index)  # type: ignore[union-attr]
+            if reuse:
+                add_count("cache_extends")
+                lo = max(0, reuse - warmup)
+                tail = compute({k: v.iloc[lo:] for k, v in inputs.items()}).iloc[reuse - lo :]
+                head = stored.iloc[:reuse]  # type: ignore[union-attr]
+                result = _on_index(pd.concat([head, tail.reindex(columns=head.columns)]), index)
+            else:
+                add_count("cache_misses")
+                result = compute(inputs)
+            if n < rows and not stale:
+                # A shorter window of the stored history: keep the longer panel.
+                return result
+
+            info = {
+                "feature": name,
+                "params": params,
+                "layout": layout,
+                "first": first,
+                "rows": n,
+                "digest": digests[n],
+                "checkpoints": [digests[m] for m in _checkpoints(n)],
+            }
+            with suppress(Exception):
+                self.cache.put_frame(FEATURE_PREFIX, key, result, info=info)
+            return result
+
+
+_DEFAULT: FeatureStore | None = None
+
+
+def feature_store() -> FeatureStore:
+    """
+    Process-wide store on the configured result cache (see `cache.result_cache`).
+    """
+    global _DEFAULT
+    cache = result_cache()
+    if _DEFAULT is None or _DEFAULT.cache is not cache:
+        _DEFAULT = FeatureStore(cache)
+    return _DEFAULT
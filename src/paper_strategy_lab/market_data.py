@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
+if TYPE_CHECKING:
+    from paper_strategy_lab.feature_store import FeatureStore
+
 
 @dataclass(frozen=True)
 class MarketData:
     prices: pd.DataFrame
     features: dict[str, pd.DataFrame] = field(default_factory=dict)
+    # Derived panels memoized per instance, so strategies evaluated against the same MarketData
+    # (e.g. a parameter sweep) compute each rolling indicator once.
+    indicators: dict[Hashable, pd.DataFrame] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    # When set, factor panels (`derived`) are also persisted across runs.
+    store: FeatureStore | None = field(default=None, repr=False, compare=False)
 
     def feature(self, name: str) -> pd.DataFrame:
         try:
@@ -16,3 +28,56 @@ class MarketData:
         except KeyError as e:
             raise KeyError(f"Missing feature {name!r}. Available: {sorted(self.features)}") from e
 
+    def indicator(self, key: Hashable, compute: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        cached = self.indicators.get(key)
+        if cached is None:
+            cached = compute()
+            self.indicators[key] = cached
+        return cached
+
+    def derived(
+        self,
+        name: str,
+        params: dict[str, object],
+        compute: Callable[[dict[str, pd.DataFrame]], pd.DataFrame],
+        *,
+        warmup: int,
+        inputs: dict[str, pd.DataFrame] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Factor panel `compute(inputs)` (inputs default to {"prices": prices}), memoized like
+        `indicator` and read from / written to `store` when one is attached. `compute` must only
+        look back `warmup` rows (see `FeatureStore.panel`).
+        """
+
+        def build() -> pd.DataFrame:
+            frames = {"prices": self.prices} if inputs is None else inputs
+            if self.store is None:
+                return compute(frames)
+            return self.store.panel(name, params, frames, compute, warmup=warmup)
+
+        return self.indicator((name, *sorted(params.items())), build)
+
+    def sma(self, window: int) -> pd.DataFrame:
+        return self.indicator(
+            ("sma", window), lambda: pd.DataFrame(self.prices.rolling(window).mean())
+        )
+
+    def returns(self, periods: int = 1) -> pd.DataFrame:
+        return self.derived(
+            "returns",
+            {"periods": periods},
+            lambda d: d["prices"].pct_change(periods, fill_method=None),
+            warmup=periods,
+        )
+
+    def rolling_vol(self, window: int) -> pd.DataFrame:
+        """
+        Rolling standard deviation of daily returns (not annualized).
+        """
+        return self.derived(
+            "rolling_vol",
+            {"window": window},
+            lambda d: pd.DataFrame(d["prices"].pct_change(fill_method=None).rolling(window).std()),
+            warmup=window + 1,
+        )
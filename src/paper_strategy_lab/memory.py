@@ -0,0 +1,26 @@
+"""
+Peak memory reporting for CLI runs.
+"""
+
+from __future__ import annotations
+
+import resource
+import sys
+
+
+def peak_rss_bytes(*, children: bool = False) -> int:
+    """
+    Peak resident set size of this process (or of its largest finished child process).
+    """
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def peak_memory_summary() -> str:
+    text = f"Peak memory: {peak_rss_bytes() / 1024**2:,.0f} MB"
+    workers = peak_rss_bytes(children=True)
+    if workers:
+        text += f" (largest worker: {workers / 1024**2:,.0f} MB)"
+    return text
@@ -1,10 +1,33 @@
+"""
+Per-page PDF text extraction with an on-disk page cache.
+
+Extracted text is cached per page under `<cache dir>/pdf-pages-<sha256 of the PDF>/`, so
+re-running `extract-text`, `extract-strategy-candidates` or the heading script on the same paper
+only parses pages that have not been extracted yet (a fully cached run never opens the PDF).
+Missing pages are extracted in contiguous page ranges, optionally across worker processes, and
+streamed back in page order.
+"""
+
 from __future__ import annotations
 
-from collections.abc import Iterable
+import hashlib
+import json
+import os
+import time
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from paper_strategy_lab.config import resolve_cache_dir
+
+if TYPE_CHECKING:
+    from pypdf import PdfReader
 
-from pypdf import PdfReader
+PAGE_CACHE_PREFIX = "pdf-pages"
 
 
 @dataclass(frozen=True)
@@ -13,14 +36,148 @@ class PdfPageText:
     text: str
 
 
-def extract_pages(pdf_path: Path) -> list[PdfPageText]:
-    reader = PdfReader(str(pdf_path))
-    pages: list[PdfPageText] = []
-    for i, page in enumerate(reader.pages):
-        text = page.extract_text() or ""
-        pages.append(PdfPageText(page_index=i, text=text))
-    return pages
+def pdf_digest(pdf_path: Path) -> str:
+    h = hashlib.sha256()
+    with pdf_path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class PageTextCache:
+    """
+    Extracted text of one PDF, one file per page, keyed by the PDF's content hash.
+
+    The directory carries a `meta.json` like the result cache entries, so `cache ls`, `cache
+    prune` and `cache clear` see and evict it.
+    """
+
+    def __init__(self, pdf_path: Path, root: Path | None = None) -> None:
+        self.digest = pdf_digest(pdf_path)
+        self.path = resolve_cache_dir(root) / f"{PAGE_CACHE_PREFIX}-{self.digest}"
+
+    def _page_file(self, page_index: int) -> Path:
+        return self.path / f"p{page_index:05d}.txt"
+
+    def page_count(self) -> int | None:
+        try:
+            meta = json.loads((self.path / "meta.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        n = meta.get("info", {}).get("pages")
+        return int(n) if n is not None else None
+
+    def get(self, page_index: int) -> str | None:
+        try:
+            return self._page_file(page_index).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def put(self, page_index: int, text: str) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        final = self._page_file(page_index)
+        tmp = final.with_name(f".{final.name}.{uuid.uuid4().hex}")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, final)
+
+    def write_meta(self, n_pages: int, *, hit: bool) -> None:
+        meta_path = self.path / "meta.json"
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            now = time.time()
+            meta = {"kind": "pages", "prefix": PAGE_CACHE_PREFIX, "created": now, "hits": 0}
+        self.path.mkdir(parents=True, exist_ok=True)
+        meta["bytes"] = sum(p.stat().st_size for p in self.path.glob("p*.txt"))
+        meta["last_used"] = time.time()
+        meta["hits"] = int(meta.get("hits", 0)) + int(hit)
+        meta["info"] = {"pages": n_pages}
+        tmp = meta_path.with_name(f".meta.json.{uuid.uuid4().hex}")
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, meta_path)
+
+
+@lru_cache(maxsize=4)
+def _reader(pdf_path: str, mtime_ns: int) -> PdfReader:
+    # One parsed document per worker process, reused across the page ranges it extracts.
+    from pypdf import PdfReader
+
+    return PdfReader(pdf_path)
+
+
+def _extract_range(pdf_path: str, mtime_ns: int, lo: int, hi: int) -> list[str]:
+    reader = _reader(pdf_path, mtime_ns)
+    return [reader.pages[i].extract_text() or "" for i in range(lo, hi)]
+
+
+def _missing_ranges(missing: list[int], chunk_pages: int) -> list[tuple[int, int]]:
+    """
+    Contiguous [lo, hi) runs of `missing` (sorted page indices), at most `chunk_pages` long.
+    """
+    ranges: list[tuple[int, int]] = []
+    for i in missing:
+        if ranges and ranges[-1][1] == i and i - ranges[-1][0] < chunk_pages:
+            ranges[-1] = (ranges[-1][0], i + 1)
+        else:
+            ranges.append((i, i + 1))
+    return ranges
+
+
+def iter_pages(
+    pdf_path: Path, *, workers: int = 1, cache: bool = True, chunk_pages: int = 16
+) -> Iterator[PdfPageText]:
+    """
+    Stream the text of every page in page order.
+
+    Cached pages are read back; the others are extracted in ranges of up to `chunk_pages` pages,
+    in `workers` processes when `workers > 1`, and added to the cache as they arrive.
+    """
+    path = str(pdf_path)
+    mtime_ns = pdf_path.stat().st_mtime_ns
+    store = PageTextCache(pdf_path) if cache else None
+    n_pages = store.page_count() if store is not None else None
+    if n_pages is None:
+        n_pages = len(_reader(path, mtime_ns).pages)
+
+    cached: dict[int, str] = {}
+    if store is not None:
+        for i in range(n_pages):
+            text = store.get(i)
+            if text is not None:
+                cached[i] = text
+    ranges = _missing_ranges([i for i in range(n_pages) if i not in cached], chunk_pages)
+
+    def emit(lo: int, texts: list[str]) -> Iterator[PdfPageText]:
+        for i, text in enumerate(texts, start=lo):
+            if store is not None:
+                store.put(i, text)
+            yield PdfPageText(page_index=i, text=text)
+
+    pool: ProcessPoolExecutor | None = None
+    extract = partial(_extract_range, path, mtime_ns)
+    try:
+        if workers > 1 and len(ranges) > 1:
+            pool = ProcessPoolExecutor(max_workers=min(workers, len(ranges)))
+            results = pool.map(extract, [lo for lo, _ in ranges], [hi for _, hi in ranges])
+        else:
+            results = (extract(lo, hi) for lo, hi in ranges)
+        page = 0
+        for lo, hi in ranges:
+            while page < lo:
+                yield PdfPageText(page_index=page, text=cached[page])
+                page += 1
+            yield from emit(lo, next(results))
+            page = hi
+        while page < n_pages:
+            yield PdfPageText(page_index=page, text=cached[page])
+            page += 1
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    if store is not None:
+        store.write_meta(n_pages, hit=bool(cached))
 
 
-def iter_pages(pdf_path: Path) -> Iterable[PdfPageText]:
-    yield from extract_pages(pdf_path)
+def extract_pages(pdf_path: Path, *, workers: int = 1, cache: bool = True) -> list[PdfPageText]:
+    return list(iter_pages(pdf_path, workers=workers, cache=cache))
@@ -0,0 +1,188 @@
+"""
+Lightweight per-stage timing for CLI runs.
+
+Library code wraps its stages in `span("stage.name")` and reports work done inside them with
+`add_count("rows", n)`. Both are no-ops unless a `Profiler` is active (`with Profiler() as prof:`),
+so the instrumentation stays in place at negligible cost. A profiler aggregates the spans into a
+per-stage table (calls, time, rows scanned, cache hits) and exports a Chrome trace
+(`chrome://tracing` / Perfetto "JSON trace event format") for offline analysis.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class SpanEvent:
+    name: str
+    start_ns: int  # time.perf_counter_ns(); monotonic and shared across processes on one host
+    dur_ns: int
+    pid: int
+    tid: int
+    args: dict[str, object] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class StageStats:
+    name: str
+    calls: int
+    seconds: float
+    counts: dict[str, int]
+
+
+_ACTIVE: Profiler | None = None
+_LOCAL = threading.local()
+
+
+def _stack() -> list[SpanEvent]:
+    stack = getattr(_LOCAL, "stack", None)
+    if stack is None:
+        stack = _LOCAL.stack = []
+    return stack
+
+
+def profiling_enabled() -> bool:
+    return _ACTIVE is not None
+
+
+def active_profiler() -> Profiler | None:
+    return _ACTIVE
+
+
+@contextmanager
+def span(name: str, **args: object) -> Iterator[None]:
+    """
+    Time the enclosed block as stage `name` (with optional `args` shown in the trace).
+    """
+    prof = _ACTIVE
+    if prof is None:
+        yield
+        return
+    event = SpanEvent(name, time.perf_counter_ns(), 0, os.getpid(), threading.get_ident(), args)
+    stack = _stack()
+    stack.append(event)
+    try:
+        yield
+    finally:
+        event.dur_ns = time.perf_counter_ns() - event.start_ns
+        stack.pop()
+        prof.record(event)
+
+
+def profiled(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorator form of `span` for whole functions.
+    """
+
+    def wrap(fn: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(fn)
+        def inner(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _ACTIVE is None:
+                return fn(*args, **kwargs)
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return inner
+
+    return wrap
+
+
+def add_count(name: str, n: int = 1) -> None:
+    """
+    Add `n` to counter `name` (e.g. "rows", "cache_hits") of the innermost open span.
+    """
+    if _ACTIVE is None:
+        return
+    stack = _stack()
+    if stack:
+        counts = stack[-1].counts
+        counts[name] = counts.get(name, 0) + int(n)
+
+
+class Profiler:
+    """
+    Collects spans while active; one profiler can be active per process at a time.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[SpanEvent] = []
+        self.origin_ns = time.perf_counter_ns()
+        self.wall_ns = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Profiler:
+        global _ACTIVE
+        self.origin_ns = time.perf_counter_ns()
+        _ACTIVE = self
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        global _ACTIVE
+        self.wall_ns = time.perf_counter_ns() - self.origin_ns
+        _ACTIVE = None
+
+    def record(self, event: SpanEvent) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def merge(self, events: list[SpanEvent]) -> None:
+        """
+        Add spans recorded elsewhere (e.g. returned by a worker process).
+        """
+        with self._lock:
+            self.events.extend(events)
+
+    def stages(self) -> list[StageStats]:
+        """
+        Per-stage totals in order of first appearance. Nested stages are counted in their own
+        row and in their parents' time.
+        """
+        first: dict[str, int] = {}
+        calls: dict[str, int] = {}
+        total: dict[str, int] = {}
+        counts: dict[str, dict[str, int]] = {}
+        for e in sorted(self.events, key=lambda e: e.start_ns):
+            first.setdefault(e.name, e.start_ns)
+            calls[e.name] = calls.get(e.name, 0) + 1
+            total[e.name] = total.get(e.name, 0) + e.dur_ns
+            stage_counts = counts.setdefault(e.name, {})
+            for k, v in e.counts.items():
+                stage_counts[k] = stage_counts.get(k, 0) + v
+        return [
+            StageStats(name, calls[name], total[name] / 1e9, counts[name])
+            for name in sorted(first, key=first.__getitem__)
+        ]
+
+    def chrome_trace(self) -> dict[str, object]:
+        events: list[dict[str, object]] = [
+            {
+                "name": e.name,
+                "cat": e.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (e.start_ns - self.origin_ns) / 1e3,
+                "dur": e.dur_ns / 1e3,
+                "pid": e.pid,
+                "tid": e.tid,
+                "args": {**{k: str(v) for k, v in e.args.items()}, **e.counts},
+            }
+            for e in sorted(self.events, key=lambda e: e.start_ns)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
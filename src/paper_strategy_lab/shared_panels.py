@@ -0,0 +1,113 @@
+"""
+Share wide panels (date x ticker DataFrames) with worker processes without pickling their values.
+
+The owning process copies each panel's values once into a `multiprocessing.shared_memory` block;
+workers receive small handles (block name, shape, dtype, index, columns) and rebuild read-only
+DataFrames directly over the shared buffers.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from types import TracebackType
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class SharedPanelHandle:
+    shm_name: str | None  # None for empty panels (nothing to share)
+    shape: tuple[int, int]
+    dtype: str
+    index: pd.Index
+    columns: pd.Index
+
+
+class SharedPanels:
+    """
+    Owns the shared-memory blocks for a set of named panels; use as a context manager.
+    """
+
+    def __init__(self, panels: dict[str, pd.DataFrame]) -> None:
+        self._blocks: list[shared_memory.SharedMemory] = []
+        self.handles: dict[str, SharedPanelHandle] = {}
+        try:
+            for name, frame in panels.items():
+                self.handles[name] = self._share(frame)
+        except BaseException:
+            self.close()
+            raise
+
+    def _share(self, frame: pd.DataFrame) -> SharedPanelHandle:
+        values = np.ascontiguousarray(frame.to_numpy())
+        if values.dtype == object:
+            raise TypeError("Only numeric/bool panels can be shared")
+        shm_name = None
+        if values.nbytes:
+            block = shared_memory.SharedMemory(create=True, size=values.nbytes)
+            self._blocks.append(block)
+            np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+            shm_name = block.name
+        return SharedPanelHandle(
+            shm_name=shm_name,
+            shape=(int(values.shape[0]), int(values.shape[1])),
+            dtype=values.dtype.str,
+            index=frame.index,
+            columns=frame.columns,
+        )
+
+    def close(self) -> None:
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+    def __enter__(self) -> SharedPanels:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+# Blocks attached in this (worker) process; kept referenced so the views stay valid.
+_ATTACHED: list[shared_memory.SharedMemory] = []
+
+
+def _attach_block(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before 3.13 attaching registers the block with the resource tracker, which would unlink it
+    # (and warn) when the worker exits. Unregistering afterwards is not an option: forked workers
+    # share the owner's tracker, so it would drop the owner's registration too. Skip it instead;
+    # the owner is responsible for unlinking.
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def attach_panels(handles: dict[str, SharedPanelHandle]) -> dict[str, pd.DataFrame]:
+    """
+    Rebuild read-only DataFrames over shared blocks created by `SharedPanels`.
+    """
+    panels: dict[str, pd.DataFrame] = {}
+    for name, h in handles.items():
+        if h.shm_name is None:
+            values = np.empty(h.shape, dtype=np.dtype(h.dtype))
+        else:
+            block = _attach_block(h.shm_name)
+            _ATTACHED.append(block)
+            values = np.ndarray(h.shape, dtype=np.dtype(h.dtype), buffer=block.buf)
+        values.flags.writeable = False
+        panels[name] = pd.DataFrame(values, index=h.index, columns=h.columns, copy=False)
+    return panels
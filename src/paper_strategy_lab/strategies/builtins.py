@@ -30,6 +30,18 @@ def _month_ends(index: pd.Index) -> pd.DatetimeIndex:
     return pd.DatetimeIndex(month_end.values)
 
 
+def _apply_universe_mask(data: MarketData, scores: pd.DataFrame) -> pd.DataFrame:
+    """
+    Blank out scores of tickers outside the point-in-time universe, if one was provided as the
+    bool feature `universe_mask` (date x ticker, True = member).
+    """
+    mask = data.features.get("universe_mask")
+    if mask is None:
+        return scores
+    mask = mask.reindex(index=scores.index, columns=scores.columns, fill_value=False)
+    return scores.where(mask.astype(bool))
+
+
 def _apply_monthly_rebalance(
     weights_on_rebalance_days: pd.DataFrame, index: pd.Index
 ) -> pd.DataFrame:
@@ -38,6 +50,38 @@ def _apply_monthly_rebalance(
     return _normalize_weights(w)
 
 
+def _hysteresis_positions(valid: np.ndarray, enter: np.ndarray, leave: np.ndarray) -> np.ndarray:
+    """
+    Long/flat state machine over a whole (date x ticker) grid.
+
+    Per column, starting flat: go long when flat and `enter`, go flat when long and `leave`, and
+    reset to flat wherever `valid` is False. When `enter` and `leave` never fire together the state
+    is just the forward-fill of the last entry/exit event; otherwise the (rare) overlapping case
+    steps through dates with whole-row array updates.
+    """
+    enter = valid & enter
+    leave = valid & leave
+    n_rows, n_cols = valid.shape
+
+    if not (enter & leave).any():
+        events = np.full((n_rows, n_cols), np.nan)
+        events[~valid | leave] = 0.0
+        events[enter] = 1.0
+        last = np.where(np.isnan(events), 0, np.arange(n_rows)[:, None])
+        np.maximum.accumulate(last, axis=0, out=last)
+        pos = events[last, np.arange(n_cols)]
+        return np.nan_to_num(pos, nan=0.0)
+
+    pos = np.zeros((n_rows, n_cols))
+    state = np.zeros(n_cols)
+    for i in range(n_rows):
+        flat = state == 0.0
+        state = np.where(flat & enter[i], 1.0, np.where(~flat & leave[i], 0.0, state))
+        state[~valid[i]] = 0.0
+        pos[i] = state
+    return pos
+
+
 def buy_and_hold(data: MarketData, **_params: object) -> pd.DataFrame:
     px = data.prices
     w = px.notna().astype(float)
@@ -47,22 +91,19 @@ def buy_and_hold(data: MarketData, **_params: object) -> pd.DataFrame:
 def sma_crossover(
     data: MarketData, fast: int = 20, slow: int = 100, **_params: object
 ) -> pd.DataFrame:
-    px = data.prices
     if fast <= 0 or slow <= 0 or fast >= slow:
         raise ValueError("Expected 0 < fast < slow")
-    fast_sma = px.rolling(fast).mean()
-    slow_sma = px.rolling(slow).mean()
+    fast_sma = data.sma(fast)
+    slow_sma = data.sma(slow)
     w = (fast_sma > slow_sma).astype(float)
     return _normalize_weights(w)
 
 
-def single_moving_average(
-    data: MarketData, window: int = 200, **_params: object
-) -> pd.DataFrame:
+def single_moving_average(data: MarketData, window: int = 200, **_params: object) -> pd.DataFrame:
     px = data.prices
     if window <= 0:
         raise ValueError("Expected window > 0")
-    w = (px > px.rolling(window).mean()).astype(float)
+    w = (px > data.sma(window)).astype(float)
     return _normalize_weights(w)
 
 
@@ -79,12 +120,11 @@ def three_moving_averages(
     slow: int = 200,
     **_params: object,
 ) -> pd.DataFrame:
-    px = data.prices
     if not (0 < fast < mid < slow):
         raise ValueError("Expected 0 < fast < mid < slow")
-    f = px.rolling(fast).mean()
-    m = px.rolling(mid).mean()
-    s = px.rolling(slow).mean()
+    f = data.sma(fast)
+    m = data.sma(mid)
+    s = data.sma(slow)
     w = ((f > m) & (m > s)).astype(float)
     return _normalize_weights(w)
 
@@ -102,21 +142,14 @@ def channel_breakout(
     hi: pd.DataFrame = pd.DataFrame(px.rolling(entry_days).max().shift(1))
     lo: pd.DataFrame = pd.DataFrame(px.rolling(exit_days).min().shift(1))
 
-    w: pd.DataFrame = pd.DataFrame(0.0, index=px.index, columns=px.columns)
-    for col in px.columns:
-        pos = 0.0
-        for i in range(len(px)):
-            p = px[col].iat[i]
-            h = hi[col].iat[i]
-            low = lo[col].iat[i]
-            if np.isnan(p) or np.isnan(h) or np.isnan(low):
-                pos = 0.0
-            elif pos == 0.0 and p > h:
-                pos = 1.0
-            elif pos == 1.0 and p < low:
-                pos = 0.0
-            w[col].iat[i] = pos
+    p = px.to_numpy(dtype=float)
+    h = hi.to_numpy(dtype=float)
+    low = lo.to_numpy(dtype=float)
+    valid = ~(np.isnan(p) | np.isnan(h) | np.isnan(low))
+    with np.errstate(invalid="ignore"):
+        pos = _hysteresis_positions(valid, enter=p > h, leave=p < low)
 
+    w = pd.DataFrame(pos, index=px.index, columns=px.columns)
     return _normalize_weights(w)
 
 
@@ -129,10 +162,9 @@ def support_resistance_breakout(
 def time_series_momentum(
     data: MarketData, lookback_days: int = 252, **_params: object
 ) -> pd.DataFrame:
-    px = data.prices
     if lookback_days <= 0:
         raise ValueError("Expected lookback_days > 0")
-    mom = px.pct_change(lookback_days, fill_method=None)
+    mom = data.returns(lookback_days)
     w = (mom > 0).astype(float)
     return _normalize_weights(w)
 
@@ -148,20 +180,12 @@ def mean_reversion_drawdown(
     if lookback_days <= 0:
         raise ValueError("Expected lookback_days > 0")
 
-    r = px.pct_change(lookback_days, fill_method=None)
-    w = pd.DataFrame(0.0, index=px.index, columns=px.columns)
-    for col in px.columns:
-        pos = 0.0
-        for i in range(len(px)):
-            x = r[col].iat[i]
-            if np.isnan(x):
-                pos = 0.0
-            elif pos == 0.0 and x <= entry_return:
-                pos = 1.0
-            elif pos == 1.0 and x >= exit_return:
-                pos = 0.0
-            w[col].iat[i] = pos
+    r = data.returns(lookback_days).to_numpy(dtype=float)
+    valid = ~np.isnan(r)
+    with np.errstate(invalid="ignore"):
+        pos = _hysteresis_positions(valid, enter=r <= entry_return, leave=r >= exit_return)
 
+    w = pd.DataFrame(pos, index=px.index, columns=px.columns)
     return _normalize_weights(w)
 
 
@@ -179,23 +203,12 @@ def sector_momentum_rotation(
     if top_k <= 0:
         raise ValueError("Expected top_k > 0")
 
-    mom = px.pct_change(lookback_days, fill_method=None)
-    ok = pd.DataFrame(True, index=px.index, columns=px.columns)
+    mom = data.returns(lookback_days)
+    ok = None
     if ma_filter_days is not None:
-        ok = px > px.rolling(ma_filter_days).mean()
-
-    rebalance_dates = _month_ends(px.index)
-    w_reb = pd.DataFrame(0.0, index=rebalance_dates, columns=px.columns)
-
-    for d in rebalance_dates:
-        scores = mom.loc[d]
-        scores = scores.where(ok.loc[d])
-        scores = scores.dropna().sort_values(ascending=False)
-        picks = list(scores.head(top_k).index)
-        if picks:
-            w_reb.loc[d, picks] = 1.0 / len(picks)
+        ok = px > data.sma(ma_filter_days)
 
-    return _apply_monthly_rebalance(w_reb, px.index)
+    return _monthly_rank_weights(mom, top_n=top_k, ascending=False, eligible=ok)
 
 
 def multi_asset_trend_following_equal_weight(
@@ -203,17 +216,8 @@ def multi_asset_trend_following_equal_weight(
     lookback_days: int = 252,
     **_params: object,
 ) -> pd.DataFrame:
-    px = data.prices
-
-    mom = px.pct_change(lookback_days, fill_method=None)
-    rebalance_dates = _month_ends(px.index)
-    w_reb = pd.DataFrame(0.0, index=rebalance_dates, columns=px.columns)
-    for d in rebalance_dates:
-        eligible = list(mom.loc[d][lambda s: s > 0].dropna().index)
-        if eligible:
-            w_reb.loc[d, eligible] = 1.0 / len(eligible)
-
-    return _apply_monthly_rebalance(w_reb, px.index)
+    mom = data.returns(lookback_days)
+    return _monthly_rank_weights(mom, top_n=None, ascending=False, eligible=mom > 0)
 
 
 def trend_following_momentum_inv_vol(
@@ -222,26 +226,80 @@ def trend_following_momentum_inv_vol(
     vol_days: int = 63,
     **_params: object,
 ) -> pd.DataFrame:
-    px = data.prices
+    mom = data.returns(lookback_days)
+    vol = data.rolling_vol(vol_days) * np.sqrt(252)
+
+    return _monthly_rank_weights(
+        mom, top_n=None, ascending=False, eligible=(mom > 0) & (vol > 0), inv_vol=vol
+    )
+
 
-    mom = px.pct_change(lookback_days, fill_method=None)
-    vol = px.pct_change(fill_method=None).rolling(vol_days).std() * np.sqrt(252)
+def _rank_select(
+    scores: np.ndarray,
+    *,
+    top_n: int | None,
+    ascending: bool,
+    eligible: np.ndarray | None = None,
+    inv_vol: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Row-wise top-N selection over a (rebalance date x ticker) score matrix.
 
-    rebalance_dates = _month_ends(px.index)
-    w_reb = pd.DataFrame(0.0, index=rebalance_dates, columns=px.columns)
-    for d in rebalance_dates:
-        m = mom.loc[d].dropna()
-        v = vol.loc[d].dropna()
-        eligible = [
-            c for c in px.columns if c in m.index and c in v.index and v[c] > 0 and m[c] > 0
-        ]
-        if not eligible:
-            continue
-        inv = pd.Series({c: 1.0 / float(v[c]) for c in eligible})
-        inv = inv / inv.sum()
-        w_reb.loc[d, eligible] = inv.values
+    Picks the `top_n` best non-NaN eligible scores per row (all eligible when `top_n` is None)
+    with one `argpartition` over the whole matrix, and returns weights: equal, or proportional to
+    1/`inv_vol` when given. Rows without picks get zero weight.
+    """
+    valid = ~np.isnan(scores)
+    if eligible is not None:
+        valid &= eligible
+    if inv_vol is not None:
+        valid &= ~np.isnan(inv_vol)
+
+    n_cols = scores.shape[1]
+    if top_n is None or top_n >= n_cols:
+        picks = valid
+    else:
+        key = np.where(valid, scores if ascending else -scores, np.inf)
+        best = np.argpartition(key, top_n - 1, axis=1)[:, :top_n]
+        picks = np.zeros_like(valid)
+        np.put_along_axis(picks, best, True, axis=1)
+        picks &= valid
+
+    if inv_vol is not None:
+        raw = np.zeros(scores.shape)
+        np.divide(1.0, inv_vol, out=raw, where=picks)
+    else:
+        raw = picks.astype(float)
+    total = raw.sum(axis=1, keepdims=True)
+    return np.divide(raw, total, out=np.zeros_like(raw), where=total > 0)
+
+
+def _monthly_rank_weights(
+    scores: pd.DataFrame,
+    *,
+    top_n: int | None,
+    ascending: bool,
+    eligible: pd.DataFrame | None = None,
+    inv_vol: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    rebalance_dates = _month_ends(scores.index)
 
-    return _apply_monthly_rebalance(w_reb, px.index)
+    def on_rebalance(frame: pd.DataFrame) -> np.ndarray:
+        return frame.reindex(index=rebalance_dates, columns=scores.columns).to_numpy()
+
+    w = _rank_select(
+        on_rebalance(scores).astype(float),
+        top_n=top_n,
+        ascending=ascending,
+        eligible=None
+        if eligible is None
+        else eligible.reindex(
+            index=rebalance_dates, columns=scores.columns, fill_value=False
+        ).to_numpy(dtype=bool),
+        inv_vol=None if inv_vol is None else on_rebalance(inv_vol).astype(float),
+    )
+    w_reb = pd.DataFrame(w, index=rebalance_dates, columns=scores.columns)
+    return _apply_monthly_rebalance(w_reb, scores.index)
 
 
 def _cross_sectional_topk_monthly(
@@ -253,18 +311,7 @@ def _cross_sectional_topk_monthly(
     if top_n <= 0:
         raise ValueError("Expected top_n > 0")
 
-    rebalance_dates = _month_ends(scores.index)
-    w_reb = pd.DataFrame(0.0, index=rebalance_dates, columns=scores.columns)
-
-    for d in rebalance_dates:
-        row = scores.loc[d].dropna()
-        if row.empty:
-            continue
-        picks = row.sort_values(ascending=ascending).head(top_n).index.tolist()
-        if picks:
-            w_reb.loc[d, picks] = 1.0 / len(picks)
-
-    return _apply_monthly_rebalance(w_reb, scores.index)
+    return _monthly_rank_weights(scores, top_n=top_n, ascending=ascending)
 
 
 def equity_cross_sectional_momentum(
@@ -276,8 +323,8 @@ def equity_cross_sectional_momentum(
     """
     Long-only cross-sectional momentum: hold top-N tickers by trailing return.
     """
-    px = data.prices
-    mom: pd.DataFrame = pd.DataFrame(px.pct_change(lookback_days, fill_method=None))
+    mom: pd.DataFrame = data.returns(lookback_days)
+    mom = _apply_universe_mask(data, mom)
     return _cross_sectional_topk_monthly(mom, top_n=top_n, ascending=False)
 
 
@@ -298,6 +345,7 @@ def equity_value_long_only(
 
     if value_field.lower() in {"pe", "pb", "ps"}:
         v = v.where(v > 0)
+    v = _apply_universe_mask(data, v)
 
     return _cross_sectional_topk_monthly(v, top_n=top_n, ascending=True)
 
@@ -311,12 +359,82 @@ def equity_low_volatility_long_only(
     """
     Long-only low-vol anomaly: hold top-N lowest realized volatility.
     """
-    px = data.prices
-    rets: pd.DataFrame = pd.DataFrame(px.pct_change(fill_method=None))
-    vol: pd.DataFrame = pd.DataFrame(rets.rolling(lookback_days).std())
+    vol: pd.DataFrame = data.rolling_vol(lookback_days)
+    vol = _apply_universe_mask(data, vol)
     return _cross_sectional_topk_monthly(vol, top_n=top_n, ascending=True)
 
 
+# Market variance at or below this fraction of the mean squared return counts as zero.
+_FLAT_VAR_RTOL = 1e-9
+
+
+def _window_sums(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing `window`-row sums of `x` (rows x cols) from one prefix sum; NaN for the first
+    `window - 1` rows, like `rolling(window).sum()` on data without gaps.
+    """
+    prefix = np.zeros((x.shape[0] + 1, *x.shape[1:]))
+    np.cumsum(x, axis=0, out=prefix[1:])
+    out = np.full(x.shape, np.nan)
+    out[window - 1 :] = prefix[window:] - prefix[:-window]
+    return out
+
+
+def _residual_momentum_scores(
+    px: np.ndarray,
+    market: np.ndarray,
+    *,
+    beta_window_days: int,
+    lookback_days: int,
+    block_cols: int = 32,
+) -> np.ndarray:
+    """
+    Residual momentum: trailing `lookback_days` sum of log(1 + CAPM residual return), with the
+    beta of each daily residual estimated over the trailing `beta_window_days`.
+
+    Missing returns count as 0 in the regression; a residual of -1 or below, or an undefined beta
+    (flat market), makes every score window containing it NaN. Works through the price panel
+    `block_cols` tickers at a time with prefix sums, so the temporaries are a few
+    (dates x `block_cols`) arrays and only the score panel is full size.
+    """
+    n_rows, n_cols = px.shape
+    out = np.full((n_rows, n_cols), np.nan)
+    if n_rows < 2 or n_cols == 0:
+        return out
+
+    w = beta_window_days
+    rm = np.zeros(n_rows)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rm[1:] = market[1:] / market[:-1] - 1.0
+    rm = np.nan_to_num(rm, nan=0.0, posinf=0.0, neginf=0.0)
+    rm_mean = _window_sums(rm, w) / w
+    mean_sq = _window_sums(rm * rm, w) / w
+    var_m = mean_sq - rm_mean * rm_mean
+    # A flat market leaves rounding residue (not exact zeros) after the prefix-sum differences.
+    var_m[~(var_m > _FLAT_VAR_RTOL * mean_sq)] = np.nan
+
+    for lo in range(0, n_cols, block_cols):
+        block = px[:, lo : lo + block_cols].astype(np.float64)
+        rs = np.zeros_like(block)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rs[1:] = block[1:] / block[:-1] - 1.0
+        rs[np.isnan(rs)] = 0.0
+
+        cov = _window_sums(rs * rm[:, None], w) / w
+        cov -= _window_sums(rs, w) / w * rm_mean[:, None]
+        beta = cov
+        beta /= var_m[:, None]
+        residual = rs - beta * rm[:, None]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            log_r = np.log1p(np.where(residual > -1.0, residual, np.nan))
+        bad = np.isnan(log_r)
+        sums = _window_sums(np.where(bad, 0.0, log_r), lookback_days)
+        gaps = _window_sums(bad.astype(np.float64), lookback_days)
+        out[:, lo : lo + block_cols] = np.where(gaps == 0.0, sums, np.nan)
+    return out
+
+
 def equity_residual_momentum(
     data: MarketData,
     lookback_days: int = 252,
@@ -330,28 +448,26 @@ def equity_residual_momentum(
     Requires `data.features['benchmark_spy']` containing SPY closeadj prices (single-column DF).
     """
     px = data.prices
-    spy_px = data.feature("benchmark_spy").reindex(px.index).ffill()
-    spy = spy_px.iloc[:, 0]
-
-    rs: pd.DataFrame = pd.DataFrame(px.pct_change(fill_method=None)).fillna(0.0)
-    rm: pd.Series = spy.pct_change(fill_method=None).fillna(0.0)
-
-    # Rolling beta via moments to avoid per-ticker regressions.
-    rm_mean = rm.rolling(beta_window_days).mean()
-    rm2_mean = (rm * rm).rolling(beta_window_days).mean()
-    var_m = rm2_mean - rm_mean * rm_mean
-    var_m = var_m.replace(0.0, np.nan)
-
-    rs_mean: pd.DataFrame = pd.DataFrame(rs.rolling(beta_window_days).mean())
-    rsm_mean: pd.DataFrame = pd.DataFrame(rs.mul(rm, axis=0).rolling(beta_window_days).mean())
-    cov_sm: pd.DataFrame = pd.DataFrame(rsm_mean - rs_mean.mul(rm_mean, axis=0))
-    beta: pd.DataFrame = pd.DataFrame(cov_sm.div(var_m, axis=0))
-
-    residual: pd.DataFrame = pd.DataFrame(rs - beta.mul(rm, axis=0))
-
-    # Residual momentum via rolling sum of log(1+r).
-    log1p: pd.DataFrame = pd.DataFrame(np.log1p(residual.replace(-1.0, np.nan)))
-    score: pd.DataFrame = pd.DataFrame(log1p.rolling(lookback_days).sum())
+    spy_px = pd.DataFrame(data.feature("benchmark_spy").reindex(px.index).ffill())
+
+    def scores(inputs: dict[str, pd.DataFrame]) -> pd.DataFrame:
+        prices = inputs["prices"]
+        values = _residual_momentum_scores(
+            prices.to_numpy(dtype=np.float64),
+            inputs["benchmark"].iloc[:, 0].to_numpy(dtype=np.float64),
+            beta_window_days=beta_window_days,
+            lookback_days=lookback_days,
+        )
+        return pd.DataFrame(values, index=prices.index, columns=prices.columns)
+
+    score = data.derived(
+        "residual_momentum",
+        {"beta_window_days": beta_window_days, "lookback_days": lookback_days},
+        scores,
+        warmup=beta_window_days + lookback_days,
+        inputs={"prices": px, "benchmark": spy_px},
+    )
+    score = _apply_universe_mask(data, score)
     return _cross_sectional_topk_monthly(score, top_n=top_n, ascending=False)
 
 
@@ -370,23 +486,25 @@ def equity_multifactor_long_only(
     Simple multifactor: z(mom) + z(-value) + z(-vol), then long top-N.
     """
     px = data.prices
-    mom: pd.DataFrame = pd.DataFrame(px.pct_change(lookback_days, fill_method=None))
-    rets: pd.DataFrame = pd.DataFrame(px.pct_change(fill_method=None))
-    vol: pd.DataFrame = pd.DataFrame(rets.rolling(vol_lookback_days).std())
+    mom: pd.DataFrame = data.returns(lookback_days)
+    vol: pd.DataFrame = data.rolling_vol(vol_lookback_days)
     val: pd.DataFrame = (
-        pd.DataFrame(data.feature(value_field)).reindex(px.index).ffill().reindex(columns=px.columns)
+        pd.DataFrame(data.feature(value_field))
+        .reindex(px.index)
+        .ffill()
+        .reindex(columns=px.columns)
     )
     if value_field.lower() in {"pe", "pb", "ps"}:
         val = val.where(val > 0)
+    # Z-scores are taken within the point-in-time universe only.
+    mom = _apply_universe_mask(data, mom)
+    vol = _apply_universe_mask(data, vol)
+    val = _apply_universe_mask(data, val)
 
     def zscore(frame: pd.DataFrame) -> pd.DataFrame:
         mu = frame.mean(axis=1)
         sd = pd.Series(frame.std(axis=1)).replace(0.0, np.nan)
         return frame.sub(mu, axis=0).div(sd, axis=0)
 
-    score = (
-        w_mom * zscore(mom)
-        + w_val * zscore(-val)
-        + w_low_vol * zscore(-vol)
-    )
+    score = w_mom * zscore(mom) + w_val * zscore(-val) + w_low_vol * zscore(-vol)
     return _cross_sectional_topk_monthly(score, top_n=top_n, ascending=False)
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 import pandas as pd
 
 from paper_strategy_lab.market_data import MarketData
+from paper_strategy_lab.profiling import span
 
 from .builtins import (
     buy_and_hold,
@@ -72,4 +73,5 @@ def run_strategy_weights(data: MarketData, spec: StrategySpec) -> pd.DataFrame:
     if not kind:
         raise ValueError(f"Strategy {spec.id!r} missing kind")
     fn = resolve_strategy_callable(kind)
-    return fn(data, **spec.params)
+    with span("strategy.weights", id=spec.id, kind=kind):
+        return fn(data, **spec.params)
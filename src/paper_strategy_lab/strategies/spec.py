@@ -16,3 +16,4 @@ class StrategySpec:
     universe_type: str | None
     universe_config: dict[str, Any]
     params: dict[str, Any]
+    benchmark: str | None = None  # benchmark id (see backtest.benchmarks); None = default
@@ -42,6 +42,7 @@ def load_strategy_specs(yaml_path: Path) -> list[StrategySpec]:
                 universe_type=str(universe_type).strip() if universe_type else None,
                 universe_config=universe_config,
                 params=params,
+                benchmark=str(item["benchmark"]).strip() if item.get("benchmark") else None,
             )
         )
     return specs
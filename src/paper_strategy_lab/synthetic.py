@@ -0,0 +1,174 @@
+"""
+Deterministic synthetic Sharadar-shaped dataset (SEP/SFP/DAILY/TICKERS CSVs) for benchmarks and
+tests, so loader scans, universes and backtests can be exercised without a licensed dump.
+
+Prices are per-ticker geometric random walks; some equities list late or are delisted part-way.
+The same arguments always produce byte-identical files.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ETFs referenced by the bundled strategy files and the benchmark registry.
+SYNTHETIC_ETFS = [
+    "SPY", "QQQ", "IWM", "EFA", "EEM", "TLT", "IEF", "LQD", "HYG", "GLD", "AGG",
+    "XLB", "XLE", "XLF", "XLI", "XLK", "XLP", "XLU", "XLV", "XLY", "XLRE",
+]  # fmt: skip
+
+_PRICE_COLUMNS = [
+    "ticker", "date", "open", "high", "low", "close", "volume", "closeadj", "closeunadj",
+    "lastupdated",
+]  # fmt: skip
+_DAILY_COLUMNS = [
+    "ticker", "date", "lastupdated", "ev", "evebit", "evebitda", "marketcap", "pb", "pe", "ps",
+]  # fmt: skip
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    n_equities: int = 500
+    start: str = "2015-01-01"
+    end: str = "2024-12-31"
+    seed: int = 0
+    delisted_fraction: float = 0.1
+
+    @property
+    def name(self) -> str:
+        return f"synthetic-{self.n_equities}-{self.start}-{self.end}-{self.seed}"
+
+
+def _random_walk(
+    rng: np.random.Generator, n_days: int, n_tickers: int, *, vol: tuple[float, float]
+) -> np.ndarray:
+    drift = rng.normal(0.0003, 0.0003, size=n_tickers)
+    sigma = rng.uniform(*vol, size=n_tickers)
+    shocks = rng.standard_normal((n_days, n_tickers)) * sigma + drift
+    start = rng.uniform(10.0, 200.0, size=n_tickers)
+    return start * np.exp(np.cumsum(shocks, axis=0))
+
+
+def _price_rows(
+    tickers: list[str],
+    days: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    live: np.ndarray,
+    lastupdated: str,
+) -> pd.DataFrame:
+    t_idx, d_idx = np.nonzero(live.T)  # ticker-major order, dates ascending per ticker
+    c = close[d_idx, t_idx]
+    return pd.DataFrame(
+        {
+            "ticker": np.asarray(tickers)[t_idx],
+            "date": days[d_idx],
+            "open": c * 0.999,
+            "high": c * 1.01,
+            "low": c * 0.99,
+            "close": c,
+            "volume": np.round(volume[d_idx, t_idx]).astype(np.int64),
+            "closeadj": c,
+            "closeunadj": c,
+            "lastupdated": lastupdated,
+        },
+        columns=pd.Index(_PRICE_COLUMNS),
+    )
+
+
+def write_synthetic_sharadar(
+    out_dir: Path, spec: SyntheticSpec | None = None, *, chunk_tickers: int = 250
+) -> Path:
+    """
+    Write `SHARADAR_{SEP,SFP,DAILY,TICKERS}_synthetic.csv` under `out_dir` and return it.
+
+    Equities are written `chunk_tickers` at a time, so memory stays bounded for large universes.
+    """
+    spec = spec or SyntheticSpec()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(spec.seed)
+    dates = pd.bdate_range(spec.start, spec.end)
+    n_days = len(dates)
+    days = dates.strftime("%Y-%m-%d").to_numpy()
+    lastupdated = str(days[-1]) if n_days else spec.end
+    equities = [f"E{i:05d}" for i in range(spec.n_equities)]
+
+    # Listing windows: ~20% list after the start, `delisted_fraction` stop before the end.
+    n = len(equities)
+    half = n_days // 2
+    first = np.where(rng.random(n) < 0.2, rng.integers(0, max(1, half), n), 0)
+    delisted = rng.random(n) < spec.delisted_fraction
+    last = np.where(delisted, rng.integers(half, max(half + 1, n_days), n), n_days - 1)
+    last = np.maximum(last, first)
+
+    sep_path = out_dir / "SHARADAR_SEP_synthetic.csv"
+    daily_path = out_dir / "SHARADAR_DAILY_synthetic.csv"
+    for path in (sep_path, daily_path):
+        path.unlink(missing_ok=True)
+    for lo in range(0, len(equities), chunk_tickers):
+        names = equities[lo : lo + chunk_tickers]
+        k = len(names)
+        close = _random_walk(rng, n_days, k, vol=(0.01, 0.035))
+        volume = rng.lognormal(np.log(rng.uniform(2e4, 5e6, size=k)), 0.5, size=(n_days, k))
+        day = np.arange(n_days)[:, None]
+        live = (day >= first[lo : lo + k]) & (day <= last[lo : lo + k])
+        rows = _price_rows(names, days, close, volume, live, lastupdated)
+        rows.to_csv(sep_path, mode="a", header=lo == 0, index=False, float_format="%.4f")
+
+        shares = rng.uniform(1e7, 1e9, size=k)
+        earnings = rng.normal(2.0, 3.0, size=k)
+        t_idx, d_idx = np.nonzero(live.T)
+        c = close[d_idx, t_idx]
+        cap = c * shares[t_idx] / 1e6
+        pe = np.where(earnings[t_idx] > 0, c / np.maximum(earnings[t_idx], 1e-3), np.nan)
+        daily = pd.DataFrame(
+            {
+                "ticker": np.asarray(names)[t_idx],
+                "date": rows["date"].to_numpy(),
+                "lastupdated": lastupdated,
+                "ev": cap * 1.2,
+                "evebit": pe * 0.8,
+                "evebitda": pe * 0.6,
+                "marketcap": cap,
+                "pb": c / rng.uniform(5.0, 60.0, size=k)[t_idx],
+                "pe": pe,
+                "ps": c / rng.uniform(5.0, 80.0, size=k)[t_idx],
+            },
+            columns=pd.Index(_DAILY_COLUMNS),
+        )
+        daily.to_csv(daily_path, mode="a", header=lo == 0, index=False, float_format="%.4f")
+
+    etf_close = _random_walk(rng, n_days, len(SYNTHETIC_ETFS), vol=(0.005, 0.015))
+    etf_volume = rng.lognormal(np.log(5e6), 0.4, size=(n_days, len(SYNTHETIC_ETFS)))
+    _price_rows(
+        SYNTHETIC_ETFS,
+        days,
+        etf_close,
+        etf_volume,
+        np.ones((n_days, len(SYNTHETIC_ETFS)), dtype=bool),
+        lastupdated,
+    ).to_csv(out_dir / "SHARADAR_SFP_synthetic.csv", index=False, float_format="%.4f")
+
+    day_str = days if n_days else np.array([spec.start])
+    tickers = pd.DataFrame(
+        {
+            "table": ["SEP"] * len(equities) + ["SFP"] * len(SYNTHETIC_ETFS),
+            "permaticker": np.arange(100_000, 100_000 + len(equities) + len(SYNTHETIC_ETFS)),
+            "ticker": equities + SYNTHETIC_ETFS,
+            "name": [f"Synthetic {t}" for t in equities + SYNTHETIC_ETFS],
+            "exchange": list(np.where(np.arange(len(equities)) % 3 == 0, "NASDAQ", "NYSE"))
+            + ["NYSEARCA"] * len(SYNTHETIC_ETFS),
+            "isdelisted": list(np.where(delisted, "Y", "N")) + ["N"] * len(SYNTHETIC_ETFS),
+            "category": ["Domestic Common Stock"] * len(equities) + ["ETF"] * len(SYNTHETIC_ETFS),
+            "currency": "USD",
+            "firstpricedate": list(day_str[np.minimum(first, len(day_str) - 1)])
+            + [day_str[0]] * len(SYNTHETIC_ETFS),
+            "lastpricedate": list(day_str[np.minimum(last, len(day_str) - 1)])
+            + [day_str[-1]] * len(SYNTHETIC_ETFS),
+        }
+    )
+    tickers.to_csv(out_dir / "SHARADAR_TICKERS_synthetic.csv", index=False)
+    return out_dir
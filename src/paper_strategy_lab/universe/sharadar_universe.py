@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-import hashlib
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from paper_strategy_lab.config import project_root
-from paper_strategy_lab.data_sources.sharadar import resolve_paths
+from paper_strategy_lab.cache import result_cache
+from paper_strategy_lab.data_sources.sharadar import (
+    SharadarPaths,
+    load_equity_price_fields,
+    resolve_paths,
+)
+from paper_strategy_lab.data_sources.sharadar_store import ColumnarTable, open_table_for
+from paper_strategy_lab.profiling import add_count, profiled
 
 
 @dataclass(frozen=True)
@@ -24,23 +31,59 @@ class EquityUniverseConfig:
     liquidity_lookback_days: int
 
 
-def _cache_json_path(prefix: str, key: dict) -> Path:
-    cache_dir = project_root() / "tmp" / "_cache"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:16]
-    return cache_dir / f"{prefix}_{digest}.json"
+@dataclass(frozen=True)
+class DynamicUniverse:
+    """
+    Point-in-time universe: `membership` is a date x ticker bool panel (True = in the universe on
+    that date), `tickers` every name that is a member at least once and `prices` their closeadj.
+    """
+
+    tickers: list[str]
+    membership: pd.DataFrame
+    prices: pd.DataFrame
+
+
+def _candidate_tickers(
+    paths: SharadarPaths,
+    *,
+    exchanges: list[str],
+    category: str,
+    isdelisted: str | None,
+    currency: str,
+) -> set[str]:
+    meta: pd.DataFrame = pd.read_csv(paths.tickers)
+    meta["ticker"] = meta["ticker"].astype(str).str.upper()
+    meta = meta.loc[meta["currency"] == currency].copy()
+    if isdelisted is not None:
+        meta = meta.loc[meta["isdelisted"] == isdelisted].copy()
+    meta = meta.loc[meta["category"] == category].copy()
+    meta = meta.loc[meta["exchange"].isin(exchanges)].copy()
+    return set(meta["ticker"].dropna().astype(str).str.upper().tolist())
 
 
-def _avg_dollar_volume_sep(
+@profiled("universe.liquidity_scan")
+def _liquidity_stats_sep(
     sep_csv: Path, tickers: set[str], *, start: str | None, end: str | None
-) -> dict[str, float]:
+) -> pd.DataFrame:
+    """
+    Average dollar volume and last closeadj per ticker from a single pass over SEP.
+
+    Returns a frame indexed by ticker with columns `adv` and `last_price` (NaN if unavailable).
+    """
+    store = open_table_for(sep_csv)
+    if store is not None:
+        return _liquidity_stats_store(store, tickers, start=start, end=end)
+
     usecols: object = ["ticker", "date", "closeadj", "volume"]
-    sums: dict[str, float] = {}
-    counts: dict[str, int] = {}
+    dv_parts: list[pd.DataFrame] = []
+    last_parts: list[pd.DataFrame] = []
 
     for chunk in pd.read_csv(  # type: ignore[call-overload, arg-type]
-        sep_csv, usecols=usecols, chunksize=2_000_000  # pyright: ignore[reportArgumentType]
+        sep_csv,
+        usecols=usecols,  # pyright: ignore[reportArgumentType]
+        chunksize=2_000_000,
     ):
+        add_count("rows", len(chunk))
         chunk["ticker"] = chunk["ticker"].astype(str).str.upper()
         chunk = chunk[chunk["ticker"].isin(tickers)]
         if chunk.empty:
@@ -51,29 +94,68 @@ def _avg_dollar_volume_sep(
             chunk = chunk[chunk["date"] >= pd.to_datetime(start)]
         if end:
             chunk = chunk[chunk["date"] <= pd.to_datetime(end)]
+        chunk = chunk.dropna(subset=["closeadj"])
         if chunk.empty:
             continue
 
-        chunk = chunk.dropna(subset=["closeadj", "volume"])
-        if chunk.empty:
-            continue
+        dv = (chunk["closeadj"].astype(float) * chunk["volume"].astype(float)).dropna()
+        dv_parts.append(dv.groupby(chunk.loc[dv.index, "ticker"]).agg(["sum", "count"]))
+
+        latest = chunk.sort_values("date", kind="stable").drop_duplicates("ticker", keep="last")
+        last_parts.append(latest[["ticker", "date", "closeadj"]])
+
+    if not last_parts:
+        return pd.DataFrame({"adv": pd.Series(dtype=float), "last_price": pd.Series(dtype=float)})
+
+    totals = pd.concat(dv_parts).groupby(level=0).sum()
+    totals = totals[totals["count"] > 0]
+    latest = (
+        pd.concat(last_parts, ignore_index=True)
+        .sort_values("date", kind="stable")
+        .drop_duplicates("ticker", keep="last")
+        .set_index("ticker")
+    )
+    out = pd.DataFrame({"adv": totals["sum"] / totals["count"], "last_price": latest["closeadj"]})
+    out.index.name = None
+    return out.astype(float)
+
 
-        dv = chunk["closeadj"].astype(float) * chunk["volume"].astype(float)
-        chunk = chunk.assign(dv=dv)
-        grouped = chunk.groupby("ticker")["dv"].agg(["sum", "count"])
-        for t, row in grouped.iterrows():
-            t = str(t)
-            sums[t] = sums.get(t, 0.0) + float(row["sum"])
-            counts[t] = counts.get(t, 0) + int(row["count"])
+def _liquidity_stats_store(
+    store: ColumnarTable, tickers: set[str], *, start: str | None, end: str | None
+) -> pd.DataFrame:
+    rows = store.read_rows(sorted(tickers), ["closeadj", "volume"], start=start, end=end)
+    if not rows.tickers:
+        return pd.DataFrame({"adv": pd.Series(dtype=float), "last_price": pd.Series(dtype=float)})
 
-    out = {}
-    for t, s in sums.items():
-        c = counts.get(t, 0)
-        if c > 0:
-            out[t] = s / c
-    return out
+    px = rows.values["closeadj"]
+    dv = px * rows.values["volume"]
+    starts = rows.starts[:-1]
 
+    # Segment reductions over the per-ticker row ranges (no per-ticker Python work).
+    dv_ok = ~np.isnan(dv)
+    sums = np.add.reduceat(np.where(dv_ok, dv, 0.0), starts)
+    counts = np.add.reduceat(dv_ok.astype(np.int64), starts)
+    last_idx = np.maximum.reduceat(np.where(np.isnan(px), -1, np.arange(len(px))), starts)
 
+    with np.errstate(invalid="ignore", divide="ignore"):
+        adv = np.where(counts > 0, sums / counts, np.nan)
+    last_price = np.where(last_idx >= starts, px[np.maximum(last_idx, 0)], np.nan)
+    return pd.DataFrame({"adv": adv, "last_price": last_price}, index=pd.Index(rows.tickers))
+
+
+def universe_kwargs_from_config(config: dict[str, Any]) -> dict[str, Any]:
+    """
+    `build_us_equities_liquid[_pit]` keyword arguments from a spec's `universe_config`.
+    """
+    return {
+        "max_tickers": int(config.get("max_tickers", 500)),
+        "min_price": float(config.get("min_price", 5.0)),
+        "exchanges": list(config.get("exchanges", ["NYSE", "NASDAQ"])),
+        "liquidity_lookback_days": int(config.get("liquidity_lookback_days", 63)),
+    }
+
+
+@profiled("universe.build")
 def build_us_equities_liquid(
     *,
     sharadar_dir: Path | None = None,
@@ -111,57 +193,152 @@ def build_us_equities_liquid(
         "min_price": min_price,
         "liq_days": liquidity_lookback_days,
     }
-    cache_path = _cache_json_path("universe", key)
-    if cache_path.exists():
-        with suppress(Exception):
-            return [t for t in cache_path.read_text(encoding="utf-8").splitlines() if t.strip()]
+    cache = result_cache()
+    cached = cache.get_json("universe", key)
+    if isinstance(cached, list):
+        add_count("cache_hits")
+        return [str(t) for t in cached]
+    add_count("cache_misses")
 
-    meta: pd.DataFrame = pd.read_csv(paths.tickers)
-    meta["ticker"] = meta["ticker"].astype(str).str.upper()
-    meta = meta.loc[(meta["currency"] == currency) & (meta["isdelisted"] == isdelisted)].copy()
-    meta = meta.loc[meta["category"] == category].copy()
-    meta = meta.loc[meta["exchange"].isin(exchanges)].copy()
-
-    candidates = set(meta["ticker"].dropna().astype(str).str.upper().tolist())
+    candidates = _candidate_tickers(
+        paths, exchanges=exchanges, category=category, isdelisted=isdelisted, currency=currency
+    )
     if not candidates:
         return []
 
-    # Liquidity ranking via average dollar volume (static over full window for now).
-    adv = _avg_dollar_volume_sep(paths.sep_prices, candidates, start=start, end=end)
+    # Liquidity ranking via average dollar volume (static over full window for now), plus the
+    # last available closeadj in the window as a simple penny-stock filter; both come from the
+    # same SEP scan.
+    stats = _liquidity_stats_sep(paths.sep_prices, candidates, start=start, end=end)
+    adv = stats["adv"].dropna()
     ranked = sorted(adv.items(), key=lambda kv: kv[1], reverse=True)
-    tickers = [t for t, _ in ranked[: max_tickers * 3]]
+    tickers = [str(t) for t, _ in ranked[: max_tickers * 3]]
     if not tickers:
         return []
 
-    # Apply a simple price filter using last available closeadj in the window.
-    # This avoids penny stocks without building a full dynamic filter.
-    last_prices = {}
-    usecols: object = ["ticker", "date", "closeadj"]
-    tick_set = set(tickers)
-    for chunk in pd.read_csv(  # type: ignore[call-overload, arg-type]
-        paths.sep_prices, usecols=usecols, chunksize=2_000_000  # pyright: ignore[reportArgumentType]
-    ):
-        chunk["ticker"] = chunk["ticker"].astype(str).str.upper()
-        chunk = chunk[chunk["ticker"].isin(tick_set)]
-        if chunk.empty:
-            continue
-        chunk["date"] = pd.to_datetime(chunk["date"])
-        if start:
-            chunk = chunk[chunk["date"] >= pd.to_datetime(start)]
-        if end:
-            chunk = chunk[chunk["date"] <= pd.to_datetime(end)]
-        if chunk.empty:
-            continue
-        chunk = chunk.dropna(subset=["closeadj"])
-        if chunk.empty:
-            continue
-        # keep last seen by date
-        chunk = chunk.sort_values("date")
-        for t, sub in chunk.groupby("ticker"):
-            last_prices[str(t)] = float(sub["closeadj"].iloc[-1])
-
+    last_prices = stats["last_price"].dropna().to_dict()
     filtered = [t for t in tickers if last_prices.get(t, 0.0) >= min_price]
     final = filtered[:max_tickers]
 
-    cache_path.write_text("\n".join(final) + "\n", encoding="utf-8")
+    with suppress(Exception):
+        cache.put_json("universe", key, final)
     return final
+
+
+def _month_end_dates(index: pd.Index) -> pd.DatetimeIndex:
+    idx = pd.DatetimeIndex(index)
+    s = idx.to_series()
+    return pd.DatetimeIndex(s.groupby(s.dt.to_period("M")).max().sort_index().values)
+
+
+def point_in_time_membership(
+    closeadj: pd.DataFrame,
+    volume: pd.DataFrame,
+    *,
+    max_tickers: int,
+    min_price: float,
+    liquidity_lookback_days: int,
+    rebalance_dates: pd.DatetimeIndex | None = None,
+) -> pd.DataFrame:
+    """
+    Rolling-liquidity universe membership, re-selected on each rebalance date (month-ends default).
+
+    On a rebalance date a ticker is eligible if it has a trailing `liquidity_lookback_days` average
+    dollar volume (at least half the window observed) and trades at >= `min_price` that day; the
+    `max_tickers` most liquid eligible names are members until the next rebalance date. Only data
+    up to each rebalance date is used, so the panel is free of look-ahead and survivorship bias.
+    """
+    if liquidity_lookback_days <= 0:
+        raise ValueError("Expected liquidity_lookback_days > 0")
+    if max_tickers <= 0:
+        raise ValueError("Expected max_tickers > 0")
+
+    px = closeadj.sort_index()
+    if px.empty:
+        return pd.DataFrame(False, index=px.index, columns=px.columns)
+    vol = volume.reindex(index=px.index, columns=px.columns)
+
+    adv = (
+        (px * vol)
+        .rolling(liquidity_lookback_days, min_periods=max(1, liquidity_lookback_days // 2))
+        .mean()
+    )
+
+    if rebalance_dates is None:
+        rebalance_dates = _month_end_dates(px.index)
+    adv_r = adv.reindex(rebalance_dates).to_numpy(dtype=float)
+    px_r = px.reindex(rebalance_dates).to_numpy(dtype=float)
+
+    with np.errstate(invalid="ignore"):
+        eligible = ~np.isnan(adv_r) & (px_r >= min_price)
+    score = np.where(eligible, adv_r, -np.inf)
+
+    k = min(max_tickers, score.shape[1])
+    top = np.argpartition(-score, k - 1, axis=1)[:, :k]
+    member = np.zeros_like(eligible)
+    np.put_along_axis(member, top, True, axis=1)
+    member &= eligible
+
+    # Carry each selection forward until the next rebalance date (no members before the first).
+    pos = np.searchsorted(rebalance_dates.to_numpy(), px.index.to_numpy(), side="right") - 1
+    daily = np.where((pos >= 0)[:, None], member[np.maximum(pos, 0)], False)
+    return pd.DataFrame(daily, index=px.index, columns=px.columns)
+
+
+@profiled("universe.build_pit")
+def build_us_equities_liquid_pit(
+    *,
+    sharadar_dir: Path | None = None,
+    start: str | None = None,
+    end: str | None = None,
+    exchanges: list[str] | None = None,
+    category: str = "Domestic Common Stock",
+    currency: str = "USD",
+    max_tickers: int = 500,
+    min_price: float = 5.0,
+    liquidity_lookback_days: int = 63,
+) -> DynamicUniverse:
+    """
+    Point-in-time variant of `build_us_equities_liquid`.
+
+    Delisted names are kept as candidates, and liquidity/price filters are re-evaluated on each
+    month-end using a trailing `liquidity_lookback_days` window over one closeadj+volume load.
+    """
+    if exchanges is None:
+        exchanges = ["NYSE", "NASDAQ"]
+
+    paths = resolve_paths(sharadar_dir)
+    candidates = _candidate_tickers(
+        paths, exchanges=exchanges, category=category, isdelisted=None, currency=currency
+    )
+    if not candidates:
+        empty = pd.DataFrame()
+        return DynamicUniverse(tickers=[], membership=empty, prices=empty)
+
+    # Load enough history before `start` to warm up the first liquidity window.
+    load_start = start
+    if start:
+        day = pd.Timestamp(start).to_datetime64().astype("datetime64[D]")
+        load_start = str(np.busday_offset(day, -(liquidity_lookback_days + 5), roll="backward"))
+    panels = load_equity_price_fields(
+        sorted(candidates),
+        fields=["closeadj", "volume"],
+        start=load_start,
+        end=end,
+        sharadar_dir=sharadar_dir,
+    )
+    closeadj, volume = panels["closeadj"], panels["volume"]
+
+    membership = point_in_time_membership(
+        closeadj,
+        volume,
+        max_tickers=max_tickers,
+        min_price=min_price,
+        liquidity_lookback_days=liquidity_lookback_days,
+    )
+    if start:
+        membership = membership.loc[membership.index >= pd.Timestamp(start)]
+    membership = membership.loc[:, membership.any(axis=0)]
+    tickers = [str(t) for t in membership.columns]
+    prices = closeadj.reindex(index=membership.index, columns=membership.columns)
+    return DynamicUniverse(tickers=tickers, membership=membership, prices=prices)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from paper_strategy_lab.bench import compare_to_baseline, run_bench
+from paper_strategy_lab.config import project_root
+from paper_strategy_lab.data_sources.sharadar import load_equity_prices, load_prices
+from paper_strategy_lab.synthetic import SyntheticSpec, write_synthetic_sharadar
+
+
+def test_synthetic_data_is_deterministic_and_loadable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    spec = SyntheticSpec(n_equities=12, start="2020-01-01", end="2020-06-30", seed=3)
+    a = write_synthetic_sharadar(tmp_path / "a", spec, chunk_tickers=5)
+    b = write_synthetic_sharadar(tmp_path / "b", spec, chunk_tickers=5)
+    for name in sorted(p.name for p in a.iterdir()):
+        assert (a / name).read_bytes() == (b / name).read_bytes(), name
+
+    monkeypatch.setenv("SHARADAR_DIR", str(a))
+    monkeypatch.setenv("SHARADAR_STORE_DIR", str(tmp_path / "store"))
+    monkeypatch.setenv("PAPER_STRATEGY_LAB_CACHE_DIR", str(tmp_path / "cache"))
+    etf = load_prices(["SPY", "AGG"])
+    assert list(etf.columns) == ["AGG", "SPY"]
+    assert etf.notna().all().all()
+    equities = load_equity_prices(["E00000", "E00011"])
+    assert list(equities.columns) == ["E00000", "E00011"]
+
+
+def test_bench_report_and_baseline_comparison(tmp_path: Path) -> None:
+    data = write_synthetic_sharadar(
+        tmp_path / "data", SyntheticSpec(n_equities=20, start="2019-01-01", end="2020-12-31")
+    )
+    report = run_bench(
+        data,
+        spec_file=project_root() / "strategies" / "ssrn-3247865.yaml",
+        work_dir=tmp_path / "work",
+        repeat=1,
+        only="scan.",
+    )
+    results: dict = report["results"]  # type: ignore[assignment]
+    assert sorted(results) == ["scan.daily_metrics", "scan.sep_prices", "scan.sfp_prices"]
+    assert all(r["best"] > 0 for r in results.values())
+
+    slower = {
+        "format": report["format"],
+        "results": {k: {**v, "best": v["best"] * 2} for k, v in results.items()},
+    }
+    assert compare_to_baseline(report, report) == []
+    assert sorted(r.name for r in compare_to_baseline(slower, report)) == sorted(results)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from paper_strategy_lab.backtest import bootstrap
+from paper_strategy_lab.backtest.bootstrap import (
+    BootstrapConfig,
+    block_bootstrap_indices,
+    bootstrap_metrics,
+)
+from paper_strategy_lab.backtest.leaderboard import (
+    BENCHMARK_PANEL,
+    LeaderboardConfig,
+    LeaderboardJob,
+    evaluate_job,
+)
+from paper_strategy_lab.backtest.metrics import calmar_ratio, sharpe_ratio
+from paper_strategy_lab.strategies.spec import StrategySpec
+
+
+def test_indices_are_circular_blocks() -> None:
+    idx = block_bootstrap_indices(10, 50, block_days=4, rng=np.random.default_rng(0))
+    assert idx.shape == (50, 10)
+    assert idx.min() >= 0 and idx.max() < 10
+    # Within each block of 4, indices step by one (wrapping around the end).
+    for block in (idx[:, 0:4], idx[:, 4:8]):
+        assert (np.diff(block, axis=1) % 10 == 1).all()
+
+
+def test_batched_bootstrap_matches_per_sample_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(1)
+    r = rng.normal(0.0004, 0.01, size=300)
+    config = BootstrapConfig(samples=200, block_days=10, confidence=0.8, seed=7)
+    out = bootstrap_metrics(r, config=config)
+
+    idx = block_bootstrap_indices(300, 200, block_days=10, rng=np.random.default_rng(7))
+    sharpes = [sharpe_ratio(pd.Series(r[i])) for i in idx]
+    calmars = [calmar_ratio(pd.Series(r[i])) for i in idx]
+    assert out["sharpe_lo"] == pytest.approx(np.quantile(sharpes, 0.1))
+    assert out["sharpe_hi"] == pytest.approx(np.quantile(sharpes, 0.9))
+    assert out["calmar_lo"] == pytest.approx(np.quantile(calmars, 0.1))
+    assert "p_beat_sharpe" not in out
+
+    # Splitting the resamples into more batches draws the same paths.
+    monkeypatch.setattr(bootstrap, "_BATCH_CELLS", 300 * 7)
+    assert bootstrap_metrics(r, config=config) == out
+
+
+def test_probability_of_beating_the_benchmark() -> None:
+    rng = np.random.default_rng(2)
+    bench = rng.normal(0.0002, 0.01, size=500)
+    config = BootstrapConfig(samples=300, block_days=5)
+    better = bootstrap_metrics(bench + 0.001, bench, config)
+    assert better["p_beat_sharpe"] == 1.0
+    assert bootstrap_metrics(bench - 0.001, bench, config)["p_beat_sharpe"] == 0.0
+    assert better["sharpe_lo"] < better["sharpe_hi"]
+
+
+def test_leaderboard_rows_carry_intervals() -> None:
+    rng = np.random.default_rng(3)
+    idx = pd.bdate_range("2018-01-01", periods=400)
+    px = pd.DataFrame(
+        100.0 * np.cumprod(1.0 + rng.normal(0.0003, 0.01, size=(len(idx), 2)), axis=0),
+        index=idx,
+        columns=["AAA", "SPY"],
+    )
+    spec = StrategySpec(
+        id="sma",
+        name="sma",
+        description=None,
+        paper_section=None,
+        paper_title=None,
+        kind="sma_crossover",
+        universe=["AAA"],
+        universe_type=None,
+        universe_config={},
+        params={"fast": 20, "slow": 100},
+    )
+    job = LeaderboardJob(spec=spec, universe_label="x", prices="px")
+    panels = {"px": px[["AAA"]], BENCHMARK_PANEL: px[["SPY"]]}
+    config = LeaderboardConfig(start=None, end=None, years=5)
+
+    plain = evaluate_job(job, panels, config)
+    row = evaluate_job(job, panels, replace(config, bootstrap=BootstrapConfig(samples=100)))
+    assert plain is not None and row is not None
+    assert "sharpe_lo" not in plain
+    lo, point, hi = (float(row[k]) for k in ("sharpe_lo", "sharpe", "sharpe_hi"))  # type: ignore[arg-type]
+    assert lo <= point <= hi
+    assert 0.0 <= float(row["p_beat_calmar"]) <= 1.0  # type: ignore[arg-type]
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from paper_strategy_lab.market_data import MarketData
+from paper_strategy_lab.strategies.builtins import (
+    _apply_monthly_rebalance,
+    _month_ends,
+    _residual_momentum_scores,
+    channel_breakout,
+    equity_cross_sectional_momentum,
+    mean_reversion_drawdown,
+    trend_following_momentum_inv_vol,
+)
+
+
+def _random_prices(seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range("2020-01-01", periods=300)
+    rets = rng.normal(0.0, 0.02, size=(len(idx), 4))
+    px = pd.DataFrame(100.0 * np.cumprod(1.0 + rets, axis=0), index=idx, columns=list("ABCD"))
+    px.iloc[:40, 2] = np.nan  # late listing
+    px.iloc[150:160, 3] = np.nan  # gap
+    return px
+
+
+def _reference_hysteresis(
+    valid: pd.DataFrame, enter: pd.DataFrame, leave: pd.DataFrame
+) -> pd.DataFrame:
+    w = pd.DataFrame(0.0, index=valid.index, columns=valid.columns)
+    for j in range(valid.shape[1]):
+        pos = 0.0
+        for i in range(valid.shape[0]):
+            if not valid.iat[i, j]:
+                pos = 0.0
+            elif pos == 0.0 and enter.iat[i, j]:
+                pos = 1.0
+            elif pos == 1.0 and leave.iat[i, j]:
+                pos = 0.0
+            w.iat[i, j] = pos
+    return w
+
+
+def _normalized(w: pd.DataFrame) -> pd.DataFrame:
+    total = w.sum(axis=1)
+    return w.div(total.where(total > 0, 1.0), axis=0)
+
+
+def test_channel_breakout_matches_reference_loop() -> None:
+    px = _random_prices()
+    hi = px.rolling(20).max().shift(1)
+    lo = px.rolling(10).min().shift(1)
+    expected = _reference_hysteresis(px.notna() & hi.notna() & lo.notna(), px > hi, px < lo)
+
+    got = channel_breakout(MarketData(prices=px), entry_days=20, exit_days=10)
+    pd.testing.assert_frame_equal(got, _normalized(expected))
+
+
+def test_mean_reversion_matches_reference_loop_with_overlapping_thresholds() -> None:
+    px = _random_prices(seed=1)
+    r = px.pct_change(5, fill_method=None)
+    for entry, exit_ in [(-0.03, 0.0), (0.01, -0.01)]:  # second case: enter & exit overlap
+        expected = _reference_hysteresis(r.notna(), r <= entry, r >= exit_)
+        got = mean_reversion_drawdown(
+            MarketData(prices=px), lookback_days=5, entry_return=entry, exit_return=exit_
+        )
+        pd.testing.assert_frame_equal(got, _normalized(expected))
+
+
+def test_vectorized_rank_selection_matches_per_date_loop() -> None:
+    px = _random_prices(seed=2)
+    data = MarketData(prices=px)
+    rebalance = _month_ends(px.index)
+
+    mom = px.pct_change(20, fill_method=None)
+    expected = pd.DataFrame(0.0, index=rebalance, columns=px.columns)
+    for d in rebalance:
+        picks = mom.loc[d].dropna().sort_values(ascending=False).head(2).index
+        if len(picks):
+            expected.loc[d, picks] = 1.0 / len(picks)
+    got = equity_cross_sectional_momentum(data, lookback_days=20, top_n=2)
+    pd.testing.assert_frame_equal(got, _apply_monthly_rebalance(expected, px.index))
+
+    vol = px.pct_change(fill_method=None).rolling(20).std() * np.sqrt(252)
+    expected = pd.DataFrame(0.0, index=rebalance, columns=px.columns)
+    for d in rebalance:
+        m, v = mom.loc[d], vol.loc[d]
+        ok = [c for c in px.columns if m[c] > 0 and v[c] > 0]
+        if ok:
+            inv = 1.0 / v[ok]
+            expected.loc[d, ok] = (inv / inv.sum()).to_numpy()
+    got = trend_following_momentum_inv_vol(data, lookback_days=20, vol_days=20)
+    pd.testing.assert_frame_equal(got, _apply_monthly_rebalance(expected, px.index))
+
+
+def _reference_residual_momentum(
+    px: pd.DataFrame, spy: pd.Series, *, beta_window: int, lookback: int
+) -> pd.DataFrame:
+    # The original pandas formulation (rolling moments, then a rolling log-sum).
+    rs = pd.DataFrame(px.pct_change(fill_method=None)).fillna(0.0)
+    rm = spy.pct_change(fill_method=None).fillna(0.0)
+    rm_mean = rm.rolling(beta_window).mean()
+    var_m = ((rm * rm).rolling(beta_window).mean() - rm_mean * rm_mean).replace(0.0, np.nan)
+    cov = rs.mul(rm, axis=0).rolling(beta_window).mean() - rs.rolling(beta_window).mean().mul(
+        rm_mean, axis=0
+    )
+    residual = rs - cov.div(var_m, axis=0).mul(rm, axis=0)
+    log1p = pd.DataFrame(np.log1p(residual.replace(-1.0, np.nan)))
+    return pd.DataFrame(log1p.rolling(lookback).sum())
+
+
+def test_residual_momentum_kernel_matches_pandas_reference() -> None:
+    px = _random_prices(seed=3)
+    spy = pd.Series(
+        100.0 * np.cumprod(1.0 + np.random.default_rng(9).normal(0.0, 0.01, len(px))),
+        index=px.index,
+    )
+    spy.iloc[200:230] = spy.iloc[199]  # flat market: undefined beta
+    expected = _reference_residual_momentum(px, spy, beta_window=20, lookback=30)
+    for block_cols in (1, 3, 512):
+        got = _residual_momentum_scores(
+            px.to_numpy(),
+            spy.to_numpy(),
+            beta_window_days=20,
+            lookback_days=30,
+            block_cols=block_cols,
+        )
+        np.testing.assert_array_equal(np.isnan(got), expected.isna().to_numpy())
+        np.testing.assert_allclose(got, expected.to_numpy(), rtol=1e-9, atol=1e-12)
+
+
+def test_residual_momentum_is_undefined_over_a_steadily_rising_market() -> None:
+    px = _random_prices(seed=4)
+    rm = np.random.default_rng(5).normal(0.0, 0.01, len(px))
+    rm[150:200] = 0.0013  # constant return: zero variance, but not after prefix-sum rounding
+    spy = 100.0 * np.cumprod(1.0 + rm)
+
+    got = _residual_momentum_scores(px.to_numpy(), spy, beta_window_days=20, lookback_days=10)
+
+    # Beta windows inside the flat stretch end on rows 169..199; score windows over them are NaN.
+    assert np.isnan(got[169:209]).all()
+    assert np.isfinite(got[140:169]).all() and np.isfinite(got[209:]).all()
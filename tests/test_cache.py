@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from paper_strategy_lab.cache import ResultCache
+
+
+def _panel(n: int) -> pd.DataFrame:
+    idx = pd.bdate_range("2020-01-01", periods=n, name="date")
+    return pd.DataFrame(
+        np.arange(n * 2, dtype=float).reshape(n, 2), index=idx, columns=["AAA", "BBB"]
+    )
+
+
+def test_frame_round_trip_is_memory_mapped(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path, max_bytes=0)
+    panel = _panel(10)
+
+    assert cache.get_frame("prices", {"k": 1}) is None
+    cache.put_frame("prices", {"k": 1}, panel)
+    cache.put_json("universe", {"k": 1}, ["AAA", "BBB"])
+
+    loaded = cache.get_frame("prices", {"k": 1})
+    assert loaded is not None
+    pd.testing.assert_frame_equal(loaded, panel, check_freq=False)
+    assert not loaded.to_numpy().flags.writeable
+    assert cache.get_json("universe", {"k": 1}) == ["AAA", "BBB"]
+    assert cache.get_frame("prices", {"k": 2}) is None
+
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.writes) == (2, 2, 2)
+    assert not [p for p in tmp_path.iterdir() if p.name.startswith(".")]
+
+
+def test_lru_eviction_respects_size_cap(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path, max_bytes=0)
+    for k in range(3):
+        cache.put_frame("prices", {"k": k}, _panel(200))
+    # Touch entry 0 so entry 1 becomes the least recently used.
+    assert cache.get_frame("prices", {"k": 0}) is not None
+
+    sizes = {e.name: e.bytes for e in cache.entries()}
+    budget = sum(sizes.values()) - 1
+    removed = cache.prune(budget)
+
+    assert [e.name for e in removed] == [cache.entry_path("prices", {"k": 1}).name]
+    assert cache.get_frame("prices", {"k": 1}) is None
+    assert cache.get_frame("prices", {"k": 0}) is not None
+    assert cache.clear() == 2
+    assert cache.entries() == []
+
+
+def test_prefix_filter_with_legacy_entries(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path, max_bytes=0)
+    cache.put_frame("prices_closeadj", {"k": 1}, _panel(5))
+    (tmp_path / "universe_0123abcd.pkl").write_bytes(b"legacy")
+    cache.put_frame("feature", {"k": 1}, _panel(5))
+    cache.put_frame("prices_volume", {"k": 1}, _panel(5))
+
+    # Listing everything is not narrowed by the legacy file's prefix, whatever the dir order.
+    assert sorted(e.prefix for e in cache.entries()) == [
+        "feature",
+        "prices_closeadj",
+        "prices_volume",
+        "universe",
+    ]
+    assert [e.prefix for e in cache.entries("prices_closeadj")] == ["prices_closeadj"]
+    assert [e.kind for e in cache.entries("universe")] == ["legacy"]
+    assert cache.clear("prices_volume") == 1
+    assert sorted(e.prefix for e in cache.entries()) == ["feature", "prices_closeadj", "universe"]
+
+
+def test_entry_larger_than_the_cap_is_not_kept(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path, max_bytes=0)
+    cache.put_frame("prices", {"k": 0}, _panel(20))
+    cache.max_bytes = 2000
+    cache.put_frame("prices", {"k": 1}, _panel(500))  # ~8 KB of values alone
+
+    assert cache.entries() == []
+    assert cache.stats.evictions == 2
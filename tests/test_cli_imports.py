@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+
+HEAVY = ["numpy", "pandas", "pypdf", "yaml"]
+
+
+def _run(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_us(stderr: str, module: str) -> int:
+    """
+    Cumulative import time of `module` from `python -X importtime` output.
+    """
+    pattern = re.compile(rf"^import time:\s+\d+ \|\s+(\d+) \|\s*{re.escape(module)}$", re.M)
+    match = pattern.search(stderr)
+    assert match is not None, f"{module} not in importtime output"
+    return int(match.group(1))
+
+
+def test_cli_import_does_not_load_heavy_dependencies() -> None:
+    code = (
+        "import sys, paper_strategy_lab.cli; "
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    assert _run(code).stdout.strip() == ""
+
+
+def test_light_commands_do_not_load_pandas() -> None:
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from paper_strategy_lab.cli import app\n"
+        "from paper_strategy_lab.config import project_root\n"
+        "spec = str(project_root() / 'strategies' / 'examples.yaml')\n"
+        "for args in (['--help'], ['backtest', '--help'], ['list-strategies', spec]):\n"
+        "    assert CliRunner().invoke(app, args).exit_code == 0, args\n"
+        "print('pandas' in sys.modules, 'numpy' in sys.modules)\n"
+    )
+    assert _run(code).stdout.strip() == "False False"
+
+
+def test_cli_import_time_budget() -> None:
+    # Relative to pandas on the same machine, so the budget holds on slow CI runners too.
+    cli = _cumulative_us(_run("import paper_strategy_lab.cli").stderr, "paper_strategy_lab.cli")
+    pandas = _cumulative_us(_run("import pandas").stderr, "pandas")
+    assert cli < 0.5 * pandas, (cli, pandas)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from paper_strategy_lab.cache import ResultCache
+from paper_strategy_lab.feature_store import FeatureStore
+from paper_strategy_lab.market_data import MarketData
+from paper_strategy_lab.strategies.builtins import equity_residual_momentum
+
+
+def _prices(n: int = 400, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range("2019-01-01", periods=n)
+    return pd.DataFrame(
+        100.0 * np.cumprod(1.0 + rng.normal(0.0003, 0.01, size=(n, 4)), axis=0),
+        index=idx,
+        columns=["AAA", "BBB", "CCC", "SPY"],
+    )
+
+
+def test_panels_are_reused_and_extended_with_new_dates(tmp_path: Path) -> None:
+    store = FeatureStore(ResultCache(tmp_path))
+    px = _prices()
+    calls: list[int] = []
+
+    def vol(inputs: dict[str, pd.DataFrame]) -> pd.DataFrame:
+        calls.append(len(inputs["prices"]))
+        return pd.DataFrame(inputs["prices"].pct_change(fill_method=None).rolling(20).std())
+
+    expected = vol({"prices": px})
+    calls.clear()
+
+    head = store.panel("vol", {"window": 20}, {"prices": px.iloc[:300]}, vol, warmup=21)
+    pd.testing.assert_frame_equal(head, expected.iloc[:300], check_freq=False)
+    again = store.panel("vol", {"window": 20}, {"prices": px.iloc[:300]}, vol, warmup=21)
+    pd.testing.assert_frame_equal(again, head)
+    assert calls == [300]
+
+    # 100 new dates: only the tail (plus warm-up rows) is computed, and the entry is replaced.
+    full = store.panel("vol", {"window": 20}, {"prices": px}, vol, warmup=21)
+    assert calls == [300, 121]
+    pd.testing.assert_frame_equal(full, expected, check_freq=False)
+    assert len(store.cache.entries("feature")) == 1
+
+    # Restated history is a miss; other params are separate entries.
+    restated = px.copy()
+    restated.iloc[10, 0] *= 1.5
+    store.panel("vol", {"window": 20}, {"prices": restated}, vol, warmup=21)
+    assert calls[-1] == 400
+    store.panel("vol", {"window": 30}, {"prices": px}, vol, warmup=31)
+    assert calls[-1] == 400
+
+
+def test_shorter_windows_slice_the_stored_panel(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = FeatureStore(ResultCache(tmp_path, max_bytes=0))  # no pruning scans
+    px = _prices()
+    calls: list[int] = []
+
+    def vol(inputs: dict[str, pd.DataFrame]) -> pd.DataFrame:
+        calls.append(len(inputs["prices"]))
+        return pd.DataFrame(inputs["prices"].pct_change(fill_method=None).rolling(20).std())
+
+    expected = vol({"prices": px})
+    calls.clear()
+    store.panel("vol", {"window": 20}, {"prices": px}, vol, warmup=21)
+    # Lookups address the entry directly instead of listing the cache.
+    monkeypatch.setattr(store.cache, "entries", lambda prefix=None: pytest.fail("scanned"))
+
+    # 252 rows = 4 checkpoints: a pure slice. 300 rows: only the rows after row 252 (plus
+    # warm-up) are computed. Neither replaces the longer entry.
+    for rows, computed in ((252, []), (300, [300 - 252 + 21]), (400, [])):
+        calls.clear()
+        got = store.panel("vol", {"window": 20}, {"prices": px.iloc[:rows]}, vol, warmup=21)
+        pd.testing.assert_frame_equal(got, expected.iloc[:rows], check_freq=False)
+        assert calls == computed
+
+    # Restated row 250: recomputed from the last checkpoint before it (row 189).
+    restated = px.copy()
+    restated.iloc[250, 0] *= 1.5
+    calls.clear()
+    got = store.panel("vol", {"window": 20}, {"prices": restated}, vol, warmup=21)
+    assert calls == [400 - 189 + 21]
+    pd.testing.assert_frame_equal(got, vol({"prices": restated}), check_freq=False)
+
+
+def test_strategies_match_with_and_without_store(tmp_path: Path) -> None:
+    px = _prices(600)
+    spy = px[["SPY"]]
+    data = MarketData(prices=px[["AAA", "BBB", "CCC"]], features={"benchmark_spy": spy})
+    expected = equity_residual_momentum(data, lookback_days=60, beta_window_days=60, top_n=2)
+
+    store = FeatureStore(ResultCache(tmp_path))
+    for _ in range(2):
+        stored = MarketData(prices=data.prices, features=data.features, store=store)
+        got = equity_residual_momentum(stored, lookback_days=60, beta_window_days=60, top_n=2)
+        pd.testing.assert_frame_equal(got, expected)
+        pd.testing.assert_frame_equal(stored.rolling_vol(20), data.rolling_vol(20))
+    assert {e.info["feature"] for e in store.cache.entries("feature")} == {
+        "residual_momentum",
+        "rolling_vol",
+    }
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from paper_strategy_lab.backtest.benchmarks import BenchmarkCache, get_benchmark
+from paper_strategy_lab.backtest.leaderboard import (
+    BENCHMARK_PANEL,
+    LeaderboardConfig,
+    LeaderboardJob,
+    evaluate_job,
+    run_leaderboard,
+)
+from paper_strategy_lab.shared_panels import SharedPanels, attach_panels
+from paper_strategy_lab.strategies.spec import StrategySpec
+
+
+def _spec(spec_id: str, kind: str, **params: object) -> StrategySpec:
+    return StrategySpec(
+        id=spec_id,
+        name=spec_id,
+        description=None,
+        paper_section=None,
+        paper_title=None,
+        kind=kind,
+        universe=["AAA", "BBB", "CCC"],
+        universe_type=None,
+        universe_config={},
+        params=dict(params),
+    )
+
+
+def test_shared_panels_round_trip() -> None:
+    idx = pd.bdate_range("2020-01-01", periods=5)
+    px = pd.DataFrame(np.arange(10.0).reshape(5, 2), index=idx, columns=["AAA", "BBB"])
+    mask = px > 4.0
+    empty = pd.DataFrame(index=idx)
+
+    with SharedPanels({"px": px, "mask": mask, "empty": empty}) as shared:
+        attached = attach_panels(shared.handles)
+        pd.testing.assert_frame_equal(attached["px"], px)
+        pd.testing.assert_frame_equal(attached["mask"], mask)
+        assert attached["empty"].shape == (5, 0)
+        assert not attached["px"].to_numpy().flags.writeable
+
+
+def test_parallel_leaderboard_matches_serial() -> None:
+    rng = np.random.default_rng(0)
+    idx = pd.bdate_range("2018-01-01", periods=600)
+    px = pd.DataFrame(
+        100.0 * np.cumprod(1.0 + rng.normal(0.0003, 0.01, size=(len(idx), 3)), axis=0),
+        index=idx,
+        columns=["AAA", "BBB", "CCC"],
+    )
+    panels = {"px": px, BENCHMARK_PANEL: px[["AAA"]].rename(columns={"AAA": "SPY"})}
+    jobs = [
+        LeaderboardJob(spec=_spec("bh", "buy_and_hold"), universe_label="x", prices="px"),
+        LeaderboardJob(
+            spec=_spec("sma", "sma_crossover", fast=20, slow=100), universe_label="x", prices="px"
+        ),
+        LeaderboardJob(
+            spec=_spec("tsm", "time_series_momentum", lookback_days=126),
+            universe_label="x",
+            prices="px",
+        ),
+    ]
+    config = LeaderboardConfig(start="2018-01-01", end=None, years=5, fee_bps=5.0)
+
+    serial = run_leaderboard(jobs, panels, config, workers=1)
+    parallel = run_leaderboard(jobs, panels, config, workers=2)
+
+    assert [r["id"] for r in serial] == ["bh", "sma", "tsm"]
+    pd.testing.assert_frame_equal(pd.DataFrame(parallel), pd.DataFrame(serial))
+
+
+def test_benchmark_results_are_memoized_per_window() -> None:
+    rng = np.random.default_rng(1)
+    idx = pd.bdate_range("2018-01-01", periods=400)
+    px = pd.DataFrame(
+        100.0 * np.cumprod(1.0 + rng.normal(0.0003, 0.01, size=(len(idx), 3)), axis=0),
+        index=idx,
+        columns=["AAA", "SPY", "AGG"],
+    )
+    panels = {"px": px[["AAA"]], BENCHMARK_PANEL: px[["SPY"]], "bench:AGG": px[["AGG"]]}
+    agg = get_benchmark("bh-agg")
+    jobs = [
+        LeaderboardJob(spec=_spec("bh", "buy_and_hold"), universe_label="x", prices="px"),
+        LeaderboardJob(
+            spec=_spec("sma", "sma_crossover", fast=20, slow=100), universe_label="x", prices="px"
+        ),
+        LeaderboardJob(
+            spec=_spec("bh-agg", "buy_and_hold"), universe_label="x", prices="px", benchmark=agg
+        ),
+    ]
+    config = LeaderboardConfig(start="2018-01-01", end=None, years=5, fee_bps=5.0)
+
+    cache = BenchmarkCache()
+    rows = [evaluate_job(job, panels, config, benchmarks=cache) for job in jobs]
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert [r["bench_id"] for r in rows if r] == ["bh-spy", "bh-spy", "bh-agg"]
+    # Memoized benchmark metrics equal a fresh computation, and buy & hold of the benchmark's
+    # own ticker reproduces them.
+    assert rows[0] == evaluate_job(jobs[0], panels, config)
+    spy_job = LeaderboardJob(
+        spec=_spec("spy", "buy_and_hold"), universe_label="x", prices=BENCHMARK_PANEL
+    )
+    spy_bh = evaluate_job(spy_job, panels, config, benchmarks=cache)
+    assert spy_bh is not None and rows[0] is not None
+    assert spy_bh["sharpe"] == pytest.approx(rows[0]["bench_sharpe"])
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from paper_strategy_lab.backtest.live import LiveStrategy
+from paper_strategy_lab.backtest.metrics import (
+    annualized_return,
+    annualized_volatility,
+    calmar_ratio,
+    max_drawdown,
+    sharpe_ratio,
+    sortino_ratio,
+)
+from paper_strategy_lab.backtest.portfolio import run_portfolio_backtest
+from paper_strategy_lab.market_data import MarketData
+from paper_strategy_lab.strategies.runner import resolve_strategy_callable
+
+
+def _prices() -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    idx = pd.bdate_range("2019-01-01", periods=400)
+    px = pd.DataFrame(
+        100.0 * np.cumprod(1.0 + rng.normal(0.0003, 0.012, size=(len(idx), 4)), axis=0),
+        index=idx,
+        columns=["AAA", "BBB", "CCC", "DDD"],
+    )
+    px.iloc[:60, 1] = np.nan
+    px.iloc[200:205, 2] = np.nan
+    return px
+
+
+@pytest.mark.parametrize(
+    ("kind", "params"),
+    [
+        ("buy_and_hold", {}),
+        ("sma_crossover", {"fast": 10, "slow": 50}),
+        ("single_moving_average", {"window": 30}),
+        ("three_moving_averages", {"fast": 5, "mid": 20, "slow": 60}),
+        ("time_series_momentum", {"lookback_days": 40}),
+    ],
+)
+def test_live_updates_match_full_history(
+    tmp_path: Path, kind: str, params: dict[str, object]
+) -> None:
+    px = _prices()
+    weights = resolve_strategy_callable(kind)(MarketData(prices=px), **params)
+    bt = run_portfolio_backtest(px, weights, fee_bps=5.0)
+
+    # Warm up on the first part, persist, then resume from the state file.
+    live = LiveStrategy(kind, params, list(px.columns), fee_bps=5.0)
+    bars = live.run(px.iloc[:250])
+    live.save(tmp_path / "state.npz")
+    live = LiveStrategy.load(tmp_path / "state.npz")
+    bars += live.run(px.iloc[250:])
+
+    np.testing.assert_allclose([b.weights.to_numpy() for b in bars], weights, atol=1e-12)
+    np.testing.assert_allclose([b.daily_return for b in bars], bt.daily_returns, atol=1e-12)
+    np.testing.assert_allclose([b.equity for b in bars], bt.equity_curve, rtol=1e-12)
+
+    m, r = live.metrics, bt.daily_returns
+    got = [
+        m.annualized_return(),
+        m.annualized_volatility(),
+        m.sharpe_ratio(),
+        m.sortino_ratio(),
+        m.calmar_ratio(),
+        m.max_drawdown(),
+    ]
+    want = [
+        annualized_return(r),
+        annualized_volatility(r),
+        sharpe_ratio(r),
+        sortino_ratio(r),
+        calmar_ratio(r),
+        max_drawdown(bt.equity_curve),
+    ]
+    np.testing.assert_allclose(got, want, rtol=1e-9, atol=1e-12)
+
+    with pytest.raises(ValueError):
+        live.update(px.index[-1], px.iloc[-1])
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from paper_strategy_lab.backtest.metrics import (
     annualized_return,
     annualized_volatility,
     calmar_ratio,
+    compute_all_metrics,
     max_drawdown,
     sharpe_ratio,
     sortino_ratio,
@@ -40,3 +43,28 @@ def test_calmar_zero_when_no_drawdown() -> None:
     # With strictly positive constant returns, max drawdown is 0 (monotone equity),
     # so Calmar is defined as 0 in our implementation.
     assert calmar_ratio(r) == 0.0
+
+
+def test_compute_all_metrics_matches_per_series_functions() -> None:
+    rng = np.random.default_rng(0)
+    r = rng.normal(0.0004, 0.01, size=(500, 4))
+    r[:50, 1] = np.nan
+    r[:, 2] = np.abs(r[:, 2])  # no downside, no drawdown
+    r[:499, 3] = np.nan  # single observation
+
+    got = compute_all_metrics(r)
+    for j in range(r.shape[1]):
+        s = pd.Series(r[:, j])
+        want = {
+            "sharpe": sharpe_ratio(s),
+            "sortino": sortino_ratio(s),
+            "calmar": calmar_ratio(s),
+            "cagr": annualized_return(s),
+            "vol": annualized_volatility(s),
+            "maxdd": max_drawdown((1.0 + s).cumprod()),
+        }
+        for name, value in want.items():
+            assert got[name][j] == pytest.approx(value, rel=1e-9, abs=1e-12), (name, j)
+
+    empty = compute_all_metrics(np.empty((0, 2)), turnover=np.empty((0, 2)))
+    assert all((v == 0.0).all() for v in empty.values())
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from paper_strategy_lab import pdf_text
+from paper_strategy_lab.pdf_text import PageTextCache, extract_pages, iter_pages
+
+
+def _write_pdf(path: Path, lines: list[str]) -> Path:
+    """
+    Minimal PDF with one page per line of text (Helvetica, no compression).
+    """
+    n = len(lines)
+    font = 3 + 2 * n
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(f"{3 + 2 * i} 0 R".encode() for i in range(n))
+        + f"] /Count {n} >>".encode(),
+    ]
+    for i, line in enumerate(lines):
+        stream = f"BT /F1 12 Tf 72 720 Td ({line}) Tj ET".encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font} 0 R >> >> >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    path.write_bytes(bytes(out))
+    return path
+
+
+@pytest.fixture
+def pdf(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("PAPER_STRATEGY_LAB_CACHE_DIR", str(tmp_path / "cache"))
+    return _write_pdf(tmp_path / "paper.pdf", [f"Strategy: rule {i}" for i in range(7)])
+
+
+def test_parallel_extraction_matches_serial_in_page_order(pdf: Path) -> None:
+    serial = extract_pages(pdf, cache=False)
+    assert [p.text.strip() for p in serial] == [f"Strategy: rule {i}" for i in range(7)]
+    parallel = list(iter_pages(pdf, workers=3, cache=False, chunk_pages=2))
+    assert parallel == serial
+
+
+def test_page_cache_reuses_pages_and_fills_gaps(pdf: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    original = pdf_text._extract_range
+    first = extract_pages(pdf)
+    cache = PageTextCache(pdf)
+    assert cache.page_count() == 7
+    assert cache.get(3) == first[3].text
+
+    # Fully cached: the PDF is never parsed.
+    def fail(*args: object) -> list[str]:
+        raise AssertionError("page re-extracted")
+
+    monkeypatch.setattr(pdf_text, "_extract_range", fail)
+    assert extract_pages(pdf) == first
+
+    # Only the missing page is extracted again.
+    cache.path.joinpath("p00004.txt").unlink()
+    extracted: list[tuple[int, int]] = []
+
+    def spy(path: str, mtime_ns: int, lo: int, hi: int) -> list[str]:
+        extracted.append((lo, hi))
+        return original(path, mtime_ns, lo, hi)
+
+    monkeypatch.setattr(pdf_text, "_extract_range", spy)
+    assert extract_pages(pdf) == first
+    assert extracted == [(4, 5)]
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pytest
 
-from paper_strategy_lab.backtest.portfolio import run_portfolio_backtest
+from paper_strategy_lab.backtest import portfolio
+from paper_strategy_lab.backtest.portfolio import (
+    run_portfolio_backtest,
+    run_portfolio_backtest_streaming,
+)
 
 
 def test_backtest_single_asset_buy_and_hold_matches_returns() -> None:
@@ -19,3 +25,70 @@ def test_backtest_single_asset_buy_and_hold_matches_returns() -> None:
 
     # With 1-day lag, the first executed rebalance happens on day 2 (0 -> 1).
     assert float(bt.turnover.sum()) == 1.0
+
+
+def _reference_backtest(
+    prices: pd.DataFrame, weights: pd.DataFrame, *, cost_rate: float, lag_days: int
+) -> tuple[pd.Series, pd.Series]:
+    rets = prices.pct_change(fill_method=None).replace([np.inf, -np.inf], np.nan).fillna(0.0)
+    w_exec = weights.reindex(prices.index).fillna(0.0).shift(lag_days).fillna(0.0)
+    turnover = w_exec.diff().abs().sum(axis=1).fillna(0.0)
+    return (w_exec * rets).sum(axis=1) - turnover * cost_rate, turnover
+
+
+def test_blocked_backtest_matches_pandas_reference(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(0)
+    idx = pd.bdate_range("2020-01-01", periods=300)
+    prices = pd.DataFrame(
+        100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, size=(len(idx), 7)), axis=0),
+        index=idx,
+        columns=list("ABCDEFG"),
+    )
+    prices.iloc[:40, 2] = np.nan
+    prices.iloc[120, 4] = 0.0
+    weights = pd.DataFrame(rng.random((len(idx), 7)) / 7, index=idx, columns=prices.columns)
+    weights.iloc[::5] = np.nan
+
+    # Small blocks so the row-block boundaries are exercised.
+    monkeypatch.setattr(portfolio, "_BLOCK_CELLS", 50)
+    for lag_days in (0, 1, 3):
+        bt = run_portfolio_backtest(
+            prices, weights, fee_bps=3.0, slippage_bps=2.0, lag_days=lag_days
+        )
+        want_rets, want_turnover = _reference_backtest(
+            prices, weights, cost_rate=5e-4, lag_days=lag_days
+        )
+        np.testing.assert_allclose(bt.daily_returns, want_rets, atol=1e-14)
+        np.testing.assert_allclose(bt.turnover, want_turnover, atol=1e-14)
+
+    # float32 panels give the same result to float32 precision.
+    compact = run_portfolio_backtest(prices.astype("float32"), weights.astype("float32"))
+    full = run_portfolio_backtest(prices, weights)
+    np.testing.assert_allclose(compact.equity_curve, full.equity_curve, rtol=1e-5)
+
+
+def test_streaming_backtest_matches_in_memory() -> None:
+    rng = np.random.default_rng(1)
+    idx = pd.bdate_range("2020-01-01", periods=250)
+    prices = pd.DataFrame(
+        100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, size=(len(idx), 5)), axis=0),
+        index=idx,
+        columns=list("ABCDE"),
+    )
+    prices.iloc[:30, 1] = np.nan
+    weights = pd.DataFrame(rng.random((len(idx), 5)) / 5, index=idx, columns=prices.columns)
+
+    cuts = [0, 1, 2, 40, 41, 170, len(idx)]
+    for lag_days in (0, 1, 3):
+        full = run_portfolio_backtest(prices, weights, fee_bps=4.0, lag_days=lag_days)
+        blocks = (
+            (prices.iloc[a:b], weights.iloc[a:b, ::-1])
+            for a, b in zip(cuts, cuts[1:], strict=False)
+        )
+        streamed = run_portfolio_backtest_streaming(blocks, fee_bps=4.0, lag_days=lag_days)
+        pd.testing.assert_series_equal(streamed.equity_curve, full.equity_curve)
+        pd.testing.assert_series_equal(streamed.daily_returns, full.daily_returns)
+        pd.testing.assert_series_equal(streamed.turnover, full.turnover)
+
+    with pytest.raises(ValueError):
+        run_portfolio_backtest_streaming([(prices, weights), (prices.iloc[-5:], weights)])
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from paper_strategy_lab.data_sources.sharadar import load_equity_prices
+from paper_strategy_lab.profiling import Profiler, add_count, profiling_enabled, span
+from paper_strategy_lab.synthetic import SyntheticSpec, write_synthetic_sharadar
+
+
+def test_spans_are_noops_without_profiler() -> None:
+    assert not profiling_enabled()
+    with span("outer"):
+        add_count("rows", 5)
+
+
+def test_profiler_aggregates_stages_and_exports_chrome_trace(tmp_path: Path) -> None:
+    with Profiler() as prof:
+        for _ in range(3):
+            with span("outer", kind="x"):
+                add_count("rows", 10)
+                with span("inner"):
+                    add_count("cache_hits")
+    assert not profiling_enabled()
+
+    stages = {s.name: s for s in prof.stages()}
+    assert [s.name for s in prof.stages()] == ["outer", "inner"]
+    assert stages["outer"].calls == 3
+    assert stages["outer"].counts == {"rows": 30}
+    assert stages["inner"].counts == {"cache_hits": 3}
+    assert stages["outer"].seconds >= stages["inner"].seconds
+
+    path = tmp_path / "trace.json"
+    prof.write_trace(path)
+    trace = json.loads(path.read_text())
+    events = trace["traceEvents"]
+    assert len(events) == 6
+    assert {e["ph"] for e in events} == {"X"}
+    outer = next(e for e in events if e["name"] == "outer")
+    assert outer["args"] == {"kind": "x", "rows": 10}
+    assert outer["ts"] >= 0 and outer["dur"] >= 0
+
+
+def test_loader_spans_count_scanned_rows_and_cache_hits(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data = write_synthetic_sharadar(
+        tmp_path / "data", SyntheticSpec(n_equities=5, start="2020-01-01", end="2020-03-31")
+    )
+    monkeypatch.setenv("SHARADAR_DIR", str(data))
+    monkeypatch.setenv("SHARADAR_STORE_DIR", str(tmp_path / "store"))
+    monkeypatch.setenv("PAPER_STRATEGY_LAB_CACHE_DIR", str(tmp_path / "cache"))
+
+    with Profiler() as prof:
+        load_equity_prices(["E00000", "E00001"])
+        load_equity_prices(["E00000"])
+    stages = {s.name: s for s in prof.stages()}
+    assert stages["sharadar.load_fields"].calls == 2
+    assert stages["sharadar.load_fields"].counts == {"cache_hits": 1, "cache_misses": 1}
+    assert stages["sharadar.scan_csv"].calls == 1
+    assert stages["sharadar.scan_csv"].counts["rows"] > 0
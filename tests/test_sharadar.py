@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from paper_strategy_lab.data_sources import sharadar
+
+
+def test_multi_field_load_scans_csv_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    csv_path = tmp_path / "SHARADAR_DAILY_2020.csv"
+    pd.DataFrame(
+        {
+            "ticker": ["AAA", "AAA", "BBB", "CCC"],
+            "date": ["2020-01-02", "2020-01-03", "2020-01-02", "2020-01-02"],
+            "pe": [10.0, 11.0, None, 5.0],
+            "pb": [1.0, 1.1, 2.0, 0.5],
+            "marketcap": [100.0, 101.0, 200.0, 50.0],
+        }
+    ).to_csv(csv_path, index=False)
+
+    monkeypatch.setenv("PAPER_STRATEGY_LAB_CACHE_DIR", str(tmp_path / "cache"))
+    scans = 0
+    read_csv = pd.read_csv
+
+    def counting_read_csv(*args: object, **kwargs: object) -> object:
+        nonlocal scans
+        scans += 1
+        return read_csv(*args, **kwargs)  # type: ignore[call-overload]
+
+    monkeypatch.setattr(pd, "read_csv", counting_read_csv)
+
+    def load() -> dict[str, pd.DataFrame]:
+        return sharadar._load_fields_from_file(
+            csv_path,
+            ["aaa", "BBB"],
+            start=None,
+            end=None,
+            fields=["pe", "pb", "marketcap"],
+            cache_prefix="daily_{field}",
+        )
+
+    out = load()
+    assert scans == 1
+    # The second load is served entirely from the result cache.
+    cached = load()
+    assert scans == 1
+    for field in out:
+        pd.testing.assert_frame_equal(cached[field], out[field])
+    assert list(out) == ["pe", "pb", "marketcap"]
+    assert list(out["pe"].columns) == ["AAA"]
+    assert list(out["pb"].columns) == ["AAA", "BBB"]
+    assert float(out["marketcap"].loc["2020-01-03", "AAA"]) == 101.0
+
+
+def test_cached_superset_serves_subsets_and_extends(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = tmp_path / "SHARADAR_SEP_2020.csv"
+    dates = [str(d.date()) for d in pd.bdate_range("2020-01-01", periods=6)]
+    rows = [
+        {"ticker": t, "date": d, "closeadj": float(i + 10 * j)}
+        for j, t in enumerate(["AAA", "BBB", "CCC", "DDD"])
+        for i, d in enumerate(dates)
+        if not (t == "CCC" and i < 3)
+    ]
+    pd.DataFrame(rows).to_csv(csv_path, index=False)
+
+    scans = 0
+    read_csv = pd.read_csv
+
+    def counting_read_csv(*args: object, **kwargs: object) -> object:
+        nonlocal scans
+        scans += 1
+        return read_csv(*args, **kwargs)  # type: ignore[call-overload]
+
+    monkeypatch.setattr(pd, "read_csv", counting_read_csv)
+
+    def load(cache_dir: str, tickers: list[str], start: str | None = None) -> pd.DataFrame:
+        monkeypatch.setenv("PAPER_STRATEGY_LAB_CACHE_DIR", str(tmp_path / cache_dir))
+        return sharadar._load_prices_from_file(
+            csv_path, tickers, start=start, end=None, field="closeadj"
+        )
+
+    load("cache", ["AAA", "BBB", "CCC"])
+    assert scans == 1
+
+    # Subset of tickers over a narrower window: sliced from the cached superset.
+    sliced = load("cache", ["BBB", "CCC"], start=dates[4])
+    assert scans == 1
+    pd.testing.assert_frame_equal(sliced, load("fresh-1", ["BBB", "CCC"], start=dates[4]))
+    assert list(sliced.columns) == ["BBB", "CCC"]
+
+    # A new ticker is read on its own and merged into the cached panel.
+    scans = 0
+    extended = load("cache", ["AAA", "DDD"], start=dates[1])
+    assert scans == 1
+    pd.testing.assert_frame_equal(extended, load("fresh-2", ["AAA", "DDD"], start=dates[1]))
+    monkeypatch.setenv("PAPER_STRATEGY_LAB_CACHE_DIR", str(tmp_path / "cache"))
+    [entry] = sharadar.result_cache().entries()
+    assert entry.info["tickers"] == ["AAA", "BBB", "CCC", "DDD"]
+
+
+def test_code_pivot_matches_pivot_table() -> None:
+    rows = pd.DataFrame(
+        {
+            "ticker": ["BBB", "AAA", "AAA", "CCC", "AAA", "BBB"],
+            "date": pd.to_datetime(
+                ["2020-01-03", "2020-01-02", "2020-01-03", "2020-01-02", "2020-01-03", "2020-01-02"]
+            ),
+            "closeadj": [2.0, 1.0, 1.5, None, 1.75, 2.5],
+        }
+    )
+    expected = rows.dropna(subset=["closeadj"]).pivot_table(
+        index="date", columns="ticker", values="closeadj", aggfunc="last"
+    )
+    expected.columns.name = None
+
+    pd.testing.assert_frame_equal(sharadar._pivot_field(rows, "closeadj"), expected)
+    compact = sharadar._pivot_field(rows, "closeadj", "float32")
+    assert (compact.dtypes == "float32").all()
+    pd.testing.assert_frame_equal(compact.astype("float64"), expected)
+
+
+def _write_prices(path: Path, tickers: list[str], periods: int, scale: float = 1.0) -> None:
+    dates = [str(d.date()) for d in pd.bdate_range("2020-01-01", periods=periods)]
+    pd.DataFrame(
+        [
+            {"ticker": t, "date": d, "closeadj": scale * (i + 100 * j), "volume": 1000 + i}
+            for i, d in enumerate(dates)
+            for j, t in enumerate(tickers)
+        ]
+    ).to_csv(path, index=False)
+
+
+def test_byte_ranges_split_on_line_boundaries(tmp_path: Path) -> None:
+    csv_path = tmp_path / "SHARADAR_SEP_2020.csv"
+    _write_prices(csv_path, ["AAA", "BBB", "CCC"], 40)
+    data = csv_path.read_bytes()
+    ranges = sharadar._byte_ranges(csv_path, 7)
+
+    assert ranges[0][0] == data.index(b"\n") + 1 and ranges[-1][1] == len(data)
+    assert all(hi == lo for (_, hi), (lo, _) in zip(ranges, ranges[1:], strict=False))
+    assert all(data[hi - 1 : hi] == b"\n" for _, hi in ranges)
+
+
+def test_parallel_range_scan_matches_serial(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = tmp_path / "SHARADAR_SEP_2020.csv"
+    _write_prices(csv_path, ["AAA", "bbb", "CCC", "DDD"], 60)
+    # A restated row at the end of the file must still win after the ranges are merged.
+    with csv_path.open("a") as f:
+        f.write("AAA,2020-02-03,-1.0,0\n")
+
+    def scan(workers: str) -> pd.DataFrame:
+        monkeypatch.setenv("PAPER_STRATEGY_LAB_SCAN_WORKERS", workers)
+        return sharadar._scan_csv(
+            csv_path,
+            ["ticker", "date", "closeadj"],
+            {"AAA", "BBB"},
+            scan_lo="2020-01-15",
+            scan_hi="",
+        )
+
+    serial = scan("1")
+    monkeypatch.setattr(sharadar, "_RANGE_BYTES", 500)
+    assert sharadar._range_count(csv_path) > 4
+    parallel = scan("2")
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert set(serial["ticker"]) == {"AAA", "BBB"}
+    assert serial["date"].min() == pd.Timestamp("2020-01-15")
+    assert float(serial["closeadj"].iloc[-1]) == -1.0
+
+
+def test_price_fields_combine_sep_over_sfp(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    root = tmp_path / "sharadar"
+    root.mkdir()
+    _write_prices(root / "SHARADAR_SEP_2020.csv", ["AAA", "SPY"], 10)
+    _write_prices(root / "SHARADAR_SFP_2020.csv", ["SPY", "TLT"], 12, scale=2.0)
+    for table in ("DAILY", "TICKERS"):
+        (root / f"SHARADAR_{table}_2020.csv").write_text("ticker\n")
+    monkeypatch.setenv("PAPER_STRATEGY_LAB_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("SHARADAR_STORE_DIR", str(tmp_path / "store"))
+
+    out = sharadar.load_price_fields(
+        ["AAA", "SPY", "TLT"], fields=["closeadj", "volume"], sharadar_dir=root
+    )
+    px = out["closeadj"]
+    assert list(px.columns) == ["AAA", "SPY", "TLT"] and len(px) == 12
+    # SEP wins where both files have SPY; SFP fills the dates SEP lacks.
+    assert float(px["SPY"].iloc[3]) == 103.0
+    assert float(px["SPY"].iloc[11]) == 2.0 * 11
+    assert float(out["volume"]["TLT"].iloc[0]) == 1000.0
+
+
+def test_cached_panels_are_keyed_by_field(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    csv_path = tmp_path / "SHARADAR_SEP_2020.csv"
+    _write_prices(csv_path, ["AAA", "BBB"], 5)
+    monkeypatch.setenv("PAPER_STRATEGY_LAB_CACHE_DIR", str(tmp_path / "cache"))
+
+    def load(field: str) -> pd.DataFrame:
+        return sharadar._load_prices_from_file(csv_path, ["AAA"], start=None, end=None, field=field)
+
+    closeadj = load("closeadj")
+    volume = load("volume")  # warm cache: must not be served the closeadj panel
+    assert volume["AAA"].tolist() == [1000.0, 1001.0, 1002.0, 1003.0, 1004.0]
+    assert not closeadj.equals(volume)
+    pd.testing.assert_frame_equal(load("closeadj"), closeadj)
+    assert sorted(e.prefix for e in sharadar.result_cache().entries()) == [
+        "prices_closeadj",
+        "prices_volume",
+    ]
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from paper_strategy_lab.data_sources.sharadar_store import (
+    apply_delta_csv,
+    compact_table,
+    ingest_csv,
+    open_table_for,
+)
+
+
+def _write_sep(path: Path) -> pd.DataFrame:
+    rows = [
+        ("bbb", "2020-01-03", 20.0, 200.0),
+        ("AAA", "2020-01-02", 10.0, 100.0),
+        ("AAA", "2020-01-03", 11.0, np.nan),
+        ("CCC", "2020-01-02", 30.0, 300.0),
+        ("AAA", "2020-01-06", 12.0, 120.0),
+        ("BBB", "2020-01-02", 19.0, 190.0),
+        ("AAA", "2020-01-06", 12.5, 125.0),  # duplicate key: last row wins
+    ]
+    df = pd.DataFrame(rows, columns=["ticker", "date", "closeadj", "volume"])
+    df["lastupdated"] = "2020-01-07"
+    df.to_csv(path, index=False)
+    return df
+
+
+def test_ingest_then_read_matches_csv_pivot(tmp_path: Path) -> None:
+    csv_path = tmp_path / "SHARADAR_SEP_2020.csv"
+    raw = _write_sep(csv_path)
+    store_dir = tmp_path / "store"
+
+    info = ingest_csv(csv_path, store_dir=store_dir, chunksize=3)
+    assert info.table == "SEP"
+    assert info.rows == 6
+    assert info.columns == ["closeadj", "volume"]
+
+    table = open_table_for(csv_path, store_dir=store_dir)
+    assert table is not None
+    got = table.read_wide(["aaa", "BBB", "ZZZ"], ["closeadj", "volume"], start="2020-01-03")
+
+    raw["ticker"] = raw["ticker"].str.upper()
+    raw["date"] = pd.to_datetime(raw["date"])
+    raw = raw[raw["ticker"].isin({"AAA", "BBB"}) & (raw["date"] >= "2020-01-03")]
+    for field in ["closeadj", "volume"]:
+        expected = raw.dropna(subset=[field]).pivot_table(
+            index="date", columns="ticker", values=field, aggfunc="last"
+        )
+        expected.columns.name = None
+        pd.testing.assert_frame_equal(got[field], expected, check_freq=False)
+
+
+def test_stale_store_is_ignored(tmp_path: Path) -> None:
+    csv_path = tmp_path / "SHARADAR_SEP_2020.csv"
+    _write_sep(csv_path)
+    store_dir = tmp_path / "store"
+    ingest_csv(csv_path, store_dir=store_dir)
+
+    with csv_path.open("a", encoding="utf-8") as f:
+        f.write("DDD,2020-01-07,1.0,1.0,2020-01-08\n")
+    assert open_table_for(csv_path, store_dir=store_dir) is None
+
+
+def test_incremental_ingest_appends_only_new_rows(tmp_path: Path) -> None:
+    csv_path = tmp_path / "SHARADAR_SEP_2020.csv"
+    _write_sep(csv_path)
+    store_dir = tmp_path / "store"
+    ingest_csv(csv_path, store_dir=store_dir)
+
+    # Nightly refresh: a new day for AAA/DDD plus a correction of an old BBB row.
+    with csv_path.open("a", encoding="utf-8") as f:
+        f.write("AAA,2020-01-07,13.0,130.0,2020-01-08\n")
+        f.write("DDD,2020-01-07,40.0,400.0,2020-01-08\n")
+        f.write("BBB,2020-01-02,19.5,195.0,2020-01-08\n")
+    info = ingest_csv(csv_path, store_dir=store_dir, incremental=True)
+    assert (info.deltas, info.last_date, info.lastupdated) == (1, "2020-01-07", "2020-01-08")
+    assert info.rows == 6 + 3
+
+    full = ingest_csv(csv_path, store_dir=tmp_path / "full")
+    assert full.rows == 8
+    expected = open_table_for(csv_path, store_dir=tmp_path / "full")
+    assert expected is not None
+    tickers, fields = ["AAA", "BBB", "CCC", "DDD"], ["closeadj", "volume"]
+    want = expected.read_wide(tickers, fields)
+
+    def assert_matches_full_ingest() -> None:
+        table = open_table_for(csv_path, store_dir=store_dir)
+        assert table is not None
+        got = table.read_wide(tickers, fields)
+        for field in fields:
+            pd.testing.assert_frame_equal(got[field], want[field])
+
+    assert_matches_full_ingest()
+    compacted = compact_table("SEP", store_dir=store_dir)
+    assert (compacted.deltas, compacted.rows) == (0, 8)
+    assert_matches_full_ingest()
+
+
+def test_apply_delta_file_upserts_rows(tmp_path: Path) -> None:
+    csv_path = tmp_path / "SHARADAR_SEP_2020.csv"
+    _write_sep(csv_path)
+    store_dir = tmp_path / "store"
+    ingest_csv(csv_path, store_dir=store_dir)
+
+    delta = tmp_path / "SHARADAR_SEP_delta.csv"
+    pd.DataFrame(
+        {
+            "ticker": ["CCC", "EEE"],
+            "date": ["2020-01-02", "2020-01-07"],
+            "closeadj": [31.0, 50.0],
+            "volume": [310.0, 500.0],
+            "lastupdated": ["2020-01-08", "2020-01-08"],
+        }
+    ).to_csv(delta, index=False)
+    info = apply_delta_csv(delta, store_dir=store_dir)
+    assert info.deltas == 1
+
+    # The base CSV is unchanged, so the store (now ahead of it) is still used.
+    table = open_table_for(csv_path, store_dir=store_dir)
+    assert table is not None
+    got = table.read_wide(["CCC", "EEE"], ["closeadj"])["closeadj"]
+    assert float(got.loc["2020-01-02", "CCC"]) == 31.0
+    assert float(got.loc["2020-01-07", "EEE"]) == 50.0
+
+
+def test_iter_wide_blocks_concatenate_to_read_wide(tmp_path: Path) -> None:
+    csv_path = tmp_path / "SHARADAR_SEP_2020.csv"
+    _write_sep(csv_path)
+    store_dir = tmp_path / "store"
+    ingest_csv(csv_path, store_dir=store_dir)
+    table = open_table_for(csv_path, store_dir=store_dir)
+    assert table is not None
+
+    blocks = list(table.iter_wide(["AAA", "BBB", "CCC", "ZZZ"], ["closeadj"], block_days=2))
+    assert len(blocks) == 2  # 2020-01-04/05 has no rows
+    assert all(list(b["closeadj"].columns) == ["AAA", "BBB", "CCC"] for b in blocks)
+    streamed = pd.concat([b["closeadj"] for b in blocks])
+    full = table.read_wide(["AAA", "BBB", "CCC"], ["closeadj"])["closeadj"]
+    pd.testing.assert_frame_equal(streamed, full, check_freq=False)
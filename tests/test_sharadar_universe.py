@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from paper_strategy_lab.data_sources.sharadar import load_equity_price_fields
+from paper_strategy_lab.data_sources.sharadar_store import ingest_csv, open_table_for
+from paper_strategy_lab.universe.sharadar_universe import (
+    _liquidity_stats_sep,
+    _liquidity_stats_store,
+    build_us_equities_liquid_pit,
+    point_in_time_membership,
+)
+
+
+def test_liquidity_stats_csv_and_store_agree(tmp_path: Path) -> None:
+    csv_path = tmp_path / "SHARADAR_SEP_2020.csv"
+    pd.DataFrame(
+        {
+            "ticker": ["AAA", "BBB", "AAA", "BBB", "AAA", "CCC"],
+            "date": [
+                "2020-01-02",
+                "2020-01-02",
+                "2020-01-03",
+                "2020-01-03",
+                "2020-01-06",
+                "2020-01-06",
+            ],
+            "closeadj": [10.0, 4.0, 12.0, np.nan, 11.0, 3.0],
+            "volume": [100.0, 1000.0, np.nan, 1000.0, 200.0, 10.0],
+        }
+    ).to_csv(csv_path, index=False)
+
+    stats = _liquidity_stats_sep(csv_path, {"AAA", "BBB"}, start=None, end="2020-01-06")
+    assert sorted(stats.index) == ["AAA", "BBB"]
+    assert float(stats.loc["AAA", "adv"]) == (10.0 * 100.0 + 11.0 * 200.0) / 2
+    assert float(stats.loc["AAA", "last_price"]) == 11.0
+    assert float(stats.loc["BBB", "adv"]) == 4000.0
+    assert float(stats.loc["BBB", "last_price"]) == 4.0
+
+    ingest_csv(csv_path, store_dir=tmp_path / "store", chunksize=2)
+    store = open_table_for(csv_path, store_dir=tmp_path / "store")
+    assert store is not None
+    from_store = _liquidity_stats_store(store, {"AAA", "BBB"}, start=None, end="2020-01-06")
+    pd.testing.assert_frame_equal(from_store.sort_index(), stats.sort_index())
+
+
+def test_point_in_time_membership_reselects_each_month() -> None:
+    idx = pd.bdate_range("2020-01-01", "2020-03-31")
+    n = len(idx)
+    closeadj = pd.DataFrame(
+        {
+            "AAA": np.full(n, 10.0),
+            "BBB": np.full(n, 10.0),
+            "CCC": np.where(idx < pd.Timestamp("2020-02-15"), 2.0, 10.0),  # penny stock at first
+        },
+        index=idx,
+    )
+    volume = pd.DataFrame(
+        {
+            "AAA": np.where(idx < pd.Timestamp("2020-02-01"), 1_000.0, 10.0),
+            "BBB": np.full(n, 100.0),
+            "CCC": np.full(n, 1_000_000.0),
+        },
+        index=idx,
+    )
+
+    member = point_in_time_membership(
+        closeadj, volume, max_tickers=1, min_price=5.0, liquidity_lookback_days=10
+    )
+
+    assert member.index.equals(idx)
+    assert not member.loc[:"2020-01-30"].to_numpy().any()  # before the first rebalance
+    assert member.loc["2020-01-31"].tolist() == [True, False, False]
+    assert member.loc["2020-02-28"].tolist() == [False, False, True]
+    assert int(member.sum(axis=1).max()) == 1
+
+
+def test_point_in_time_universe_is_the_same_on_a_warm_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "sharadar"
+    root.mkdir()
+    dates = pd.bdate_range("2020-01-01", "2020-04-30")
+    # CCC trades the most dollar volume but is a penny stock: only the price filter drops it,
+    # so serving volume as closeadj (or vice versa) changes membership.
+    bars = {"AAA": (10.0, 3_000.0), "BBB": (15.0, 1_000.0), "CCC": (2.0, 1_000_000.0)}
+    rows = [
+        {"ticker": t, "date": str(d.date()), "closeadj": px, "volume": vol}
+        for d in dates
+        for t, (px, vol) in bars.items()
+    ]
+    pd.DataFrame(rows).to_csv(root / "SHARADAR_SEP_2020.csv", index=False)
+    (root / "SHARADAR_SFP_2020.csv").write_text("ticker,date,closeadj,volume\n")
+    (root / "SHARADAR_DAILY_2020.csv").write_text("ticker\n")
+    pd.DataFrame(
+        {
+            "ticker": ["AAA", "BBB", "CCC"],
+            "currency": "USD",
+            "category": "Domestic Common Stock",
+            "exchange": "NYSE",
+            "isdelisted": "N",
+        }
+    ).to_csv(root / "SHARADAR_TICKERS_2020.csv", index=False)
+    monkeypatch.setenv("PAPER_STRATEGY_LAB_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("SHARADAR_STORE_DIR", str(tmp_path / "store"))
+
+    def build() -> pd.DataFrame:
+        return build_us_equities_liquid_pit(
+            sharadar_dir=root, start="2020-02-01", max_tickers=1, liquidity_lookback_days=10
+        ).membership
+
+    cold = build()
+    assert list(cold.columns) == ["AAA"]
+    assert cold.loc["2020-02-28"].tolist() == [True]
+    # As in a backtest, the strategy's closeadj load touches the cache between universe builds.
+    load_equity_price_fields(
+        ["AAA", "BBB", "CCC"], fields=["closeadj"], start="2020-02-01", sharadar_dir=root
+    )
+    pd.testing.assert_frame_equal(build(), cold)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from paper_strategy_lab.backtest.portfolio import run_portfolio_backtest
+from paper_strategy_lab.backtest.sweep import parse_grid_values, run_param_sweep
+from paper_strategy_lab.market_data import MarketData
+from paper_strategy_lab.strategies.builtins import sma_crossover
+from paper_strategy_lab.strategies.spec import StrategySpec
+
+
+def _spec(kind: str, **params: object) -> StrategySpec:
+    return StrategySpec(
+        id="t",
+        name="t",
+        description=None,
+        paper_section=None,
+        paper_title=None,
+        kind=kind,
+        universe=["AAA", "BBB"],
+        universe_type=None,
+        universe_config={},
+        params=dict(params),
+    )
+
+
+def test_parse_grid_values() -> None:
+    assert parse_grid_values("5,10,20") == [5, 10, 20]
+    assert parse_grid_values("10:30:10") == [10, 20, 30]
+    assert parse_grid_values("0.5:1.0:0.25") == [0.5, 0.75, 1.0]
+    assert parse_grid_values("pe,pb") == ["pe", "pb"]
+
+
+def test_batched_sma_sweep_matches_single_backtests() -> None:
+    rng = np.random.default_rng(0)
+    idx = pd.bdate_range("2020-01-01", periods=400)
+    px = pd.DataFrame(
+        100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, size=(len(idx), 2)), axis=0),
+        index=idx,
+        columns=["AAA", "BBB"],
+    )
+    data = MarketData(prices=px)
+
+    result = run_param_sweep(
+        data, _spec("sma_crossover"), {"fast": [5, 20, 60], "slow": [20, 50]}, fee_bps=5.0
+    )
+
+    # fast >= slow points are rejected by the strategy and skipped.
+    assert result.params == [
+        {"fast": 5, "slow": 20},
+        {"fast": 5, "slow": 50},
+        {"fast": 20, "slow": 50},
+    ]
+    for i, params in enumerate(result.params):
+        w = sma_crossover(MarketData(prices=px), **params)  # type: ignore[arg-type]
+        bt = run_portfolio_backtest(prices=px, weights=w, fee_bps=5.0)
+        np.testing.assert_allclose(result.daily_returns.iloc[:, i], bt.daily_returns, atol=1e-12)
+        np.testing.assert_allclose(result.turnover.iloc[:, i], bt.turnover, atol=1e-12)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from paper_strategy_lab.backtest.metrics import compute_all_metrics
+from paper_strategy_lab.backtest.sweep import run_param_sweep
+from paper_strategy_lab.backtest.walk_forward import (
+    WalkForwardFold,
+    run_walk_forward,
+    walk_forward_folds,
+)
+from paper_strategy_lab.market_data import MarketData
+from paper_strategy_lab.strategies.spec import StrategySpec
+
+
+def _spec(kind: str, **params: object) -> StrategySpec:
+    return StrategySpec(
+        id="t",
+        name="t",
+        description=None,
+        paper_section=None,
+        paper_title=None,
+        kind=kind,
+        universe=["AAA", "BBB", "CCC"],
+        universe_type=None,
+        universe_config={},
+        params=dict(params),
+    )
+
+
+def _data(n: int = 500) -> MarketData:
+    rng = np.random.default_rng(3)
+    idx = pd.bdate_range("2018-01-01", periods=n)
+    px = pd.DataFrame(
+        100.0 * np.cumprod(1.0 + rng.normal(0.0002, 0.012, size=(n, 3)), axis=0),
+        index=idx,
+        columns=["AAA", "BBB", "CCC"],
+    )
+    return MarketData(prices=px)
+
+
+def test_folds_roll_by_the_test_window() -> None:
+    assert walk_forward_folds(10, train_days=4, test_days=3) == [
+        WalkForwardFold(train_start=0, test_start=4, test_end=7),
+        WalkForwardFold(train_start=3, test_start=7, test_end=10),
+    ]
+    assert walk_forward_folds(12, train_days=4, test_days=5)[-1] == WalkForwardFold(
+        train_start=5, test_start=9, test_end=12
+    )
+    assert walk_forward_folds(4, train_days=4, test_days=3) == []
+
+
+def test_walk_forward_stitches_the_train_winners_test_returns() -> None:
+    data = _data()
+    grid = {"entry_days": [10, 20, 40], "exit_days": [5, 10]}
+    result = run_walk_forward(
+        data, _spec("channel_breakout"), grid, train_days=200, test_days=60, metric="sortino"
+    )
+    rets = result.sweep.daily_returns.to_numpy()
+
+    assert len(result.folds) == 5
+    assert result.daily_returns.index.equals(data.prices.index[200:])
+    folds = walk_forward_folds(500, train_days=200, test_days=60)
+    for fold, row in zip(folds, result.folds.itertuples(), strict=True):
+        train = compute_all_metrics(rets[fold.train_start : fold.test_start])["sortino"]
+        best = int(np.argmax(train))
+        assert {k: getattr(row, k) for k in grid} == result.sweep.params[best]
+        assert row.train_sortino == pytest.approx(train.max())
+        np.testing.assert_array_equal(
+            result.daily_returns.iloc[fold.test_start - 200 : fold.test_end - 200],
+            rets[fold.test_start : fold.test_end, best],
+        )
+
+
+def test_parallel_sweep_matches_serial() -> None:
+    data = _data(300)
+    grid = {"entry_days": [10, 20, 40], "exit_days": [5, 10, 20]}
+    serial = run_param_sweep(data, _spec("channel_breakout"), grid, fee_bps=5.0)
+    parallel = run_param_sweep(data, _spec("channel_breakout"), grid, fee_bps=5.0, workers=2)
+
+    assert parallel.params == serial.params
+    pd.testing.assert_frame_equal(parallel.daily_returns, serial.daily_returns)
+    pd.testing.assert_frame_equal(parallel.turnover, serial.turnover)
+    pd.testing.assert_frame_equal(parallel.exposure, serial.exposure)
+
+
+def test_walk_forward_rejects_unknown_metric_and_short_windows() -> None:
+    data = _data(100)
+    spec = _spec("time_series_momentum")
+    with pytest.raises(ValueError, match="metric"):
+        run_walk_forward(
+            data, spec, {"lookback_days": [5]}, train_days=50, test_days=10, metric="x"
+        )
+    with pytest.raises(ValueError, match="train_days"):
+        run_walk_forward(data, spec, {"lookback_days": [5]}, train_days=100, test_days=10)